@@ -0,0 +1,29 @@
+"""Gmail sync endpoint covering all active accounts."""
+
+from __future__ import annotations
+
+from flask import Blueprint, current_app, jsonify, request
+
+from services.gmail_sync_all import sync_all_accounts
+
+account_sync_bp = Blueprint("account_sync", __name__)
+
+
+@account_sync_bp.route("/sync-all", methods=["POST"])
+def sync_all():
+    """Sync every active Gmail account concurrently and report per-account timings."""
+    try:
+        payload = request.get_json(silent=True) or {}
+        try:
+            max_results = int(payload.get("max_results", current_app.config.get("GMAIL_SYNC_MAX_RESULTS", 50)))
+        except (TypeError, ValueError):
+            return jsonify({"data": None, "error": "max_results must be an integer"}), 400
+
+        report = sync_all_accounts(
+            current_app._get_current_object(),
+            max_results=max_results,
+            max_workers=current_app.config.get("GMAIL_SYNC_WORKERS", 4),
+        )
+        return jsonify({"data": report, "error": None})
+    except Exception as e:
+        return jsonify({"data": None, "error": str(e)}), 500
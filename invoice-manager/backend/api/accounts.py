@@ -7,8 +7,10 @@ from urllib.parse import urlencode
 
 from flask import Blueprint, current_app, jsonify, redirect, request
 
+from api.conditional import conditional_get
 from extensions import db
 from models.database import GmailAccount
+from services.gmail_client_cache import gmail_client_cache
 from services.gmail_filters import (
     DEFAULT_GMAIL_QUERY,
     DEFAULT_LABEL_NAME,
@@ -22,8 +24,9 @@ from services.gmail_service import (
     complete_oauth_callback,
     connect_account_local_oauth,
     create_oauth_authorization_url,
-    sync_account_messages,
 )
+from services.gmail_sync import sync_account_messages
+from services.gmail_sync_all import account_sync_lock
 
 accounts_bp = Blueprint("accounts", __name__)
 
@@ -47,6 +50,7 @@ def _get_account_or_404(account_id: int):
 
 
 @accounts_bp.route("", methods=["GET"])
+@conditional_get("gmail_accounts")
 def get_accounts():
     """List all Gmail accounts with invoice filter settings."""
     try:
@@ -97,6 +101,7 @@ def create_account():
         account = GmailAccount.query.filter_by(email=email).first()
         if account:
             account.credentials_json = embed_filter_settings(account.credentials_json, label_name, gmail_query)
+            account.history_id = None  # filters may have changed; next sync is a full one
             if "is_active" in data:
                 account.is_active = bool(data.get("is_active"))
         else:
@@ -139,6 +144,9 @@ def update_account_filters(account_id: int):
             return jsonify({"data": None, "error": "Gmail query is too long (max 1000)"}), 400
 
         account.credentials_json = embed_filter_settings(account.credentials_json, label_name, gmail_query)
+        if (label_name, gmail_query) != (current_label, current_query):
+            # New filters may match older mail, so the next sync lists the full query.
+            account.history_id = None
 
         if "is_active" in data:
             account.is_active = bool(data.get("is_active"))
@@ -240,7 +248,13 @@ def sync_account(account_id: int):
         except (TypeError, ValueError):
             return jsonify({"data": None, "error": "max_results must be an integer"}), 400
         import_invoices = bool(payload.get("import_invoices", True))
-        result = sync_account_messages(account, max_results=max_results, import_invoices=import_invoices)
+        lock = account_sync_lock(account_id)
+        if not lock.acquire(blocking=False):
+            return jsonify({"data": None, "error": "Sync already running for this account"}), 409
+        try:
+            result = sync_account_messages(account, max_results=max_results, import_invoices=import_invoices)
+        finally:
+            lock.release()
         return jsonify({"data": result, "error": None})
     except GmailServiceError as e:
         return jsonify({"data": None, "error": str(e)}), 400
@@ -257,6 +271,7 @@ def delete_account(account_id: int):
             return err
         db.session.delete(account)
         db.session.commit()
+        gmail_client_cache.invalidate(account_id)
 
         return jsonify({
             "data": {"deleted": True, "id": account_id},
@@ -0,0 +1,37 @@
+"""Conditional GET (ETag / If-None-Match) support for list endpoints."""
+
+from __future__ import annotations
+
+from functools import wraps
+
+from flask import current_app, make_response, request
+
+from services.change_versions import make_etag
+
+
+def conditional_get(*tables: str):
+    """Answer 304 when none of ``tables`` changed since the client's ETag.
+
+    The tag is computed before the view runs, so a write racing with the
+    request can only make the next refresh return 200 again, never hide it.
+    Query arguments are part of the tag, so filtered views never share one.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            variant = "&".join(f"{key}={value}" for key, value in sorted(request.args.items(multi=True)))
+            etag = make_etag(tables, variant)
+            if request.if_none_match.contains(etag):
+                response = current_app.response_class(status=304)
+                response.set_etag(etag)
+                return response
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                response.set_etag(etag)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,100 @@
+"""Bulk invoice operations API endpoint."""
+
+from __future__ import annotations
+
+from flask import Blueprint, jsonify, request
+
+from api.invoice_validation import validate_invoice_data
+from services.invoice_bulk import apply_bulk_operations
+
+invoice_bulk_bp = Blueprint("invoice_bulk", __name__)
+
+MAX_BULK_OPERATIONS = 500
+
+
+def _parse_target_id(operation: dict) -> tuple[int | None, str | None]:
+    try:
+        return int(operation.get("id")), None
+    except (TypeError, ValueError):
+        return None, "id must be an integer"
+
+
+def _plan(operations: list) -> tuple[list[dict], list[tuple[int, dict]], dict[int, int], dict[int, int]]:
+    """Validate operations into per-item results and grouped work lists."""
+    results: list[dict] = []
+    creates: list[tuple[int, dict]] = []
+    pays: dict[int, int] = {}
+    deletes: dict[int, int] = {}
+
+    for index, operation in enumerate(operations):
+        result = {"index": index, "op": None, "ok": False, "error": None}
+        results.append(result)
+        if not isinstance(operation, dict):
+            result["error"] = "Operation must be an object"
+            continue
+        op = operation.get("op")
+        result["op"] = op
+        if op == "create":
+            validated, err = validate_invoice_data(operation.get("data") or {})
+            if err:
+                result["error"] = err
+            else:
+                creates.append((index, validated))
+        elif op in ("pay", "delete"):
+            invoice_id, err = _parse_target_id(operation)
+            if err:
+                result["error"] = err
+            else:
+                result["id"] = invoice_id
+                (pays if op == "pay" else deletes)[index] = invoice_id
+        else:
+            result["error"] = "op must be one of: create, pay, delete"
+
+    return results, creates, pays, deletes
+
+
+@invoice_bulk_bp.route("/bulk", methods=["POST"])
+def bulk_invoices():
+    """Apply create/pay/delete operations in a single transaction."""
+    try:
+        payload = request.get_json(silent=True) or {}
+        operations = payload.get("operations")
+        if not isinstance(operations, list) or not operations:
+            return jsonify({"data": None, "error": "operations must be a non-empty list"}), 400
+        if len(operations) > MAX_BULK_OPERATIONS:
+            return jsonify({
+                "data": None,
+                "error": f"At most {MAX_BULK_OPERATIONS} operations are allowed",
+            }), 400
+
+        results, creates, pays, deletes = _plan(operations)
+        outcome = apply_bulk_operations(
+            creates=[fields for _index, fields in creates],
+            pay_ids=set(pays.values()),
+            delete_ids=set(deletes.values()),
+        )
+
+        for (index, _fields), invoice_id in zip(creates, outcome.created_ids):
+            results[index].update({"ok": True, "id": invoice_id})
+        for index, invoice_id in pays.items():
+            if invoice_id in outcome.paid_ids:
+                results[index].update({"ok": True, "paid_date": outcome.paid_date.isoformat()})
+            else:
+                results[index]["error"] = "Invoice not found"
+        for index, invoice_id in deletes.items():
+            if invoice_id in outcome.deleted_ids:
+                results[index]["ok"] = True
+            else:
+                results[index]["error"] = "Invoice not found"
+
+        succeeded = sum(1 for result in results if result["ok"])
+        return jsonify({
+            "data": {
+                "results": results,
+                "succeeded": succeeded,
+                "failed": len(results) - succeeded,
+            },
+            "error": None,
+        })
+    except Exception as e:
+        return jsonify({"data": None, "error": str(e)}), 500
@@ -0,0 +1,78 @@
+"""Batch QR code rendering API endpoint."""
+
+from __future__ import annotations
+
+import base64
+
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+
+from models.database import Invoice
+from services.qr_batch import QR_MIMETYPES, QRJob, iter_qr_zip, render_qr_batch
+from services.qr_cache import get_qr_cache
+
+invoice_qr_bp = Blueprint("invoice_qr", __name__)
+
+MAX_QR_BATCH_SIZE = 200
+
+
+def _parse_ids(raw_ids) -> tuple[list[int] | None, str | None]:
+    if not isinstance(raw_ids, list) or not raw_ids:
+        return None, "ids must be a non-empty list"
+    if len(raw_ids) > MAX_QR_BATCH_SIZE:
+        return None, f"At most {MAX_QR_BATCH_SIZE} ids are allowed"
+    try:
+        ids = [int(value) for value in raw_ids]
+    except (TypeError, ValueError):
+        return None, "ids must be integers"
+    return list(dict.fromkeys(ids)), None
+
+
+@invoice_qr_bp.route("/qr/batch", methods=["POST"])
+def batch_qr_codes():
+    """Render QR codes for many invoices in one response (base64 JSON or ZIP)."""
+    try:
+        payload = request.get_json(silent=True) or {}
+        ids, err = _parse_ids(payload.get("ids"))
+        if err:
+            return jsonify({"data": None, "error": err}), 400
+        kind = str(payload.get("format", "png")).lower()
+        if kind not in QR_MIMETYPES:
+            return jsonify({"data": None, "error": "format must be png or svg"}), 400
+        output = str(payload.get("output", "json")).lower()
+        if output not in ("json", "zip"):
+            return jsonify({"data": None, "error": "output must be json or zip"}), 400
+
+        invoices = {inv.id: inv for inv in Invoice.query.filter(Invoice.id.in_(ids)).all()}
+        errors: dict[int, str] = {}
+        jobs: list[QRJob] = []
+        for invoice_id in ids:
+            invoice = invoices.get(invoice_id)
+            if invoice is None:
+                errors[invoice_id] = "Invoice not found"
+            elif not invoice.iban:
+                errors[invoice_id] = "No IBAN available for this invoice"
+            else:
+                jobs.append(QRJob(invoice.id, invoice.iban, float(invoice.amount), invoice.name))
+
+        if output == "zip":
+            return Response(
+                stream_with_context(iter_qr_zip(jobs, cache=get_qr_cache(), kind=kind)),
+                mimetype="application/zip",
+                headers={"Content-Disposition": "attachment; filename=invoice_qr_codes.zip"},
+            )
+
+        rendered = render_qr_batch(jobs, cache=get_qr_cache(), kind=kind)
+
+        items = []
+        for invoice_id in ids:
+            data, render_error = rendered.get(invoice_id, (None, errors.get(invoice_id)))
+            items.append({
+                "id": invoice_id,
+                "ok": data is not None,
+                "mimetype": QR_MIMETYPES[kind],
+                "data": base64.b64encode(data).decode("ascii") if data is not None else None,
+                "error": render_error,
+            })
+        return jsonify({"data": items, "error": None})
+    except Exception as e:
+        return jsonify({"data": None, "error": str(e)}), 500
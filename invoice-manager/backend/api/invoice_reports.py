@@ -0,0 +1,58 @@
+"""Invoice reporting API endpoints (aggregates and exports)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+
+from services.invoice_export import (
+    EXPORT_FORMATS,
+    iter_csv,
+    iter_invoice_rows,
+    iter_ndjson,
+)
+from services.invoice_summary import summarize_invoices
+
+invoice_reports_bp = Blueprint("invoice_reports", __name__)
+
+
+@invoice_reports_bp.route("/summary", methods=["GET"])
+def get_invoice_summary():
+    """Return invoice totals grouped by currency, payment state and month."""
+    try:
+        account_id = request.args.get("account_id", type=int)
+        as_of_raw = request.args.get("as_of")
+        if as_of_raw:
+            try:
+                as_of = datetime.strptime(as_of_raw, "%Y-%m-%d").date()
+            except ValueError:
+                return jsonify({"data": None, "error": "as_of must be YYYY-MM-DD"}), 400
+        else:
+            as_of = datetime.now(timezone.utc).date()
+
+        return jsonify({
+            "data": summarize_invoices(as_of=as_of, account_id=account_id),
+            "error": None,
+        })
+    except Exception as e:
+        return jsonify({"data": None, "error": str(e)}), 500
+
+
+@invoice_reports_bp.route("/export", methods=["GET"])
+def export_invoices():
+    """Stream all matching invoices as CSV or NDJSON."""
+    export_format = request.args.get("format", "csv").lower()
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"data": None, "error": "format must be csv or ndjson"}), 400
+    status = request.args.get("status", "all")
+    account_id = request.args.get("account_id", type=int)
+    search = request.args.get("q", "").strip()
+
+    rows = iter_invoice_rows(status=status, account_id=account_id, search=search)
+    body = iter_csv(rows) if export_format == "csv" else iter_ndjson(rows)
+    return Response(
+        stream_with_context(body),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f"attachment; filename=invoices.{export_format}"},
+    )
@@ -0,0 +1,42 @@
+"""Shared request payload validation for invoice endpoints."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+
+def validate_invoice_data(data: dict) -> tuple[dict | None, str | None]:
+    """Validate manual invoice data. Returns (invoice_fields, error_message)."""
+    name = data.get("name")
+    if not name or not str(name).strip():
+        return None, "Name is required"
+
+    amount = data.get("amount")
+    if amount is None:
+        return None, "Amount is required"
+    try:
+        amount = float(amount)
+    except (TypeError, ValueError):
+        return None, "Amount must be a valid number"
+    if amount <= 0:
+        return None, "Amount must be positive"
+
+    due_date_str = data.get("due_date")
+    if not due_date_str:
+        return None, "Due date is required"
+    try:
+        due_date = datetime.strptime(due_date_str, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None, "Due date must be YYYY-MM-DD format"
+
+    return {
+        "name": str(name).strip(),
+        "amount": amount,
+        "currency": data.get("currency", "HUF"),
+        "due_date": due_date,
+        "paid": False,
+        "gmail_account_id": data.get("gmail_account_id"),
+        "payment_link": data.get("payment_link"),
+        "iban": data.get("iban"),
+        "is_recurring": False,
+    }, None
@@ -2,11 +2,22 @@
 Invoices API endpoints.
 """
 from datetime import datetime, timezone
-from flask import Blueprint, jsonify, request, send_file
+from flask import Blueprint, current_app, jsonify, request, send_file
 import io
 
+from api.conditional import conditional_get
+from api.invoice_validation import validate_invoice_data
 from extensions import db
 from models.database import Invoice
+from services.invoice_queries import (
+    InvalidCursorError,
+    apply_invoice_filters,
+    fetch_keyset_page,
+    order_invoices_for_listing,
+)
+from services.invoice_search import apply_text_search
+from services.invoice_serialization import serialize_invoices
+from services.qr_cache import get_qr_cache, qr_cache_key
 from services.qr_generator import generate_payment_qr
 
 invoices_bp = Blueprint("invoices", __name__)
@@ -20,29 +31,49 @@ def _get_invoice_or_404(invoice_id: int):
 
 
 @invoices_bp.route("", methods=["GET"])
+@conditional_get("invoices", "gmail_accounts")
 def get_invoices():
-    """List invoices with optional status filter."""
+    """List invoices with optional status filter and full-text search.
+
+    Passing ``cursor`` (empty for the first page) switches to keyset
+    pagination and adds ``next_cursor`` to the response. ``q`` ranks
+    results by relevance and uses limit/offset paging.
+    """
     try:
         status = request.args.get("status", "all")
         account_id = request.args.get("account_id", type=int)
         limit = request.args.get("limit", 100, type=int)
         offset = request.args.get("offset", 0, type=int)
+        cursor = request.args.get("cursor")
+        search = request.args.get("q", "").strip()
 
-        query = Invoice.query
-
-        if status == "unpaid":
-            query = query.filter_by(paid=False)
-        elif status == "paid":
-            query = query.filter_by(paid=True)
+        query = apply_invoice_filters(Invoice.query, status, account_id)
 
-        if account_id:
-            query = query.filter_by(gmail_account_id=account_id)
+        if search:
+            if cursor is not None:
+                return jsonify({"data": None, "error": "cursor cannot be combined with q"}), 400
+            invoices = apply_text_search(query, search).limit(limit).offset(offset).all()
+            return jsonify({
+                "data": serialize_invoices(invoices),
+                "error": None,
+            })
+
+        if cursor is not None:
+            try:
+                invoices, next_cursor = fetch_keyset_page(query, cursor, max(1, limit))
+            except InvalidCursorError as e:
+                return jsonify({"data": None, "error": str(e)}), 400
+            return jsonify({
+                "data": serialize_invoices(invoices),
+                "next_cursor": next_cursor,
+                "error": None,
+            })
 
-        query = query.order_by(Invoice.due_date.desc())
+        query = order_invoices_for_listing(query)
         invoices = query.limit(limit).offset(offset).all()
 
         return jsonify({
-            "data": [inv.to_dict() for inv in invoices],
+            "data": serialize_invoices(invoices),
             "error": None,
         })
     except Exception as e:
@@ -69,58 +100,11 @@ def create_invoice():
     """Create a manual invoice (for testing / manual entry)."""
     try:
         data = request.get_json() or {}
+        validated, err = validate_invoice_data(data)
+        if err:
+            return jsonify({"data": None, "error": err}), 400
 
-        name = data.get("name")
-        if not name or not str(name).strip():
-            return jsonify({
-                "data": None,
-                "error": "Name is required",
-            }), 400
-
-        amount = data.get("amount")
-        if amount is None:
-            return jsonify({
-                "data": None,
-                "error": "Amount is required",
-            }), 400
-        try:
-            amount = float(amount)
-        except (TypeError, ValueError):
-            return jsonify({
-                "data": None,
-                "error": "Amount must be a valid number",
-            }), 400
-        if amount <= 0:
-            return jsonify({
-                "data": None,
-                "error": "Amount must be positive",
-            }), 400
-
-        due_date_str = data.get("due_date")
-        if not due_date_str:
-            return jsonify({
-                "data": None,
-                "error": "Due date is required",
-            }), 400
-        try:
-            due_date = datetime.strptime(due_date_str, "%Y-%m-%d").date()
-        except ValueError:
-            return jsonify({
-                "data": None,
-                "error": "Due date must be YYYY-MM-DD format",
-            }), 400
-
-        invoice = Invoice(
-            name=str(name).strip(),
-            amount=amount,
-            currency=data.get("currency", "HUF"),
-            due_date=due_date,
-            paid=False,
-            gmail_account_id=data.get("gmail_account_id"),
-            payment_link=data.get("payment_link"),
-            iban=data.get("iban"),
-            is_recurring=False,
-        )
+        invoice = Invoice(**validated)
         db.session.add(invoice)
         db.session.commit()
 
@@ -170,10 +154,19 @@ def get_qr_code(invoice_id: int):
                 "error": "No IBAN available for this invoice",
             }), 400
 
-        qr_bytes = generate_payment_qr(
-            iban=invoice.iban,
-            amount=float(invoice.amount),
-            name=invoice.name,
+        amount = float(invoice.amount)
+        key = qr_cache_key(iban=invoice.iban, amount=amount, name=invoice.name)
+        max_age = int(current_app.config.get("QR_CACHE_MAX_AGE_SECONDS", 86400))
+        if request.if_none_match.contains(key):
+            response = current_app.response_class(status=304)
+            response.set_etag(key)
+            response.cache_control.public = True
+            response.cache_control.max_age = max_age
+            return response
+
+        qr_bytes = get_qr_cache().get_or_render(
+            key,
+            lambda: generate_payment_qr(iban=invoice.iban, amount=amount, name=invoice.name),
         )
 
         return send_file(
@@ -181,6 +174,8 @@ def get_qr_code(invoice_id: int):
             mimetype="image/png",
             as_attachment=False,
             download_name=f"invoice_{invoice_id}_qr.png",
+            etag=key,
+            max_age=max_age,
         )
     except Exception as e:
         return jsonify({"data": None, "error": str(e)}), 500
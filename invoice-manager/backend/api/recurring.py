@@ -5,65 +5,21 @@ from datetime import datetime, timezone
 
 from flask import Blueprint, current_app, jsonify, request
 
+from api.conditional import conditional_get
+from api.recurring_validation import SCHEDULE_FIELDS, schedule_error, validate_recurring_data
 from extensions import db
 from models.database import Invoice, RecurringInvoice
 from services.recurring_generator import forecast_recurring_due_dates
+from services.recurring_preview import preview_recurring_generation
 from services.recurring_scheduler import (
-    get_recurring_run_status,
+    acquire_recurring_lease,
+    release_recurring_lease,
     run_recurring_generation_for_date,
 )
 
 recurring_bp = Blueprint("recurring", __name__)
 
 
-def _validate_recurring_data(
-    data: dict,
-    for_update: bool = False,
-) -> tuple[dict | None, str | None]:
-    """Validate recurring invoice data. Returns (validated_data, error_message)."""
-    result = {}
-
-    if not for_update or "name" in data:
-        name = data.get("name")
-        if not for_update and (not name or not str(name).strip()):
-            return None, "Name is required"
-        if name is not None:
-            if not str(name).strip():
-                return None, "Name cannot be empty"
-            result["name"] = str(name).strip()
-
-    if not for_update or "amount" in data:
-        amount = data.get("amount")
-        if not for_update and amount is None:
-            return None, "Amount is required"
-        if amount is not None:
-            try:
-                amount = float(amount)
-            except (TypeError, ValueError):
-                return None, "Amount must be a valid number"
-            if amount <= 0:
-                return None, "Amount must be positive"
-            result["amount"] = amount
-
-    if not for_update or "day_of_month" in data:
-        day_of_month = data.get("day_of_month")
-        if not for_update and day_of_month is None:
-            return None, "Day of month is required"
-        if day_of_month is not None:
-            try:
-                day_of_month = int(day_of_month)
-            except (TypeError, ValueError):
-                return None, "Day of month must be 1-31"
-            if not 1 <= day_of_month <= 31:
-                return None, "Day of month must be between 1 and 31"
-            result["day_of_month"] = day_of_month
-
-    if "currency" in data:
-        result["currency"] = data.get("currency", "HUF")
-
-    return result, None
-
-
 def _get_recurring_or_404(recurring_id: int):
     recurring = db.session.get(RecurringInvoice, recurring_id)
     if recurring is None:
@@ -75,6 +31,7 @@ def _get_recurring_or_404(recurring_id: int):
 
 
 @recurring_bp.route("", methods=["GET"])
+@conditional_get("recurring_invoices")
 def get_recurring():
     """List all recurring invoice templates."""
     try:
@@ -107,25 +64,24 @@ def create_recurring():
     """Create a new recurring invoice template."""
     try:
         data = request.get_json() or {}
-        validated, err = _validate_recurring_data(data, for_update=False)
+        validated, err = validate_recurring_data(data, for_update=False)
         if err:
             return jsonify({"data": None, "error": err}), 400
-        if (
-            "name" not in validated
-            or "amount" not in validated
-            or "day_of_month" not in validated
-        ):
+        if "name" not in validated or "amount" not in validated:
             return jsonify({
                 "data": None,
-                "error": "Name, amount and day_of_month are required",
+                "error": "Name and amount are required",
             }), 400
+        err = schedule_error(validated.get("frequency", "monthly"), validated.get("day_of_month"))
+        if err:
+            return jsonify({"data": None, "error": err}), 400
 
         recurring = RecurringInvoice(
             name=validated["name"],
             amount=validated["amount"],
             currency=validated.get("currency", "HUF"),
-            day_of_month=validated["day_of_month"],
             is_active=True,
+            **{field: validated[field] for field in SCHEDULE_FIELDS if field in validated},
         )
         db.session.add(recurring)
         db.session.commit()
@@ -148,7 +104,7 @@ def update_recurring(recurring_id: int):
             return err
         data = request.get_json() or {}
 
-        validated, err = _validate_recurring_data(data, for_update=True)
+        validated, err = validate_recurring_data(data, for_update=True)
         if err:
             return jsonify({"data": None, "error": err}), 400
 
@@ -156,10 +112,15 @@ def update_recurring(recurring_id: int):
             recurring.name = validated["name"]
         if "amount" in validated:
             recurring.amount = validated["amount"]
-        if "day_of_month" in validated:
-            recurring.day_of_month = validated["day_of_month"]
+        for field in SCHEDULE_FIELDS:
+            if field in validated:
+                setattr(recurring, field, validated[field])
         if "currency" in validated:
             recurring.currency = validated["currency"]
+        err = schedule_error(recurring.frequency, recurring.day_of_month)
+        if err:
+            db.session.rollback()
+            return jsonify({"data": None, "error": err}), 400
 
         db.session.commit()
 
@@ -277,9 +238,12 @@ def recurring_forecast(recurring_id: int):
 
 @recurring_bp.route("/run-now", methods=["POST"])
 def run_recurring_now():
-    """Trigger recurring invoice generation immediately."""
+    """Trigger recurring invoice generation immediately (or preview it with dry_run)."""
     try:
         payload = request.get_json(silent=True) or {}
+        dry_run = payload.get("dry_run", False)
+        if not isinstance(dry_run, bool):
+            return jsonify({"data": None, "error": "dry_run must be a boolean"}), 400
         run_date_raw = payload.get("run_date")
         if run_date_raw:
             try:
@@ -289,7 +253,28 @@ def run_recurring_now():
         else:
             run_date = datetime.now(timezone.utc).date()
 
-        result = run_recurring_generation_for_date(run_date)
+        if dry_run:
+            return jsonify({
+                "data": {
+                    "run_date": run_date.isoformat(),
+                    "dry_run": True,
+                    "result": preview_recurring_generation(run_date),
+                },
+                "error": None,
+            })
+
+        lease_ttl_seconds = current_app.config.get("RECURRING_LEASE_TTL_SECONDS", 900)
+        if not acquire_recurring_lease(lease_ttl_seconds):
+            return jsonify({
+                "data": None,
+                "error": "Recurring generation is running in another worker",
+            }), 409
+        try:
+            result = run_recurring_generation_for_date(run_date, lease_ttl_seconds=lease_ttl_seconds)
+        finally:
+            # Keep the lease only if this process's scheduler is the leader.
+            if "recurring_scheduler" not in current_app.extensions:
+                release_recurring_lease()
         return jsonify({
             "data": {
                 "run_date": run_date.isoformat(),
@@ -300,20 +285,3 @@ def run_recurring_now():
     except Exception as e:
         db.session.rollback()
         return jsonify({"data": None, "error": str(e)}), 500
-
-
-@recurring_bp.route("/run-status", methods=["GET"])
-def recurring_run_status():
-    """Return scheduler and last-run status for recurring generation."""
-    status = get_recurring_run_status()
-    status["scheduler_enabled"] = bool(
-        current_app.config.get("RECURRING_SCHEDULER_ENABLED", True)
-    )
-    status["scheduler_interval_seconds"] = int(current_app.config.get(
-        "RECURRING_SCHEDULER_INTERVAL_SECONDS",
-        300,
-    ))
-    return jsonify({
-        "data": status,
-        "error": None,
-    })
@@ -0,0 +1,41 @@
+"""Portfolio-wide recurring forecast endpoint."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from flask import Blueprint, jsonify, request
+
+from services.recurring_forecast import forecast_portfolio
+
+recurring_forecast_bp = Blueprint("recurring_forecast", __name__)
+
+MAX_FORECAST_MONTHS = 24
+
+
+@recurring_forecast_bp.route("/forecast", methods=["GET"])
+def get_portfolio_forecast():
+    """Forecast all active templates with per-month, per-currency totals."""
+    try:
+        try:
+            months = int(request.args.get("months", "12"))
+        except (TypeError, ValueError):
+            return jsonify({"data": None, "error": "months must be an integer"}), 400
+        if months < 1 or months > MAX_FORECAST_MONTHS:
+            return jsonify({"data": None, "error": f"months must be between 1 and {MAX_FORECAST_MONTHS}"}), 400
+
+        from_date_raw = request.args.get("from_date")
+        if from_date_raw:
+            try:
+                from_date = datetime.strptime(from_date_raw, "%Y-%m-%d").date()
+            except ValueError:
+                return jsonify({"data": None, "error": "from_date must be YYYY-MM-DD"}), 400
+        else:
+            from_date = datetime.now(timezone.utc).date()
+
+        return jsonify({
+            "data": forecast_portfolio(from_date=from_date, months=months),
+            "error": None,
+        })
+    except Exception as e:
+        return jsonify({"data": None, "error": str(e)}), 500
@@ -0,0 +1,63 @@
+"""Recurring generation run status and history endpoints."""
+
+from __future__ import annotations
+
+from flask import Blueprint, current_app, jsonify, request
+
+from services.recurring_runs import recurring_run_report
+from services.recurring_scheduler import get_recurring_run_status
+
+recurring_runs_bp = Blueprint("recurring_runs", __name__)
+
+MAX_WINDOW_DAYS = 365
+MAX_RUNS_LIMIT = 500
+
+
+def _bounded_int(name: str, default: int, upper: int) -> tuple[int | None, str | None]:
+    raw = request.args.get(name, str(default))
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        return None, f"{name} must be an integer"
+    if value < 1 or value > upper:
+        return None, f"{name} must be between 1 and {upper}"
+    return value, None
+
+
+@recurring_runs_bp.route("/runs", methods=["GET"])
+def get_recurring_runs():
+    """List recent generation runs with p50/p95 duration over a time window."""
+    try:
+        days, err = _bounded_int("days", 7, MAX_WINDOW_DAYS)
+        if err:
+            return jsonify({"data": None, "error": err}), 400
+        limit, err = _bounded_int("limit", 50, MAX_RUNS_LIMIT)
+        if err:
+            return jsonify({"data": None, "error": err}), 400
+
+        return jsonify({
+            "data": recurring_run_report(window_days=days, limit=limit),
+            "error": None,
+        })
+    except Exception as e:
+        return jsonify({"data": None, "error": str(e)}), 500
+
+
+@recurring_runs_bp.route("/run-status", methods=["GET"])
+def recurring_run_status():
+    """Return scheduler and last-run status for recurring generation."""
+    try:
+        status = get_recurring_run_status()
+    except Exception as e:
+        return jsonify({"data": None, "error": str(e)}), 500
+    status["scheduler_enabled"] = bool(
+        current_app.config.get("RECURRING_SCHEDULER_ENABLED", True)
+    )
+    status["scheduler_interval_seconds"] = int(current_app.config.get(
+        "RECURRING_SCHEDULER_INTERVAL_SECONDS",
+        300,
+    ))
+    return jsonify({
+        "data": status,
+        "error": None,
+    })
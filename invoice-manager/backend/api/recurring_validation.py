@@ -0,0 +1,104 @@
+"""Request payload validation for recurring invoice endpoints."""
+
+from __future__ import annotations
+
+from models.recurrence_rules import BUSINESS_DAY_RULES, FREQUENCIES
+
+SCHEDULE_FIELDS = ("frequency", "day_of_month", "day_of_week", "month_of_year", "business_day")
+
+
+def _bounded_int(value, low: int, high: int, type_error: str, range_error: str) -> tuple[int | None, str | None]:
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None, type_error
+    if not low <= value <= high:
+        return None, range_error
+    return value, None
+
+
+def _validate_schedule(data: dict, for_update: bool, result: dict) -> str | None:
+    if "frequency" in data:
+        frequency = str(data.get("frequency") or "").strip().lower()
+        if frequency not in FREQUENCIES:
+            return f"Frequency must be one of {', '.join(FREQUENCIES)}"
+        result["frequency"] = frequency
+    weekly = result.get("frequency") == "weekly"
+
+    if not for_update or "day_of_month" in data:
+        day_of_month = data.get("day_of_month")
+        if not for_update and day_of_month is None and not weekly:
+            return "Day of month is required"
+        if day_of_month is not None:
+            day_of_month, err = _bounded_int(
+                day_of_month, 1, 31, "Day of month must be 1-31", "Day of month must be between 1 and 31"
+            )
+            if err:
+                return err
+            result["day_of_month"] = day_of_month
+
+    for field, low, high, label in (("day_of_week", 0, 6, "Day of week"), ("month_of_year", 1, 12, "Month of year")):
+        if field not in data:
+            continue
+        if data[field] is None:
+            # An explicit null clears the anchor back to the template's default.
+            result[field] = None
+            continue
+        result[field], err = _bounded_int(
+            data[field], low, high, f"{label} must be {low}-{high}", f"{label} must be between {low} and {high}"
+        )
+        if err:
+            return err
+
+    if "business_day" in data:
+        business_day = str(data.get("business_day") or "none").strip().lower()
+        if business_day not in BUSINESS_DAY_RULES:
+            return f"Business day must be one of {', '.join(BUSINESS_DAY_RULES)}"
+        result["business_day"] = business_day
+    return None
+
+
+def schedule_error(frequency: str | None, day_of_month: int | None) -> str | None:
+    """Cross-field check run on the final template state (create and update)."""
+    if (frequency or "monthly") != "weekly" and day_of_month is None:
+        return "Day of month is required"
+    return None
+
+
+def validate_recurring_data(
+    data: dict,
+    for_update: bool = False,
+) -> tuple[dict | None, str | None]:
+    """Validate recurring invoice data. Returns (validated_data, error_message)."""
+    result = {}
+
+    if not for_update or "name" in data:
+        name = data.get("name")
+        if not for_update and (not name or not str(name).strip()):
+            return None, "Name is required"
+        if name is not None:
+            if not str(name).strip():
+                return None, "Name cannot be empty"
+            result["name"] = str(name).strip()
+
+    if not for_update or "amount" in data:
+        amount = data.get("amount")
+        if not for_update and amount is None:
+            return None, "Amount is required"
+        if amount is not None:
+            try:
+                amount = float(amount)
+            except (TypeError, ValueError):
+                return None, "Amount must be a valid number"
+            if amount <= 0:
+                return None, "Amount must be positive"
+            result["amount"] = amount
+
+    err = _validate_schedule(data, for_update, result)
+    if err:
+        return None, err
+
+    if "currency" in data:
+        result["currency"] = data.get("currency", "HUF")
+
+    return result, None
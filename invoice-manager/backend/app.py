@@ -6,6 +6,9 @@ from flask import Flask, jsonify
 from flask_cors import CORS
 from config import config
 from extensions import db
+from json_provider import FastJSONProvider
+from sqlite_profile import apply_sqlite_profile
+from services.change_versions import init_change_tracking
 import os
 import atexit
 
@@ -23,25 +26,52 @@ def _should_start_scheduler(app: Flask) -> bool:
 def create_app(config_name='default'):
     """Application factory pattern."""
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
     
     # Load configuration
     app.config.from_object(config[config_name])
     
     # Initialize extensions
     db.init_app(app)
+    with app.app_context():
+        apply_sqlite_profile(db.engine, app.config)
+    init_change_tracking()
     CORS(app, origins=app.config['CORS_ORIGINS'])
     
     # Create necessary directories
     os.makedirs(app.config['PDF_STORAGE_PATH'], exist_ok=True)
     os.makedirs(app.config['TEMP_PATH'], exist_ok=True)
+
+    # Rendered QR codes are content-addressed, so cached images never go stale.
+    from services.qr_cache import QRCache
+    qr_disk_path = None
+    if app.config.get('QR_CACHE_DISK_ENABLED', False):
+        qr_disk_path = os.path.join(app.config['TEMP_PATH'], 'qr_cache')
+    app.extensions['qr_cache'] = QRCache(
+        max_bytes=app.config.get('QR_CACHE_MAX_BYTES', 8 * 1024 * 1024),
+        disk_path=qr_disk_path,
+        disk_max_bytes=app.config.get('QR_CACHE_DISK_MAX_BYTES', 64 * 1024 * 1024),
+    )
     
     # Register blueprints
     from api.invoices import invoices_bp
+    from api.invoice_reports import invoice_reports_bp
+    from api.invoice_bulk import invoice_bulk_bp
+    from api.invoice_qr import invoice_qr_bp
     from api.accounts import accounts_bp
+    from api.account_sync import account_sync_bp
     from api.recurring import recurring_bp
+    from api.recurring_runs import recurring_runs_bp
+    from api.recurring_forecast import recurring_forecast_bp
     app.register_blueprint(invoices_bp, url_prefix='/api/invoices')
+    app.register_blueprint(invoice_reports_bp, url_prefix='/api/invoices')
+    app.register_blueprint(invoice_bulk_bp, url_prefix='/api/invoices')
+    app.register_blueprint(invoice_qr_bp, url_prefix='/api/invoices')
     app.register_blueprint(accounts_bp, url_prefix='/api/accounts')
+    app.register_blueprint(account_sync_bp, url_prefix='/api/accounts')
     app.register_blueprint(recurring_bp, url_prefix='/api/recurring')
+    app.register_blueprint(recurring_runs_bp, url_prefix='/api/recurring')
+    app.register_blueprint(recurring_forecast_bp, url_prefix='/api/recurring')
 
     if _should_start_scheduler(app):
         from services.recurring_scheduler import RecurringScheduler
@@ -49,6 +79,7 @@ def create_app(config_name='default'):
         scheduler = RecurringScheduler(
             app=app,
             interval_seconds=app.config.get("RECURRING_SCHEDULER_INTERVAL_SECONDS", 300),
+            lease_ttl_seconds=app.config.get("RECURRING_LEASE_TTL_SECONDS", 900),
         )
         scheduler.start()
         app.extensions["recurring_scheduler"] = scheduler
@@ -0,0 +1,3 @@
+"""
+Standalone performance benchmarks (run manually, not part of pytest).
+"""
@@ -0,0 +1,115 @@
+"""Time the invoice list response path: model serialization plus JSON encoding.
+
+Seeds a temporary database with ``--rows`` invoices, loads them once, then
+times what ``GET /api/invoices`` does after the query: ``to_dict`` per row and
+``jsonify``. Three variants are compared:
+
+* converted ``to_dict()`` rows encoded by Flask's stdlib provider (before);
+* converted ``to_dict()`` rows encoded by ``FastJSONProvider``;
+* raw ``serialize_invoices`` rows encoded by ``FastJSONProvider`` (current).
+
+Run from the backend directory:
+    python -m benchmarks.bench_json_provider [--rows 10000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import insert
+
+import app as app_module
+from extensions import db
+from json_provider import orjson
+from models.database import GmailAccount, Invoice
+from services.invoice_serialization import load_account_emails, serialize_invoices
+
+
+def _make_app(db_path: Path, rows: int):
+    class BenchConfig(app_module.config["default"]):
+        DEBUG = False
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
+        RECURRING_SCHEDULER_ENABLED = False
+        PDF_STORAGE_PATH = str(db_path.parent / "invoices")
+        TEMP_PATH = str(db_path.parent / "temp")
+
+    app_module.config["bench"] = BenchConfig
+    bench_app = app_module.create_app("bench")
+    created = datetime(2026, 1, 1, 8, 0, 0)
+    with bench_app.app_context():
+        db.create_all()
+        db.session.add_all([GmailAccount(email=f"user{i}@example.com", credentials_json="{}") for i in range(3)])
+        db.session.flush()
+        db.session.execute(insert(Invoice), [
+            {
+                "gmail_account_id": index % 4 or None,
+                "name": f"Invoice {index}",
+                "amount": Decimal(f"{1000 + index}.50"),
+                "currency": "HUF",
+                "due_date": date(2026, 1, 1) + timedelta(days=index % 365),
+                "paid": index % 2 == 0,
+                "paid_date": created if index % 2 == 0 else None,
+                "payment_link": "https://simplepay.hu/pay/abc",
+                "iban": "HU42117730161111101800000000",
+                "is_recurring": False,
+                "created_at": created,
+            }
+            for index in range(rows)
+        ])
+        db.session.commit()
+    return bench_app
+
+
+def _best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bench_app = _make_app(Path(tmp) / "bench.db", args.rows)
+        stdlib = DefaultJSONProvider(bench_app)
+        fast = bench_app.json
+        with bench_app.test_request_context():
+            invoices = Invoice.query.all()
+
+            def converted_rows():
+                emails = load_account_emails(inv.gmail_account_id for inv in invoices)
+                return [inv.to_dict(account_emails=emails) for inv in invoices]
+
+            results = {
+                "to_dict() + stdlib provider": lambda: stdlib.response({"data": converted_rows(), "error": None}),
+                "to_dict() + FastJSONProvider": lambda: fast.response({"data": converted_rows(), "error": None}),
+                "serialize_invoices (raw) + Fast": lambda: fast.response(
+                    {"data": serialize_invoices(invoices), "error": None}
+                ),
+            }
+            timings = {label: _best_of(args.repeat, func) for label, func in results.items()}
+            body = fast.response({"data": serialize_invoices(invoices), "error": None}).get_data()
+            same = json.loads(body)["data"] == json.loads(json.dumps(converted_rows()))
+
+    print(f"rows={args.rows} repeat={args.repeat} orjson={'yes' if orjson else 'no'}")
+    for label, seconds in timings.items():
+        print(f"  {label:<34} {seconds * 1000:8.1f} ms")
+    print(f"  payload size: {len(body) / 1024:.0f} KiB; raw and converted documents equal: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Time recurring invoice generation for many templates with long backlogs.
+
+Seeds a file database with templates created ``--years`` ago that were never
+generated, then times the catch-up run and an idempotent re-run. The
+``--legacy`` flag also times the previous per-row existence-check loop on a
+fresh database for comparison (slow on large inputs).
+
+Run from the backend directory:
+    python -m benchmarks.bench_recurring_generation [--templates 10000] [--years 3] [--legacy]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+from sqlalchemy import insert
+
+import app as app_module
+from extensions import db
+from models.database import Invoice, RecurringInvoice
+from models.recurrence_rules import compile_rule
+from services.recurring_due import iter_due_dates
+from services.recurring_generator import generate_due_recurring_invoices
+
+RUN_DATE = date(2026, 10, 17)
+
+
+def _make_app(db_path: Path, templates: int, years: int):
+    class BenchConfig(app_module.config["default"]):
+        DEBUG = False
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
+        RECURRING_SCHEDULER_ENABLED = False
+        PDF_STORAGE_PATH = str(db_path.parent / "invoices")
+        TEMP_PATH = str(db_path.parent / "temp")
+
+    app_module.config["bench"] = BenchConfig
+    bench_app = app_module.create_app("bench")
+    created_at = datetime(RUN_DATE.year - years, RUN_DATE.month, 1)
+    with bench_app.app_context():
+        db.create_all()
+        db.session.execute(insert(RecurringInvoice), [
+            {
+                "name": f"Template {i}",
+                "amount": 1000 + i,
+                "currency": "HUF",
+                "day_of_month": 1 + i % 31,
+                "is_active": i % 10 != 0,
+                "created_at": created_at,
+                # Bulk inserts skip mapper events, so set the indexed column here.
+                "next_due_date": compile_rule("monthly", 1 + i % 31, None, None, "none", created_at.date()).next_due_date(None),
+            }
+            for i in range(templates)
+        ])
+        db.session.commit()
+    return bench_app
+
+
+def _legacy_generate(run_date: date) -> int:
+    """The pre-rewrite loop: one existence query per template per due date."""
+    generated = 0
+    for template in RecurringInvoice.query.filter_by(is_active=True).order_by(RecurringInvoice.id):
+        for due_date in iter_due_dates(template, run_date):
+            template.last_generated = due_date
+            if Invoice.query.filter_by(recurring_invoice_id=template.id, due_date=due_date, is_recurring=True).first():
+                continue
+            db.session.add(Invoice(
+                name=template.name,
+                amount=template.amount,
+                currency=template.currency,
+                due_date=due_date,
+                is_recurring=True,
+                recurring_invoice_id=template.id,
+            ))
+            generated += 1
+    db.session.commit()
+    return generated
+
+
+def _timed(label: str, func) -> None:
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<24} {elapsed:8.2f}s  {result}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--templates", type=int, default=10000)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--legacy", action="store_true", help="also time the per-row loop")
+    parser.add_argument("--dir", default=None, help="where to create the database")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        bench_app = _make_app(Path(tmp).resolve() / "bench.db", args.templates, args.years)
+        with bench_app.app_context():
+            _timed("set-based catch-up", lambda: generate_due_recurring_invoices(RUN_DATE))
+            _timed("set-based re-run", lambda: generate_due_recurring_invoices(RUN_DATE))
+            db.engine.dispose()
+
+    if args.legacy:
+        with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+            bench_app = _make_app(Path(tmp).resolve() / "legacy.db", args.templates, args.years)
+            with bench_app.app_context():
+                _timed("per-row catch-up", lambda: {"generated": _legacy_generate(RUN_DATE)})
+                db.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
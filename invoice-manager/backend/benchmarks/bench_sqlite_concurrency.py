@@ -0,0 +1,150 @@
+"""Measure invoice-list read latency while background writers commit.
+
+Simulates the recurring scheduler (batched inserts + commit) and a Gmail sync
+(a transaction held open across slow "API calls") against a file database,
+once with the SQLite tuning profile and once with SQLite defaults.
+
+Run from the backend directory:
+    python -m benchmarks.bench_sqlite_concurrency [--seconds 5] [--readers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy.exc import OperationalError
+
+import app as app_module
+from extensions import db
+from models.database import Invoice
+
+
+def _make_app(db_path: Path, tuned: bool):
+    class BenchConfig(app_module.config["default"]):
+        DEBUG = False
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
+        RECURRING_SCHEDULER_ENABLED = False
+        SQLITE_TUNING_ENABLED = tuned
+        PDF_STORAGE_PATH = str(db_path.parent / "invoices")
+        TEMP_PATH = str(db_path.parent / "temp")
+
+    app_module.config["bench"] = BenchConfig
+    bench_app = app_module.create_app("bench")
+    with bench_app.app_context():
+        db.create_all()
+        db.session.add_all(_invoices(2000, "seed"))
+        db.session.commit()
+    return bench_app
+
+
+def _invoices(count: int, prefix: str) -> list[Invoice]:
+    start = date(2026, 1, 1)
+    return [
+        Invoice(name=f"{prefix} {i}", amount=1000 + i, due_date=start + timedelta(days=i % 365), is_recurring=False)
+        for i in range(count)
+    ]
+
+
+def _scheduler_writer(bench_app, stop: threading.Event, commits: list, errors: list):
+    with bench_app.app_context():
+        while not stop.is_set():
+            try:
+                db.session.add_all(_invoices(50, "recurring"))
+                db.session.commit()
+                commits.append(1)
+            except OperationalError as exc:
+                db.session.rollback()
+                errors.append(str(exc.orig))
+            time.sleep(0.01)
+
+
+def _sync_writer(bench_app, stop: threading.Event, commits: list, errors: list):
+    with bench_app.app_context():
+        while not stop.is_set():
+            try:
+                for invoice in _invoices(10, "gmail"):
+                    db.session.add(invoice)
+                    db.session.flush()
+                    time.sleep(0.005)  # simulated Gmail API round-trip inside the transaction
+                db.session.commit()
+                commits.append(1)
+            except OperationalError as exc:
+                db.session.rollback()
+                errors.append(str(exc.orig))
+
+
+def _reader(bench_app, stop: threading.Event, latencies: list, errors: list):
+    with bench_app.app_context():
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                rows = Invoice.query.order_by(Invoice.due_date.desc(), Invoice.id.desc()).limit(100).all()
+                [row.to_dict(account_emails={}) for row in rows]
+                db.session.rollback()
+                latencies.append(time.perf_counter() - started)
+            except OperationalError as exc:
+                db.session.rollback()
+                errors.append(str(exc.orig))
+
+
+def run(tuned: bool, seconds: float, readers: int, directory: str | None = None) -> dict:
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        bench_app = _make_app(Path(tmp).resolve() / "bench.db", tuned)
+        stop = threading.Event()
+        latencies: list[float] = []
+        read_errors: list[str] = []
+        write_errors: list[str] = []
+        commits: list[int] = []
+        threads = [
+            threading.Thread(target=_scheduler_writer, args=(bench_app, stop, commits, write_errors)),
+            threading.Thread(target=_sync_writer, args=(bench_app, stop, commits, write_errors)),
+        ] + [
+            threading.Thread(target=_reader, args=(bench_app, stop, latencies, read_errors))
+            for _ in range(readers)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        with bench_app.app_context():
+            db.engine.dispose()
+
+    ordered = sorted(latencies) or [0.0]
+    return {
+        "reads": len(latencies),
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[int(len(ordered) * 0.95) - 1 if len(ordered) > 1 else 0] * 1000,
+        "max_ms": ordered[-1] * 1000,
+        "commits": len(commits),
+        "read_errors": len(read_errors),
+        "write_errors": len(write_errors),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--dir", default=None, help="where to create the database (use a real disk, not tmpfs)")
+    args = parser.parse_args()
+
+    for label, tuned in (("defaults (rollback journal)", False), ("tuned profile (WAL)", True)):
+        result = run(tuned, args.seconds, args.readers, args.dir)
+        print(
+            f"{label:<28} reads={result['reads']:>6} p50={result['p50_ms']:7.2f}ms "
+            f"p95={result['p95_ms']:8.2f}ms max={result['max_ms']:8.2f}ms "
+            f"commits={result['commits']:>5} read_errors={result['read_errors']} write_errors={result['write_errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
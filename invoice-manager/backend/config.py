@@ -18,6 +18,15 @@ class Config:
     # Database
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URI', 'sqlite:///invoices.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # SQLite tuning (applied on every connection, ignored for other databases)
+    SQLITE_TUNING_ENABLED = os.getenv('SQLITE_TUNING_ENABLED', 'True').lower() == 'true'
+    SQLITE_JOURNAL_MODE = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    SQLITE_CACHE_SIZE = int(os.getenv('SQLITE_CACHE_SIZE', -64000))  # negative = KiB
+    SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', 268435456))
+    SQLITE_TEMP_STORE = os.getenv('SQLITE_TEMP_STORE', 'MEMORY')
     
     # Gmail API
     GMAIL_CLIENT_ID = os.getenv('GMAIL_CLIENT_ID')
@@ -29,14 +38,28 @@ class Config:
     ]
     GMAIL_REDIRECT_URI = os.getenv('GMAIL_REDIRECT_URI', 'http://localhost:5000/api/accounts/oauth/callback')
     GMAIL_SYNC_MAX_RESULTS = int(os.getenv('GMAIL_SYNC_MAX_RESULTS', 50))
+    GMAIL_SYNC_WORKERS = int(os.getenv('GMAIL_SYNC_WORKERS', 4))
+    GMAIL_BATCH_SIZE = int(os.getenv('GMAIL_BATCH_SIZE', 50))
+    GMAIL_BATCH_MAX_RETRIES = int(os.getenv('GMAIL_BATCH_MAX_RETRIES', 2))
+    GMAIL_BATCH_RETRY_BACKOFF_SECONDS = float(os.getenv('GMAIL_BATCH_RETRY_BACKOFF_SECONDS', 1.0))
+    GMAIL_METADATA_PREFILTER = os.getenv('GMAIL_METADATA_PREFILTER', 'True').lower() == 'true'
+    GMAIL_CLIENT_CACHE = os.getenv('GMAIL_CLIENT_CACHE', 'True').lower() == 'true'
     FRONTEND_BASE_URL = os.getenv('FRONTEND_BASE_URL', 'http://localhost:5173')
     
     # Application
     MAX_GMAIL_ACCOUNTS = int(os.getenv('MAX_GMAIL_ACCOUNTS', 2))
     PDF_STORAGE_PATH = os.getenv('PDF_STORAGE_PATH', 'invoices/')
     TEMP_PATH = os.getenv('TEMP_PATH', 'temp/')
+    QR_CACHE_MAX_BYTES = int(os.getenv('QR_CACHE_MAX_BYTES', 8 * 1024 * 1024))
+    QR_CACHE_DISK_ENABLED = os.getenv('QR_CACHE_DISK_ENABLED', 'False').lower() == 'true'
+    QR_CACHE_DISK_MAX_BYTES = int(os.getenv('QR_CACHE_DISK_MAX_BYTES', 64 * 1024 * 1024))
+    QR_CACHE_MAX_AGE_SECONDS = int(os.getenv('QR_CACHE_MAX_AGE_SECONDS', 86400))
     RECURRING_SCHEDULER_ENABLED = os.getenv('RECURRING_SCHEDULER_ENABLED', 'True').lower() == 'true'
     RECURRING_SCHEDULER_INTERVAL_SECONDS = int(os.getenv('RECURRING_SCHEDULER_INTERVAL_SECONDS', 300))
+    RECURRING_LEASE_TTL_SECONDS = int(os.getenv('RECURRING_LEASE_TTL_SECONDS', 900))
+    RECURRING_RUN_HISTORY_DAYS = int(os.getenv('RECURRING_RUN_HISTORY_DAYS', 90))
+    RECURRING_GENERATION_CHUNK_TEMPLATES = int(os.getenv('RECURRING_GENERATION_CHUNK_TEMPLATES', 500))
+    RECURRING_GENERATION_CHUNK_PERIODS = int(os.getenv('RECURRING_GENERATION_CHUNK_PERIODS', 24))
     
     # Timezone
     TIMEZONE = os.getenv('TIMEZONE', 'Europe/Budapest')
@@ -0,0 +1,75 @@
+"""
+Fast JSON provider - orjson when installed, stdlib json otherwise.
+"""
+from __future__ import annotations
+
+import dataclasses
+import decimal
+from datetime import date, datetime
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is missing
+    orjson = None
+
+
+def _default(o: Any) -> Any:
+    """Convert values neither encoder handles natively.
+
+    Dates are ISO 8601 (not Flask's HTTP-date) and Decimals are numbers, so
+    both encoders produce the same documents as the models' ``to_dict``.
+    """
+    if isinstance(o, decimal.Decimal):
+        return float(o)
+    if isinstance(o, (date, datetime)):
+        return o.isoformat()
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, "_asdict"):
+        # SQLAlchemy Row / namedtuple
+        return o._asdict()
+    return DefaultJSONProvider.default(o)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider serializing through orjson with a stdlib fallback."""
+
+    default = staticmethod(_default)
+
+    def _orjson_options(self, indent: Any, sort_keys: bool) -> int:
+        options = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps_bytes(self, obj: Any, indent: Any = None, sort_keys: bool | None = None) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON bytes."""
+        sort_keys = self.sort_keys if sort_keys is None else sort_keys
+        if orjson is None:
+            return super().dumps(obj, indent=indent, sort_keys=sort_keys).encode("utf-8")
+        return orjson.dumps(obj, default=_default, option=self._orjson_options(indent, sort_keys))
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize ``obj`` to a JSON string (``indent``/``sort_keys`` honoured)."""
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(
+            obj,
+            indent=kwargs.get("indent"),
+            sort_keys=kwargs.get("sort_keys"),
+        ).decode("utf-8")
+
+    def response(self, *args: Any, **kwargs: Any):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self.dumps_bytes(obj, indent=2 if indent else None) + b"\n",
+            mimetype=self.mimetype,
+        )
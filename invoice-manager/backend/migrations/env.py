@@ -10,6 +10,7 @@ from sqlalchemy import engine_from_config, pool
 from config import Config
 from extensions import db
 import models.database  # noqa: F401 - import registers SQLAlchemy models
+from models.invoice_search_index import INVOICE_FTS_TABLE
 
 config = context.config
 
@@ -21,6 +22,15 @@ config.set_main_option("sqlalchemy.url", Config.SQLALCHEMY_DATABASE_URI)
 target_metadata = db.metadata
 
 
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Hide the FTS5 table and its shadow tables, which raw DDL manages.
+
+    They are not in the metadata, so autogenerate would otherwise emit
+    drop_table for the search index.
+    """
+    return not (type_ == "table" and name and name.startswith(INVOICE_FTS_TABLE))
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
@@ -29,6 +39,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         compare_type=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -48,6 +59,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,38 @@
+"""invoice listing indexes
+
+Revision ID: 20261017_0002
+Revises: 20260223_0001
+Create Date: 2026-10-17 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0002"
+down_revision = "20260223_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_invoices_due_date_id", "invoices", ["due_date", "id"])
+    op.create_index("ix_invoices_paid_due_date_id", "invoices", ["paid", "due_date", "id"])
+    op.create_index(
+        "ix_invoices_account_due_date_id",
+        "invoices",
+        ["gmail_account_id", "due_date", "id"],
+    )
+    op.create_index(
+        "ix_invoices_account_paid_due_date_id",
+        "invoices",
+        ["gmail_account_id", "paid", "due_date", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_invoices_account_paid_due_date_id", table_name="invoices")
+    op.drop_index("ix_invoices_account_due_date_id", table_name="invoices")
+    op.drop_index("ix_invoices_paid_due_date_id", table_name="invoices")
+    op.drop_index("ix_invoices_due_date_id", table_name="invoices")
@@ -0,0 +1,56 @@
+"""invoice full-text search
+
+Revision ID: 20261017_0003
+Revises: 20261017_0002
+Create Date: 2026-10-17 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0003"
+down_revision = "20261017_0002"
+branch_labels = None
+depends_on = None
+
+FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS invoices_fts USING fts5("
+    "name, payment_link, sender, content='invoices', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS invoices_fts_ai AFTER INSERT ON invoices BEGIN "
+    "INSERT INTO invoices_fts(rowid, name, payment_link, sender) "
+    "VALUES (new.id, new.name, new.payment_link, new.sender); END",
+    "CREATE TRIGGER IF NOT EXISTS invoices_fts_ad AFTER DELETE ON invoices BEGIN "
+    "INSERT INTO invoices_fts(invoices_fts, rowid, name, payment_link, sender) "
+    "VALUES ('delete', old.id, old.name, old.payment_link, old.sender); END",
+    "CREATE TRIGGER IF NOT EXISTS invoices_fts_au "
+    "AFTER UPDATE OF name, payment_link, sender ON invoices BEGIN "
+    "INSERT INTO invoices_fts(invoices_fts, rowid, name, payment_link, sender) "
+    "VALUES ('delete', old.id, old.name, old.payment_link, old.sender); "
+    "INSERT INTO invoices_fts(rowid, name, payment_link, sender) "
+    "VALUES (new.id, new.name, new.payment_link, new.sender); END",
+)
+
+
+def upgrade() -> None:
+    op.add_column("invoices", sa.Column("sender", sa.String(length=255), nullable=True))
+
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for statement in FTS_DDL:
+        op.execute(statement)
+    # Index rows that existed before the triggers.
+    op.execute("INSERT INTO invoices_fts(invoices_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS invoices_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS invoices_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS invoices_fts_ai")
+        op.execute("DROP TABLE IF EXISTS invoices_fts")
+
+    op.drop_column("invoices", "sender")
@@ -0,0 +1,66 @@
+"""invoice gmail message id
+
+Revision ID: 20261017_0004
+Revises: 20261017_0003
+Create Date: 2026-10-17 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0004"
+down_revision = "20261017_0003"
+branch_labels = None
+depends_on = None
+
+BACKFILL_CHUNK_SIZE = 1000
+
+# Moves one chunk of legacy "gmail:<id>" pdf_path markers into gmail_message_id.
+# MIN(id) per (account, marker) plus NOT EXISTS keep accidental duplicate
+# imports from violating the unique index; those rows keep their old marker.
+BACKFILL_CHUNK_SQL = sa.text(
+    """
+    UPDATE invoices
+    SET gmail_message_id = substr(pdf_path, 7), pdf_path = NULL
+    WHERE id IN (
+        SELECT MIN(i.id) FROM invoices AS i
+        WHERE i.pdf_path LIKE 'gmail:%'
+          AND i.gmail_message_id IS NULL
+          AND NOT EXISTS (
+              SELECT 1 FROM invoices AS o
+              WHERE o.gmail_account_id = i.gmail_account_id
+                AND o.gmail_message_id = substr(i.pdf_path, 7)
+          )
+        GROUP BY i.gmail_account_id, i.pdf_path
+        LIMIT :chunk_size
+    )
+    """
+)
+
+
+def upgrade() -> None:
+    op.add_column("invoices", sa.Column("gmail_message_id", sa.String(length=255), nullable=True))
+    op.create_index(
+        "uq_invoices_account_gmail_message",
+        "invoices",
+        ["gmail_account_id", "gmail_message_id"],
+        unique=True,
+    )
+
+    bind = op.get_bind()
+    while True:
+        result = bind.execute(BACKFILL_CHUNK_SQL, {"chunk_size": BACKFILL_CHUNK_SIZE})
+        if not result.rowcount:
+            break
+
+
+def downgrade() -> None:
+    op.execute(
+        "UPDATE invoices SET pdf_path = 'gmail:' || gmail_message_id "
+        "WHERE gmail_message_id IS NOT NULL AND pdf_path IS NULL"
+    )
+    op.drop_index("uq_invoices_account_gmail_message", table_name="invoices")
+    op.drop_column("invoices", "gmail_message_id")
@@ -0,0 +1,43 @@
+"""recurring invoice unique due date
+
+Revision ID: 20261017_0005
+Revises: 20261017_0004
+Create Date: 2026-10-17 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0005"
+down_revision = "20261017_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Racing generators could have produced duplicates before this index
+    # existed. Keep the oldest row linked to its template and detach the
+    # rest instead of deleting invoices users may have already paid.
+    op.execute(
+        """
+        UPDATE invoices SET recurring_invoice_id = NULL
+        WHERE recurring_invoice_id IS NOT NULL
+          AND id NOT IN (
+              SELECT MIN(id) FROM invoices
+              WHERE recurring_invoice_id IS NOT NULL
+              GROUP BY recurring_invoice_id, due_date
+          )
+        """
+    )
+    op.create_index(
+        "uq_invoices_recurring_due_date",
+        "invoices",
+        ["recurring_invoice_id", "due_date"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_invoices_recurring_due_date", table_name="invoices")
@@ -0,0 +1,71 @@
+"""recurring next due date
+
+Revision ID: 20261017_0006
+Revises: 20261017_0005
+Create Date: 2026-10-17 00:00:00
+"""
+from __future__ import annotations
+
+from calendar import monthrange
+from datetime import date, datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0006"
+down_revision = "20261017_0005"
+branch_labels = None
+depends_on = None
+
+
+def _due_date(year: int, month: int, day_of_month: int) -> date:
+    return date(year, month, min(day_of_month, monthrange(year, month)[1]))
+
+
+def _following_month(value: date) -> tuple[int, int]:
+    return (value.year + 1, 1) if value.month == 12 else (value.year, value.month + 1)
+
+
+def _next_due_date(day_of_month: int, created_at, last_generated) -> date:
+    # Frozen copy of models.recurring_schedule.compute_next_due_date.
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at)
+    if isinstance(last_generated, str):
+        last_generated = date.fromisoformat(last_generated)
+    created_date = created_at.date()
+    if last_generated is not None:
+        return _due_date(*_following_month(last_generated), day_of_month)
+    due_date = _due_date(created_date.year, created_date.month, day_of_month)
+    if due_date >= created_date:
+        return due_date
+    return _due_date(*_following_month(created_date), day_of_month)
+
+
+def upgrade() -> None:
+    op.add_column("recurring_invoices", sa.Column("next_due_date", sa.Date(), nullable=True))
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, day_of_month, created_at, last_generated FROM recurring_invoices")
+    ).all()
+    if rows:
+        bind.execute(
+            sa.text("UPDATE recurring_invoices SET next_due_date = :next_due_date WHERE id = :id"),
+            [
+                {"id": row.id, "next_due_date": _next_due_date(row.day_of_month, row.created_at, row.last_generated)}
+                for row in rows
+            ],
+        )
+
+    op.create_index(
+        "ix_recurring_invoices_active_next_due",
+        "recurring_invoices",
+        ["is_active", "next_due_date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recurring_invoices_active_next_due", table_name="recurring_invoices")
+    op.drop_column("recurring_invoices", "next_due_date")
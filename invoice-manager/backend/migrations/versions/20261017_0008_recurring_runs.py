@@ -0,0 +1,47 @@
+"""recurring runs
+
+Revision ID: 20261017_0008
+Revises: 20261017_0007
+Create Date: 2026-10-17 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0008"
+down_revision = "20261017_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "recurring_runs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("run_date", sa.Date(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=False),
+        sa.Column("duration_ms", sa.Float(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("holder", sa.String(length=128), nullable=True),
+        sa.Column("generated", sa.Integer(), nullable=True),
+        sa.Column("skipped_existing", sa.Integer(), nullable=True),
+        sa.Column("skipped_paused", sa.Integer(), nullable=True),
+        sa.Column("skipped_not_due", sa.Integer(), nullable=True),
+        sa.Column("processed_templates", sa.Integer(), nullable=True),
+        sa.Column("template_scan_ms", sa.Float(), nullable=True),
+        sa.Column("existence_check_ms", sa.Float(), nullable=True),
+        sa.Column("insert_ms", sa.Float(), nullable=True),
+        sa.Column("commit_ms", sa.Float(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_recurring_runs_started_at", "recurring_runs", ["started_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recurring_runs_started_at", table_name="recurring_runs")
+    op.drop_table("recurring_runs")
@@ -0,0 +1,38 @@
+"""recurrence rules
+
+Revision ID: 20261017_0009
+Revises: 20261017_0008
+Create Date: 2026-10-17 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0009"
+down_revision = "20261017_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing templates keep their monthly schedule and next_due_date.
+    with op.batch_alter_table("recurring_invoices") as batch_op:
+        batch_op.add_column(sa.Column("frequency", sa.String(length=16), nullable=False, server_default="monthly"))
+        batch_op.add_column(sa.Column("day_of_week", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("month_of_year", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("business_day", sa.String(length=16), nullable=False, server_default="none"))
+        batch_op.alter_column("day_of_month", existing_type=sa.Integer(), nullable=True)
+
+
+def downgrade() -> None:
+    # Weekly templates have no day of month; pin them to the 1st to restore NOT NULL.
+    op.execute("UPDATE recurring_invoices SET day_of_month = 1 WHERE day_of_month IS NULL")
+    with op.batch_alter_table("recurring_invoices") as batch_op:
+        batch_op.alter_column("day_of_month", existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_column("business_day")
+        batch_op.drop_column("month_of_year")
+        batch_op.drop_column("day_of_week")
+        batch_op.drop_column("frequency")
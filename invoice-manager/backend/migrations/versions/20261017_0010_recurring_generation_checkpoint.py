@@ -0,0 +1,29 @@
+"""recurring generation checkpoint
+
+Revision ID: 20261017_0010
+Revises: 20261017_0009
+Create Date: 2026-10-17 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0010"
+down_revision = "20261017_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("recurring_run_state") as batch_op:
+        batch_op.add_column(sa.Column("checkpoint_run_date", sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column("checkpoint_template_id", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("recurring_run_state") as batch_op:
+        batch_op.drop_column("checkpoint_template_id")
+        batch_op.drop_column("checkpoint_run_date")
@@ -0,0 +1,26 @@
+"""gmail account history id
+
+Revision ID: 20261017_0011
+Revises: 20261017_0010
+Create Date: 2026-10-17 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0011"
+down_revision = "20261017_0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing accounts start with a full sync that stores the history id.
+    op.add_column("gmail_accounts", sa.Column("history_id", sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("gmail_accounts", "history_id")
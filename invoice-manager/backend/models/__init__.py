@@ -2,5 +2,9 @@
 Models package initialization.
 """
 from models.database import GmailAccount, Invoice, RecurringInvoice
+from models.scheduler_state import RecurringRun, RecurringRunState, SchedulerLease
+from models.table_versions import TableVersion
+import models.invoice_search_index  # noqa: F401 - registers FTS DDL
+import models.recurring_schedule  # noqa: F401 - maintains next_due_date
 
-__all__ = ['GmailAccount', 'Invoice', 'RecurringInvoice']
+__all__ = ['GmailAccount', 'Invoice', 'RecurringInvoice', 'RecurringRun', 'RecurringRunState', 'SchedulerLease', 'TableVersion']
@@ -20,6 +20,7 @@ class GmailAccount(db.Model):
     is_active = db.Column(db.Boolean, default=True, nullable=False)
     last_sync = db.Column(db.DateTime, nullable=True)
     credentials_json = db.Column(db.Text, nullable=False)  # Encrypted OAuth tokens
+    history_id = db.Column(db.String(32), nullable=True)  # Gmail historyId of the last sync
     created_at = db.Column(db.DateTime, default=_utc_now_naive, nullable=False)
     
     # Relationships
@@ -43,6 +44,15 @@ class Invoice(db.Model):
     """Invoice from email or recurring template."""
     
     __tablename__ = 'invoices'
+    __table_args__ = (
+        # Keyset pagination indexes matching GET /api/invoices filters.
+        db.Index('ix_invoices_due_date_id', 'due_date', 'id'),
+        db.Index('ix_invoices_paid_due_date_id', 'paid', 'due_date', 'id'),
+        db.Index('ix_invoices_account_due_date_id', 'gmail_account_id', 'due_date', 'id'),
+        db.Index('ix_invoices_account_paid_due_date_id', 'gmail_account_id', 'paid', 'due_date', 'id'),
+        db.Index('uq_invoices_account_gmail_message', 'gmail_account_id', 'gmail_message_id', unique=True),
+        db.Index('uq_invoices_recurring_due_date', 'recurring_invoice_id', 'due_date', unique=True),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     gmail_account_id = db.Column(db.Integer, db.ForeignKey('gmail_accounts.id'), nullable=True)
@@ -55,28 +65,49 @@ class Invoice(db.Model):
     payment_link = db.Column(db.Text, nullable=True)
     pdf_path = db.Column(db.String(500), nullable=True)
     iban = db.Column(db.String(34), nullable=True)  # For QR code generation
+    sender = db.Column(db.String(255), nullable=True)  # From header of Gmail imports
+    gmail_message_id = db.Column(db.String(255), nullable=True)  # Source message of Gmail imports
     is_recurring = db.Column(db.Boolean, default=False, nullable=False)
     recurring_invoice_id = db.Column(db.Integer, db.ForeignKey('recurring_invoices.id'), nullable=True)
     created_at = db.Column(db.DateTime, default=_utc_now_naive, nullable=False)
     
-    def to_dict(self):
-        """Convert to dictionary."""
+    def to_dict(self, account_emails=None, raw=False):
+        """Convert to dictionary.
+
+        ``account_emails`` maps account id to email when serializing many
+        invoices at once, so ``gmail_account`` is not lazy-loaded per row.
+        ``raw`` keeps ``amount`` and dates as Decimal/date objects for the
+        app's JSON provider to encode (same output, no per-field conversion).
+        """
+        if account_emails is not None:
+            account_email = account_emails.get(self.gmail_account_id)
+        else:
+            account_email = self.gmail_account.email if self.gmail_account else None
+        if raw:
+            amount, due_date, paid_date, created_at = self.amount, self.due_date, self.paid_date, self.created_at
+        else:
+            amount = float(self.amount)
+            due_date = self.due_date.isoformat()
+            paid_date = self.paid_date.isoformat() if self.paid_date else None
+            created_at = self.created_at.isoformat()
         return {
             'id': self.id,
             'gmail_account_id': self.gmail_account_id,
-            'gmail_account_email': self.gmail_account.email if self.gmail_account else None,
+            'gmail_account_email': account_email,
             'name': self.name,
-            'amount': float(self.amount),
+            'amount': amount,
             'currency': self.currency,
-            'due_date': self.due_date.isoformat(),
+            'due_date': due_date,
             'paid': self.paid,
-            'paid_date': self.paid_date.isoformat() if self.paid_date else None,
+            'paid_date': paid_date,
             'payment_link': self.payment_link,
             'pdf_path': self.pdf_path,
             'iban': self.iban,
+            'sender': self.sender,
+            'gmail_message_id': self.gmail_message_id,
             'is_recurring': self.is_recurring,
             'recurring_invoice_id': self.recurring_invoice_id,
-            'created_at': self.created_at.isoformat(),
+            'created_at': created_at,
             'has_qr': self.iban is not None,
             'has_payment_link': self.payment_link is not None
         }
@@ -89,14 +120,23 @@ class RecurringInvoice(db.Model):
     """Recurring invoice template."""
     
     __tablename__ = 'recurring_invoices'
+    __table_args__ = (
+        # Scheduler runs select is_active AND next_due_date <= run date.
+        db.Index('ix_recurring_invoices_active_next_due', 'is_active', 'next_due_date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(255), nullable=False)
     amount = db.Column(db.Numeric(10, 2), nullable=False)
     currency = db.Column(db.String(3), default='HUF', nullable=False)
-    day_of_month = db.Column(db.Integer, nullable=False)  # 1-31
+    frequency = db.Column(db.String(16), default='monthly', nullable=False)  # weekly|monthly|quarterly|yearly
+    day_of_month = db.Column(db.Integer, nullable=True)  # 1-31, unused for weekly
+    day_of_week = db.Column(db.Integer, nullable=True)  # 0=Monday, weekly only
+    month_of_year = db.Column(db.Integer, nullable=True)  # anchor month for quarterly/yearly
+    business_day = db.Column(db.String(16), default='none', nullable=False)  # none|following|preceding
     is_active = db.Column(db.Boolean, default=True, nullable=False)
     last_generated = db.Column(db.Date, nullable=True)
+    next_due_date = db.Column(db.Date, nullable=True)  # Maintained by models.recurring_schedule
     created_at = db.Column(db.DateTime, default=_utc_now_naive, nullable=False)
     
     # Relationships
@@ -109,11 +149,16 @@ class RecurringInvoice(db.Model):
             'name': self.name,
             'amount': float(self.amount),
             'currency': self.currency,
+            'frequency': self.frequency,
             'day_of_month': self.day_of_month,
+            'day_of_week': self.day_of_week,
+            'month_of_year': self.month_of_year,
+            'business_day': self.business_day,
             'is_active': self.is_active,
             'last_generated': self.last_generated.isoformat() if self.last_generated else None,
+            'next_due_date': self.next_due_date.isoformat() if self.next_due_date else None,
             'created_at': self.created_at.isoformat()
         }
     
     def __repr__(self):
-        return f'<RecurringInvoice {self.name} - Day {self.day_of_month}>'
+        return f'<RecurringInvoice {self.name} - {self.frequency}>'
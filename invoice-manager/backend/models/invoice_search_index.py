@@ -0,0 +1,36 @@
+"""SQLite FTS5 index over invoice text fields, kept in sync by triggers.
+
+The DDL is attached to the ``invoices`` table so ``db.create_all()`` builds
+the index too; Alembic migrations carry their own frozen copy.
+"""
+from sqlalchemy import DDL, event
+
+from models.database import Invoice
+
+INVOICE_FTS_TABLE = 'invoices_fts'
+
+INVOICE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS invoices_fts USING fts5("
+    "name, payment_link, sender, content='invoices', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS invoices_fts_ai AFTER INSERT ON invoices BEGIN "
+    "INSERT INTO invoices_fts(rowid, name, payment_link, sender) "
+    "VALUES (new.id, new.name, new.payment_link, new.sender); END",
+    "CREATE TRIGGER IF NOT EXISTS invoices_fts_ad AFTER DELETE ON invoices BEGIN "
+    "INSERT INTO invoices_fts(invoices_fts, rowid, name, payment_link, sender) "
+    "VALUES ('delete', old.id, old.name, old.payment_link, old.sender); END",
+    "CREATE TRIGGER IF NOT EXISTS invoices_fts_au "
+    "AFTER UPDATE OF name, payment_link, sender ON invoices BEGIN "
+    "INSERT INTO invoices_fts(invoices_fts, rowid, name, payment_link, sender) "
+    "VALUES ('delete', old.id, old.name, old.payment_link, old.sender); "
+    "INSERT INTO invoices_fts(rowid, name, payment_link, sender) "
+    "VALUES (new.id, new.name, new.payment_link, new.sender); END",
+)
+
+for _statement in INVOICE_FTS_DDL:
+    event.listen(Invoice.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+event.listen(
+    Invoice.__table__,
+    'before_drop',
+    DDL('DROP TABLE IF EXISTS invoices_fts').execute_if(dialect='sqlite'),
+)
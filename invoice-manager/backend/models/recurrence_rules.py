@@ -0,0 +1,153 @@
+"""Compiled recurrence rules for recurring invoice templates.
+
+A rule is compiled once per distinct schedule and cached. Occurrences are
+addressed by an integer period index (calendar months for monthly, quarterly
+and yearly rules, ISO weeks for weekly rules) and every period's adjusted
+date is memoized, so generation and long forecasts repeat no calendar math.
+Business-day adjustment moves weekend dates; public holidays are not known.
+"""
+from calendar import monthrange
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+
+FREQUENCIES = ('weekly', 'monthly', 'quarterly', 'yearly')
+BUSINESS_DAY_RULES = ('none', 'following', 'preceding')
+_MONTH_STEPS = {'monthly': 1, 'quarterly': 3, 'yearly': 12}
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """One schedule; ``start`` is the earliest date an occurrence may fall on."""
+
+    frequency: str
+    day_of_month: int | None
+    day_of_week: int
+    month_of_year: int
+    business_day: str
+    start: date
+
+    @property
+    def step(self) -> int:
+        return 1 if self.frequency == 'weekly' else _MONTH_STEPS[self.frequency]
+
+    def occurrence(self, period: int) -> date:
+        return _occurrence(self, period)
+
+    def _period_of(self, value: date) -> int:
+        """Index of the rule period whose calendar span contains ``value``."""
+        if self.frequency == 'weekly':
+            return (value.toordinal() - 1) // 7
+        index = value.year * 12 + value.month - 1
+        phase = (self.month_of_year - 1) % self.step
+        return index - (index - phase) % self.step
+
+    def _first_period_from(self, value: date) -> int:
+        """First period whose occurrence is on or after ``value`` and ``start``."""
+        value = max(value, self.start)
+        # Start one period early: business-day adjustment can pull a date back.
+        period = self._period_of(value) - self.step
+        while self.occurrence(period) < value:
+            period += self.step
+        return period
+
+    def _period_after(self, last_generated: date) -> int:
+        """Period following the one ``last_generated`` was generated for.
+
+        Matches the adjusted occurrence first, so dates moved across a month
+        boundary are attributed to the right period. If the rule changed since,
+        the calendar period containing ``last_generated`` counts as done.
+        """
+        period = self._period_of(last_generated)
+        for candidate in (period - self.step, period, period + self.step):
+            if self.occurrence(candidate) == last_generated:
+                return candidate + self.step
+        return period + self.step
+
+    def _next_period(self, last_generated: date | None) -> int:
+        if last_generated is None:
+            return self._first_period_from(self.start)
+        period = self._period_after(last_generated)
+        while self.occurrence(period) < self.start:
+            period += self.step
+        return period
+
+    def next_due_date(self, last_generated: date | None) -> date:
+        """First due date not covered by ``last_generated``."""
+        return self.occurrence(self._next_period(last_generated))
+
+    def due_dates_until(self, last_generated: date | None, end: date) -> list[date]:
+        """Ungenerated due dates up to and including ``end``."""
+        due_dates = []
+        period = self._next_period(last_generated)
+        while (due_date := self.occurrence(period)) <= end:
+            due_dates.append(due_date)
+            period += self.step
+        return due_dates
+
+    def occurrences_between(self, start: date, end: date) -> list[date]:
+        """Due dates in ``[start, end)``."""
+        due_dates = []
+        period = self._first_period_from(start)
+        while (due_date := self.occurrence(period)) < end:
+            due_dates.append(due_date)
+            period += self.step
+        return due_dates
+
+    def next_occurrences(self, from_date: date, count: int) -> list[date]:
+        """The next ``count`` due dates on or after ``from_date``."""
+        period = self._first_period_from(from_date)
+        return [self.occurrence(period + index * self.step) for index in range(max(0, count))]
+
+
+@lru_cache(maxsize=65536)
+def _occurrence(rule: RecurrenceRule, period: int) -> date:
+    if rule.frequency == 'weekly':
+        nominal = date.fromordinal(period * 7 + 1 + rule.day_of_week)
+    else:
+        year, month_index = divmod(period, 12)
+        last_day = monthrange(year, month_index + 1)[1]
+        nominal = date(year, month_index + 1, min(rule.day_of_month, last_day))
+
+    if rule.business_day == 'following':
+        while nominal.weekday() >= 5:
+            nominal += timedelta(days=1)
+    elif rule.business_day == 'preceding':
+        while nominal.weekday() >= 5:
+            nominal -= timedelta(days=1)
+    return nominal
+
+
+@lru_cache(maxsize=4096)
+def compile_rule(
+    frequency: str,
+    day_of_month: int | None,
+    day_of_week: int | None,
+    month_of_year: int | None,
+    business_day: str,
+    start: date,
+) -> RecurrenceRule:
+    """Build (or reuse) the rule for a schedule; unset anchors default to ``start``."""
+    if frequency not in FREQUENCIES:
+        raise ValueError(f'Unknown recurrence frequency: {frequency}')
+    weekly = frequency == 'weekly'
+    return RecurrenceRule(
+        frequency=frequency,
+        day_of_month=None if weekly else day_of_month,
+        day_of_week=(start.weekday() if day_of_week is None else day_of_week) if weekly else 0,
+        month_of_year=1 if frequency in ('weekly', 'monthly') else (month_of_year or start.month),
+        business_day=business_day or 'none',
+        start=start,
+    )
+
+
+def rule_for_template(template) -> RecurrenceRule:
+    """Compiled rule of a ``RecurringInvoice`` (anchored at its creation date)."""
+    return compile_rule(
+        template.frequency or 'monthly',
+        template.day_of_month,
+        template.day_of_week,
+        template.month_of_year,
+        template.business_day or 'none',
+        template.created_at.date(),
+    )
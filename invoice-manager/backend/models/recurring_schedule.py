@@ -0,0 +1,26 @@
+"""``RecurringInvoice.next_due_date`` maintenance hooks.
+
+``next_due_date`` is the first due date that has not been generated yet.
+Mapper events recompute it from the template's compiled recurrence rule
+whenever a template is inserted or updated, so every write path (API,
+generator, tests) keeps it in sync and scheduler runs can select due
+templates through an index.
+"""
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+
+from models.database import RecurringInvoice
+from models.recurrence_rules import rule_for_template
+
+
+@event.listens_for(RecurringInvoice, 'before_insert')
+@event.listens_for(RecurringInvoice, 'before_update')
+def _refresh_next_due_date(_mapper, _connection, target):
+    if target.created_at is None:
+        target.created_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    if target.frequency is None:
+        target.frequency = 'monthly'
+    if target.business_day is None:
+        target.business_day = 'none'
+    target.next_due_date = rule_for_template(target).next_due_date(target.last_generated)
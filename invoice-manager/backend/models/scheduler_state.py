@@ -0,0 +1,113 @@
+"""
+Shared scheduler state and run history, so every worker process sees the same status.
+"""
+from extensions import db
+
+
+class SchedulerLease(db.Model):
+    """Time-limited leader lease for a background job.
+
+    The holder renews the lease on every tick; when it stops renewing (the
+    process died), the lease expires and another worker takes over.
+    """
+
+    __tablename__ = 'scheduler_leases'
+
+    name = db.Column(db.String(64), primary_key=True)
+    holder = db.Column(db.String(128), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f'<SchedulerLease {self.name} held by {self.holder}>'
+
+
+class RecurringRunState(db.Model):
+    """Single-row summary of the latest recurring generation run."""
+
+    __tablename__ = 'recurring_run_state'
+
+    id = db.Column(db.Integer, primary_key=True)
+    total_runs = db.Column(db.Integer, default=0, nullable=False)
+    last_run_at = db.Column(db.DateTime, nullable=True)
+    last_run_date = db.Column(db.Date, nullable=True)
+    last_result = db.Column(db.JSON, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    last_holder = db.Column(db.String(128), nullable=True)
+    # Resume point of an interrupted chunked run: last committed template id.
+    checkpoint_run_date = db.Column(db.Date, nullable=True)
+    checkpoint_template_id = db.Column(db.Integer, nullable=True)
+
+    def to_dict(self):
+        """Convert to dictionary."""
+        checkpoint = None
+        if self.checkpoint_run_date is not None:
+            checkpoint = {
+                'run_date': self.checkpoint_run_date.isoformat(),
+                'template_id': self.checkpoint_template_id,
+            }
+        return {
+            'total_runs': self.total_runs,
+            'last_run_at': self.last_run_at.isoformat() if self.last_run_at else None,
+            'last_run_date': self.last_run_date.isoformat() if self.last_run_date else None,
+            'last_result': self.last_result,
+            'last_error': self.last_error,
+            'last_holder': self.last_holder,
+            'checkpoint': checkpoint,
+        }
+
+    def __repr__(self):
+        return f'<RecurringRunState runs={self.total_runs}>'
+
+
+class RecurringRun(db.Model):
+    """History of recurring generation runs with per-phase timings."""
+
+    __tablename__ = 'recurring_runs'
+    __table_args__ = (
+        db.Index('ix_recurring_runs_started_at', 'started_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    run_date = db.Column(db.Date, nullable=False)
+    started_at = db.Column(db.DateTime, nullable=False)
+    finished_at = db.Column(db.DateTime, nullable=False)
+    duration_ms = db.Column(db.Float, nullable=False)
+    status = db.Column(db.String(16), nullable=False)  # success | error
+    error = db.Column(db.Text, nullable=True)
+    holder = db.Column(db.String(128), nullable=True)
+    generated = db.Column(db.Integer, nullable=True)
+    skipped_existing = db.Column(db.Integer, nullable=True)
+    skipped_paused = db.Column(db.Integer, nullable=True)
+    skipped_not_due = db.Column(db.Integer, nullable=True)
+    processed_templates = db.Column(db.Integer, nullable=True)
+    template_scan_ms = db.Column(db.Float, nullable=True)
+    existence_check_ms = db.Column(db.Float, nullable=True)
+    insert_ms = db.Column(db.Float, nullable=True)
+    commit_ms = db.Column(db.Float, nullable=True)
+
+    def to_dict(self):
+        """Convert to dictionary."""
+        return {
+            'id': self.id,
+            'run_date': self.run_date.isoformat(),
+            'started_at': self.started_at.isoformat(),
+            'finished_at': self.finished_at.isoformat(),
+            'duration_ms': self.duration_ms,
+            'status': self.status,
+            'error': self.error,
+            'holder': self.holder,
+            'generated': self.generated,
+            'skipped_existing': self.skipped_existing,
+            'skipped_paused': self.skipped_paused,
+            'skipped_not_due': self.skipped_not_due,
+            'processed_templates': self.processed_templates,
+            'timings_ms': {
+                'template_scan': self.template_scan_ms,
+                'existence_check': self.existence_check_ms,
+                'insert': self.insert_ms,
+                'commit': self.commit_ms,
+            },
+        }
+
+    def __repr__(self):
+        return f'<RecurringRun {self.run_date} {self.status}>'
@@ -0,0 +1,16 @@
+"""
+Per-table change counters shared by every worker process through the database.
+"""
+from extensions import db
+
+
+class TableVersion(db.Model):
+    """Change version of one table, bumped in the transaction that writes it."""
+
+    __tablename__ = 'table_versions'
+
+    table_name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f'<TableVersion {self.table_name}={self.version}>'
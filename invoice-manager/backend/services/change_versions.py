@@ -0,0 +1,110 @@
+"""Per-table change versions bumped from SQLAlchemy session events.
+
+Versions live in the ``table_versions`` table and are incremented inside the
+transaction that writes the tracked table, so every worker process sees the
+same counter and a rolled-back write never bumps it. List endpoints derive
+their ETags from these counters, which costs one primary-key lookup instead
+of running the list query.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Iterable
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session
+
+from extensions import db
+from models.table_versions import TableVersion
+from services.conflict_insert import insert_ignoring_conflicts
+
+_PENDING_KEY = "changed_tables"
+_VERSION_TABLE = TableVersion.__tablename__
+_lock = threading.Lock()
+_installed = False
+
+
+def _pending(session: Session) -> set[str]:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+def _track(session: Session, table_name: str | None) -> None:
+    if table_name and table_name != _VERSION_TABLE:
+        _pending(session).add(table_name)
+
+
+def _after_flush(session: Session, _flush_context) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        _track(session, getattr(obj, "__tablename__", None))
+
+
+def _do_orm_execute(orm_execute_state) -> None:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None:
+        _track(orm_execute_state.session, table.name)
+
+
+def _before_commit(session: Session) -> None:
+    session.flush()  # collect tables from objects still pending in the unit of work
+    changed = session.info.pop(_PENDING_KEY, None)
+    if changed:
+        bump_versions(session, changed)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def init_change_tracking() -> None:
+    """Install session listeners once per process."""
+    global _installed
+    with _lock:
+        if _installed:
+            return
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "do_orm_execute", _do_orm_execute)
+        event.listen(Session, "before_commit", _before_commit)
+        event.listen(Session, "after_rollback", _after_rollback)
+        _installed = True
+
+
+def bump_versions(session: Session, tables: Iterable[str]) -> None:
+    """Advance the change version of each given table in ``session``'s transaction."""
+    table = TableVersion.__table__
+    for name in sorted(tables):
+        bumped = session.execute(
+            update(table).where(table.c.table_name == name).values(version=table.c.version + 1)
+        )
+        if bumped.rowcount:
+            continue
+        stmt = insert_ignoring_conflicts(table, ["table_name"])
+        if stmt is None:
+            stmt = insert(table)
+        created = session.execute(stmt.values(table_name=name, version=1))
+        if created.rowcount == 0:  # a concurrent writer created the row first
+            session.execute(
+                update(table).where(table.c.table_name == name).values(version=table.c.version + 1)
+            )
+
+
+def get_versions(tables: Iterable[str]) -> dict[str, int]:
+    """Return the committed change version of each table (0 if never written)."""
+    names = list(tables)
+    table = TableVersion.__table__
+    rows = db.session.execute(
+        select(table.c.table_name, table.c.version).where(table.c.table_name.in_(names))
+    ).all()
+    stored = dict(rows)
+    return {name: stored.get(name, 0) for name in names}
+
+
+def make_etag(tables: Iterable[str], variant: str = "") -> str:
+    """Build an opaque tag from the table versions and a request ``variant``."""
+    parts = "-".join(f"{table}.{version}" for table, version in get_versions(tables).items())
+    if not variant:
+        return parts
+    return f"{parts}-{hashlib.sha1(variant.encode('utf-8')).hexdigest()[:12]}"
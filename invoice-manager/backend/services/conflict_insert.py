@@ -0,0 +1,24 @@
+"""Dialect-aware ``INSERT ... ON CONFLICT DO NOTHING`` statements."""
+
+from __future__ import annotations
+
+from sqlalchemy import Table
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.sql.dml import Insert
+
+from extensions import db
+
+_CONFLICT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+def insert_ignoring_conflicts(table: Table, index_elements: list[str]) -> Insert | None:
+    """Return an insert that skips rows violating the given unique index.
+
+    Returns ``None`` when the bound dialect has no ``ON CONFLICT`` support,
+    so callers can fall back to filtering existing rows up front.
+    """
+    dialect_insert = _CONFLICT_INSERTS.get(db.session.get_bind().dialect.name)
+    if dialect_insert is None:
+        return None
+    return dialect_insert(table).on_conflict_do_nothing(index_elements=index_elements)
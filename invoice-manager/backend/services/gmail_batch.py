@@ -0,0 +1,125 @@
+"""Batched Gmail message fetching over the HTTP batch endpoint.
+
+One batch request carries up to ``GMAIL_BATCH_SIZE`` ``messages.get`` calls,
+so a sync costs a few round-trips instead of one per message. Sub-requests
+that fail with a rate-limit or server error are retried in a new batch with
+exponential backoff; other failures are reported per message.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+import httplib2
+from flask import current_app
+from googleapiclient.errors import HttpError
+
+# Gmail rejects batches with more than 100 calls.
+MAX_BATCH_SIZE = 100
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class BatchFetchResult:
+    messages: dict[str, dict[str, Any]] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    # Failed ids whose last error was transient; permanent errors (404, 410) are not retried later.
+    retryable: set[str] = field(default_factory=set)
+    batches: int = 0
+    retried: int = 0
+
+
+def _http_status(exc: HttpError) -> int | None:
+    # BatchError (a malformed batch response) may carry no response at all.
+    return getattr(exc.resp, "status", None)
+
+
+def _describe(exc: Exception) -> str:
+    if isinstance(exc, HttpError) and _http_status(exc) is not None:
+        return f"HTTP {_http_status(exc)}: {exc.reason}"
+    return str(exc) or exc.__class__.__name__
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, HttpError):
+        return _http_status(exc) in RETRYABLE_STATUSES
+    return True
+
+
+def _execute_chunk(gmail, message_ids: list[str], request_kwargs: dict[str, Any], result: BatchFetchResult) -> list[str]:
+    """Send one batch; return the ids whose sub-request should be retried."""
+    retry: list[str] = []
+
+    def on_response(request_id: str, response: dict[str, Any], exception: Exception | None) -> None:
+        if exception is None:
+            result.messages[request_id] = response
+            result.errors.pop(request_id, None)
+            result.retryable.discard(request_id)
+            return
+        result.errors[request_id] = _describe(exception)
+        if _is_retryable(exception):
+            retry.append(request_id)
+            result.retryable.add(request_id)
+        else:
+            result.retryable.discard(request_id)
+
+    batch = gmail.new_batch_http_request(callback=on_response)
+    for message_id in message_ids:
+        batch.add(
+            gmail.users().messages().get(userId="me", id=message_id, **request_kwargs),
+            request_id=message_id,
+        )
+    result.batches += 1
+    try:
+        batch.execute()
+    except (HttpError, OSError, httplib2.HttpLib2Error) as exc:
+        # The batch request itself failed: no sub-request was answered.
+        unanswered = [message_id for message_id in message_ids if message_id not in result.messages]
+        for message_id in unanswered:
+            result.errors[message_id] = _describe(exc)
+        if not _is_retryable(exc):
+            result.retryable.difference_update(unanswered)
+            return []
+        result.retryable.update(unanswered)
+        return unanswered
+    return retry
+
+
+def fetch_messages(
+    gmail,
+    message_ids: Iterable[str],
+    message_format: str = "full",
+    fields: str | None = None,
+    metadata_headers: list[str] | None = None,
+    chunk_size: int | None = None,
+    max_retries: int | None = None,
+) -> BatchFetchResult:
+    """Fetch messages with batched ``messages.get`` calls, retrying transient failures."""
+    config = current_app.config
+    chunk_size = max(1, min(int(chunk_size or config.get("GMAIL_BATCH_SIZE", 50)), MAX_BATCH_SIZE))
+    if max_retries is None:
+        max_retries = int(config.get("GMAIL_BATCH_MAX_RETRIES", 2))
+    backoff_seconds = float(config.get("GMAIL_BATCH_RETRY_BACKOFF_SECONDS", 1.0))
+
+    request_kwargs: dict[str, Any] = {"format": message_format}
+    if fields:
+        request_kwargs["fields"] = fields
+    if metadata_headers:
+        request_kwargs["metadataHeaders"] = metadata_headers
+
+    result = BatchFetchResult()
+    pending = list(dict.fromkeys(message_ids))
+    attempt = 0
+    while pending:
+        retry: list[str] = []
+        for start in range(0, len(pending), chunk_size):
+            retry.extend(_execute_chunk(gmail, pending[start:start + chunk_size], request_kwargs, result))
+        if not retry or attempt >= max_retries:
+            break
+        time.sleep(backoff_seconds * (2 ** attempt))
+        attempt += 1
+        result.retried += len(retry)
+        pending = retry
+    return result
@@ -0,0 +1,45 @@
+"""Cheap local classifier that picks messages worth a full download.
+
+It runs on ``format="metadata"`` responses (Subject/From/Date headers, the
+snippet and the top-level MIME type) and errs towards downloading: a message
+is dropped only when nothing in its metadata hints at an invoice.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Any
+
+from services.gmail_parsing import extract_header
+
+METADATA_HEADERS = ["Subject", "From", "Date", "Message-ID"]
+# Partial response: what the classifier, the previews and the incremental
+# membership check (labels, Message-ID, ordering) need.
+METADATA_FIELDS = "id,threadId,labelIds,internalDate,snippet,payload(mimeType,headers)"
+
+_KEYWORD_RE = re.compile(
+    r"(szamla|invoice|dijbekero|fizetesi|befizet|esedekes|hatarido|payment|billing|"
+    r"due date|amount due|to pay|fizetendo|vegosszeg)"
+)
+_CURRENCY_AMOUNT_RE = re.compile(r"\d[\d .,]*\s*(huf|ft|eur|usd|€|\$)|(€|\$)\s*\d")
+_SENDER_RE = re.compile(r"(billing|invoice|szamla|payment|fizetes|accounting|konyveles)")
+
+
+def _normalize(text: str) -> str:
+    """Lower-case and strip accents, so "Számla" matches "szamla"."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+
+def is_invoice_candidate(message: dict[str, Any]) -> bool:
+    """True when a metadata-only message may be an invoice."""
+    payload = message.get("payload") or {}
+    headers = payload.get("headers")
+    text = _normalize(f"{extract_header(headers, 'Subject')}\n{message.get('snippet', '')}")
+    if _KEYWORD_RE.search(text) or _CURRENCY_AMOUNT_RE.search(text):
+        return True
+    if _SENDER_RE.search(_normalize(extract_header(headers, "From"))):
+        return True
+    # multipart/mixed usually means attachments, such as a PDF invoice.
+    return str(payload.get("mimeType", "")).lower() == "multipart/mixed"
@@ -0,0 +1,65 @@
+"""Process-wide cache of authorized Gmail clients, one entry per account."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import threading
+from typing import Any
+
+
+@dataclass
+class CachedGmailClient:
+    """Built Gmail service plus the credentials object its HTTP layer signs with."""
+
+    fingerprint: str
+    credentials: Any
+    service: Any
+
+
+def credentials_fingerprint(credentials_json: str | None) -> str:
+    """Stable digest of the stored account JSON; any change invalidates the entry."""
+    return hashlib.sha256((credentials_json or "").encode("utf-8")).hexdigest()
+
+
+class GmailClientCache:
+    """Thread-safe map of account id to built client.
+
+    A googleapiclient service is not safe to share between threads, so callers
+    must hold the account's sync lock while using the returned client.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, CachedGmailClient] = {}
+        self._lock = threading.Lock()
+
+    def get(self, account_id: int, credentials_json: str | None) -> CachedGmailClient | None:
+        fingerprint = credentials_fingerprint(credentials_json)
+        with self._lock:
+            entry = self._entries.get(account_id)
+            if entry is None:
+                return None
+            if entry.fingerprint != fingerprint:
+                del self._entries[account_id]
+                return None
+            return entry
+
+    def put(self, account_id: int, credentials_json: str | None, credentials: Any, service: Any) -> None:
+        entry = CachedGmailClient(credentials_fingerprint(credentials_json), credentials, service)
+        with self._lock:
+            self._entries[account_id] = entry
+
+    def invalidate(self, account_id: int | None = None) -> None:
+        """Drop one account's client, or every client when no id is given."""
+        with self._lock:
+            if account_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(account_id, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+gmail_client_cache = GmailClientCache()
@@ -0,0 +1,57 @@
+"""Set-based import of parsed Gmail messages as invoices."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import insert as generic_insert
+
+from extensions import db
+from models.database import GmailAccount, Invoice
+from services.conflict_insert import insert_ignoring_conflicts
+
+
+def _insert_ignoring_duplicates(rows: list[dict[str, Any]]) -> list[int]:
+    """Insert rows, skipping (account, message id) pairs that already exist."""
+    stmt = insert_ignoring_conflicts(Invoice.__table__, ["gmail_account_id", "gmail_message_id"])
+    if stmt is None:
+        # No ON CONFLICT support: drop already-imported ids up front instead.
+        existing = {
+            (account_id, message_id)
+            for account_id, message_id in db.session.query(Invoice.gmail_account_id, Invoice.gmail_message_id)
+            .filter(Invoice.gmail_message_id.in_([row["gmail_message_id"] for row in rows]))
+        }
+        rows = [row for row in rows if (row["gmail_account_id"], row["gmail_message_id"]) not in existing]
+        if not rows:
+            return []
+        stmt = generic_insert(Invoice.__table__)
+    return list(db.session.execute(stmt.values(rows).returning(Invoice.id)).scalars())
+
+
+def import_gmail_invoices(account: GmailAccount, candidates: list[dict[str, Any]]) -> tuple[list[Invoice], int]:
+    """Insert candidate invoices in one statement; return (imported, duplicates).
+
+    Each candidate needs ``gmail_message_id``, ``name``, ``amount``,
+    ``currency``, ``due_date``, ``payment_link`` and ``sender``. Dedupe is
+    enforced by the unique (gmail_account_id, gmail_message_id) index.
+    """
+    if not candidates:
+        return [], 0
+
+    created_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows = [
+        {
+            **candidate,
+            "gmail_account_id": account.id,
+            "paid": False,
+            "is_recurring": False,
+            "created_at": created_at,
+        }
+        for candidate in candidates
+    ]
+    inserted_ids = _insert_ignoring_duplicates(rows)
+    imported = []
+    if inserted_ids:
+        imported = Invoice.query.filter(Invoice.id.in_(inserted_ids)).order_by(Invoice.id).all()
+    return imported, len(candidates) - len(inserted_ids)
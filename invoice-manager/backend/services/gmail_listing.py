@@ -0,0 +1,170 @@
+"""Selecting the Gmail messages a sync looks at.
+
+A full sync lists the account's search query. Once a sync has stored the
+mailbox ``historyId``, later syncs read ``users.history.list`` and fetch the
+metadata of the messages added (or labelled) since then directly; Gmail
+expires old history ids with a 404, in which case a full sync runs instead.
+"""
+
+from __future__ import annotations
+
+from googleapiclient.errors import HttpError
+
+from services.gmail_batch import BatchFetchResult, fetch_messages
+from services.gmail_classifier import METADATA_FIELDS, METADATA_HEADERS
+from services.gmail_parsing import extract_header
+
+LIST_PAGE_SIZE = 25
+HISTORY_TYPES = ["messageAdded", "labelAdded"]
+# Larger change sets (e.g. after weeks offline) are cheaper to re-list than to fetch.
+MAX_INCREMENTAL_CHANGES = 500
+# rfc822msgid: terms per membership search, keeping the query string short.
+MEMBERSHIP_CHUNK_SIZE = 20
+# messages.list never returns these (includeSpamTrash=False), so neither do we.
+EXCLUDED_LABEL_IDS = frozenset({"SPAM", "TRASH"})
+
+
+class HistoryExpiredError(Exception):
+    """The stored history id is no longer available; a full sync is needed."""
+
+
+def current_history_id(gmail) -> str | None:
+    """Latest mailbox history id (read before listing, so no new mail is skipped)."""
+    history_id = gmail.users().getProfile(userId="me").execute().get("historyId")
+    return str(history_id) if history_id else None
+
+
+def list_message_refs(gmail, query: str, limit: int) -> list[dict[str, str]]:
+    """Newest ``limit`` message references matching ``query``."""
+    refs: list[dict[str, str]] = []
+    page_token = None
+    while len(refs) < limit:
+        response = (
+            gmail.users()
+            .messages()
+            .list(
+                userId="me",
+                q=query,
+                maxResults=min(LIST_PAGE_SIZE, limit - len(refs)),
+                includeSpamTrash=False,
+                pageToken=page_token,
+            )
+            .execute()
+        )
+        refs.extend(response.get("messages", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+    return refs
+
+
+def list_changed_message_ids(gmail, start_history_id: str) -> tuple[set[str], str]:
+    """Ids of messages added or labelled after ``start_history_id``, plus the new history id."""
+    changed: set[str] = set()
+    latest = start_history_id
+    page_token = None
+    while True:
+        try:
+            response = (
+                gmail.users()
+                .history()
+                .list(
+                    userId="me",
+                    startHistoryId=start_history_id,
+                    historyTypes=HISTORY_TYPES,
+                    pageToken=page_token,
+                )
+                .execute()
+            )
+        except HttpError as exc:
+            if getattr(exc.resp, "status", None) == 404:
+                raise HistoryExpiredError(start_history_id) from exc
+            raise
+        for record in response.get("history", []):
+            for item in record.get("messagesAdded", []) + record.get("labelsAdded", []):
+                message_id = (item.get("message") or {}).get("id")
+                if message_id:
+                    changed.add(message_id)
+        latest = str(response.get("historyId") or latest)
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return changed, latest
+
+
+def filter_ids_matching_query(gmail, query: str, rfc822_ids: dict[str, str]) -> set[str]:
+    """Gmail ids among ``rfc822_ids`` (Gmail id -> Message-ID) that match ``query``.
+
+    The query is narrowed to the given ``rfc822msgid:`` values, so Gmail
+    evaluates the label and search filters exactly while the result size
+    follows the changed messages rather than the mailbox.
+    """
+    matched: set[str] = set()
+    items = list(rfc822_ids.items())
+    for start in range(0, len(items), MEMBERSHIP_CHUNK_SIZE):
+        chunk = dict(items[start:start + MEMBERSHIP_CHUNK_SIZE])
+        id_terms = " OR ".join(f"rfc822msgid:{rfc822_id}" for rfc822_id in chunk.values())
+        scoped = f"({query}) ({id_terms})" if query else id_terms
+        # A Message-ID can repeat across copies of one mail, so allow extra refs.
+        matched.update(ref["id"] for ref in list_message_refs(gmail, scoped, 2 * len(chunk)) if ref["id"] in chunk)
+    return matched
+
+
+def _changed_refs_in_query(
+    gmail,
+    query: str,
+    metadata: BatchFetchResult,
+    limit: int,
+) -> list[dict[str, str]] | None:
+    """Newest ``limit`` changed messages inside ``query``; ``None`` if one cannot be checked."""
+    rfc822_ids: dict[str, str] = {}
+    for message_id, message in metadata.messages.items():
+        if EXCLUDED_LABEL_IDS.intersection(message.get("labelIds") or []):
+            continue
+        headers = (message.get("payload") or {}).get("headers")
+        rfc822_id = extract_header(headers, "Message-ID").strip().strip("<>")
+        if not rfc822_id or " " in rfc822_id:
+            return None
+        rfc822_ids[message_id] = rfc822_id
+
+    matched = filter_ids_matching_query(gmail, query, rfc822_ids) if rfc822_ids else set()
+    newest = sorted(matched, key=lambda message_id: int(metadata.messages[message_id].get("internalDate") or 0))
+    return [{"id": message_id} for message_id in reversed(newest[-limit:])]
+
+
+def select_message_refs(
+    gmail,
+    history_id: str | None,
+    query: str,
+    limit: int,
+    incremental: bool,
+) -> tuple[list[dict[str, str]], str | None, str, BatchFetchResult | None]:
+    """Return (message refs, history id to store, sync mode, prefetched metadata).
+
+    An incremental sync never lists the whole query: changed messages are
+    fetched in one metadata batch, spam/trash is dropped by ``labelIds`` and
+    a search scoped to their Message-IDs checks label and query membership.
+    The metadata is returned so the prefilter does not download it again.
+    """
+    if incremental and history_id:
+        try:
+            changed_ids, latest_history_id = list_changed_message_ids(gmail, history_id)
+        except HistoryExpiredError:
+            pass
+        else:
+            if not changed_ids:
+                return [], latest_history_id, "incremental", None
+            if len(changed_ids) <= MAX_INCREMENTAL_CHANGES:
+                metadata = fetch_messages(
+                    gmail,
+                    sorted(changed_ids),
+                    message_format="metadata",
+                    fields=METADATA_FIELDS,
+                    metadata_headers=METADATA_HEADERS,
+                )
+                refs = _changed_refs_in_query(gmail, query, metadata, limit)
+                if refs is not None:
+                    return refs, latest_history_id, "incremental", metadata
+            return list_message_refs(gmail, query, limit), latest_history_id, "full", None
+
+    latest_history_id = current_history_id(gmail) if incremental else None
+    return list_message_refs(gmail, query, limit), latest_history_id, "full", None
@@ -0,0 +1,167 @@
+"""Parsing helpers that turn Gmail message payloads into invoice fields."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import re
+from datetime import date
+from typing import Any
+
+from dateutil import parser as date_parser
+
+URL_RE = re.compile(r"https?://", re.IGNORECASE)
+INVOICE_HINT_RE = re.compile(r"(szamla|invoice|fizetesi link|payment link)", re.IGNORECASE)
+_AMOUNT_RE = re.compile(
+    r"(?<!\d)(\d{1,3}(?:[ .]\d{3})+|\d+)(?:[,.](\d{1,2}))?\s*(HUF|Ft|EUR|USD)?",
+    re.IGNORECASE,
+)
+_PAYMENT_LINK_RE = re.compile(r"https?://[^\s<>\"]+", re.IGNORECASE)
+_DUE_DATE_KEYWORD_RE = re.compile(r"(hatarido|esedekes|fizetesi hatarido|due date)", re.IGNORECASE)
+_AMOUNT_HINT_RE = re.compile(r"(fizetendo|osszeg|vegosszeg|total|amount|to pay)", re.IGNORECASE)
+_ISO_DATE_RE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_LOCAL_DATE_RE = re.compile(r"\b(\d{1,2})[./-](\d{1,2})[./-](\d{4})\b")
+
+
+def extract_header(headers: list[dict[str, str]] | None, name: str) -> str:
+    if not headers:
+        return ""
+    lower_name = name.lower()
+    for header in headers:
+        if str(header.get("name", "")).lower() == lower_name:
+            return str(header.get("value", ""))
+    return ""
+
+
+def _decode_part_data(encoded: str | None) -> str:
+    if not encoded:
+        return ""
+    try:
+        padded = encoded + "=" * (-len(encoded) % 4)
+        return base64.urlsafe_b64decode(padded.encode("utf-8")).decode("utf-8", errors="ignore")
+    except (ValueError, binascii.Error):
+        return ""
+
+
+def extract_body_text(payload: dict[str, Any]) -> str:
+    body_texts: list[str] = []
+
+    def visit(part: dict[str, Any]):
+        mime_type = str(part.get("mimeType", "")).lower()
+        body_data = _decode_part_data((part.get("body") or {}).get("data"))
+        if mime_type == "text/plain" and body_data:
+            body_texts.append(body_data)
+        elif mime_type == "text/html" and body_data and not body_texts:
+            html_as_text = re.sub(r"<[^>]+>", " ", body_data)
+            body_texts.append(re.sub(r"\s+", " ", html_as_text))
+
+        for child in part.get("parts", []) or []:
+            visit(child)
+
+    visit(payload)
+    return "\n".join(t for t in body_texts if t).strip()
+
+
+def extract_payment_link(text: str) -> str | None:
+    for match in _PAYMENT_LINK_RE.findall(text):
+        url = match.strip().rstrip(".,)")
+        if any(key in url.lower() for key in ("pay", "payment", "fizet", "stripe", "paypal", "simplepay", "barion", "revolut")):
+            return url
+    fallback = _PAYMENT_LINK_RE.search(text)
+    return fallback.group(0).strip().rstrip(".,)") if fallback else None
+
+
+def extract_amount_and_currency(text: str) -> tuple[float | None, str]:
+    candidates: list[tuple[float, str, int]] = []
+    for line in text.splitlines():
+        has_hint = bool(_AMOUNT_HINT_RE.search(line))
+        for match in _AMOUNT_RE.finditer(line):
+            int_part, decimal_part, currency = match.groups()
+            normalized_int = int_part.replace(" ", "").replace(".", "")
+            if not normalized_int.isdigit():
+                continue
+            amount = float(normalized_int)
+            if decimal_part:
+                amount = amount + float(f"0.{decimal_part}")
+            if amount <= 0:
+                continue
+
+            # Filter common year-like false positives when no currency is present.
+            if currency is None and amount < 100:
+                continue
+            if currency is None and 1900 <= amount <= 2100:
+                continue
+
+            normalized_currency = (currency or "HUF").upper()
+            if normalized_currency == "FT":
+                normalized_currency = "HUF"
+            score = 10 if has_hint else 1
+            if currency:
+                score += 5
+            candidates.append((amount, normalized_currency, score))
+
+    if not candidates:
+        return None, "HUF"
+    best = max(candidates, key=lambda item: (item[2], item[0]))
+    return best[0], best[1]
+
+
+def extract_due_date(text: str) -> date | None:
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    candidate_lines = [line for line in lines if _DUE_DATE_KEYWORD_RE.search(line)]
+    search_pool = candidate_lines if candidate_lines else lines[:20]
+
+    for line in search_pool:
+        iso = _ISO_DATE_RE.search(line)
+        if iso:
+            try:
+                return date(int(iso.group(1)), int(iso.group(2)), int(iso.group(3)))
+            except ValueError:
+                pass
+        local = _LOCAL_DATE_RE.search(line)
+        if local:
+            try:
+                return date(int(local.group(3)), int(local.group(2)), int(local.group(1)))
+            except ValueError:
+                pass
+        try:
+            parsed = date_parser.parse(line, dayfirst=True, fuzzy=True)
+            if parsed:
+                return parsed.date()
+        except (ValueError, OverflowError):
+            pass
+    return None
+
+
+def build_invoice_name(subject: str, sender: str) -> str:
+    clean_subject = (subject or "").strip()
+    if clean_subject:
+        return clean_subject[:255]
+    clean_sender = (sender or "").strip()
+    if clean_sender:
+        return f"Gmail invoice - {clean_sender}"[:255]
+    return "Gmail invoice"
+
+
+def analyze_message(msg: dict[str, Any]) -> tuple[dict[str, Any], date | None]:
+    """Preview fields and invoice guesses of a full message, plus its due date guess."""
+    payload = msg.get("payload", {})
+    headers = payload.get("headers", [])
+    subject = extract_header(headers, "Subject")
+    snippet = msg.get("snippet", "")
+    combined_text = f"{subject}\n{snippet}\n{extract_body_text(payload)}".strip()
+    amount, currency = extract_amount_and_currency(combined_text)
+    preview = {
+        "id": msg.get("id"),
+        "thread_id": msg.get("threadId"),
+        "subject": subject,
+        "from": extract_header(headers, "From"),
+        "date": extract_header(headers, "Date"),
+        "snippet": snippet,
+        "has_payment_link": bool(URL_RE.search(combined_text)),
+        "has_invoice_hint": bool(INVOICE_HINT_RE.search(combined_text)),
+        "amount_guess": amount,
+        "currency_guess": currency,
+        "payment_link_guess": extract_payment_link(combined_text),
+    }
+    return preview, extract_due_date(combined_text)
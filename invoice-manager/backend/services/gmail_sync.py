@@ -0,0 +1,154 @@
+"""Gmail sync: select messages, fetch them and import parsed invoices."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from flask import current_app
+
+from extensions import db
+from models.database import GmailAccount
+from services.gmail_batch import BatchFetchResult, fetch_messages
+from services.gmail_classifier import METADATA_FIELDS, METADATA_HEADERS, is_invoice_candidate
+from services.gmail_filters import extract_filter_settings
+from services.gmail_import import import_gmail_invoices
+from services.gmail_listing import select_message_refs
+from services.gmail_parsing import analyze_message, build_invoice_name
+from services.gmail_service import build_gmail_client
+
+
+def _build_effective_query(label_name: str, gmail_query: str) -> str:
+    safe_label = label_name.replace('"', "")
+    label_query = f'label:"{safe_label}"' if safe_label else ""
+    if label_query and gmail_query:
+        return f"({label_query}) ({gmail_query})"
+    return label_query or gmail_query
+
+
+def _merge_fetch_counts(into: BatchFetchResult, other: BatchFetchResult) -> BatchFetchResult:
+    into.errors = {**other.errors, **into.errors}
+    into.retryable |= other.retryable
+    into.batches += other.batches
+    into.retried += other.retried
+    return into
+
+
+def _fetch_invoice_messages(
+    gmail,
+    message_ids: list[str],
+    metadata: BatchFetchResult | None = None,
+) -> tuple[BatchFetchResult, int]:
+    """Fetch full payloads of likely invoices; return them and the skipped count.
+
+    With ``GMAIL_METADATA_PREFILTER`` a first pass downloads only headers and
+    snippets (or reuses ``metadata`` an incremental selection already fetched),
+    and messages the local classifier rejects are never downloaded in full.
+    Errors and batch counts of both passes are combined.
+    """
+    if not current_app.config.get("GMAIL_METADATA_PREFILTER", True):
+        fetched = fetch_messages(gmail, message_ids)
+        return (_merge_fetch_counts(fetched, metadata) if metadata else fetched), 0
+    if metadata is None:
+        if not message_ids:
+            return BatchFetchResult(), 0
+        metadata = fetch_messages(
+            gmail,
+            message_ids,
+            message_format="metadata",
+            fields=METADATA_FIELDS,
+            metadata_headers=METADATA_HEADERS,
+        )
+    available = [message_id for message_id in message_ids if message_id in metadata.messages]
+    candidates = [message_id for message_id in available if is_invoice_candidate(metadata.messages[message_id])]
+    fetched = fetch_messages(gmail, candidates)
+    return _merge_fetch_counts(fetched, metadata), len(available) - len(candidates)
+
+
+def sync_account_messages(account: GmailAccount, max_results: int = 50, import_invoices: bool = True) -> dict[str, Any]:
+    """Run Gmail sync and optionally import parsed messages as normal invoices.
+
+    Importing syncs are incremental once a previous sync stored the mailbox
+    history id; preview syncs (``import_invoices=False``) always list the query.
+    """
+    gmail = build_gmail_client(account)
+
+    label_name, gmail_query = extract_filter_settings(account.credentials_json)
+    effective_query = _build_effective_query(label_name, gmail_query)
+    limit = max(1, min(int(max_results), 100))
+    refs, history_id, sync_mode, metadata = select_message_refs(
+        gmail, account.history_id, effective_query, limit, import_invoices
+    )
+
+    previews: list[dict[str, Any]] = []
+    payment_link_hits = 0
+    invoice_hint_hits = 0
+    skipped_no_amount = 0
+    import_candidates: list[dict[str, Any]] = []
+
+    fetched, skipped_not_invoice = _fetch_invoice_messages(gmail, [ref["id"] for ref in refs], metadata)
+    for ref in refs:
+        msg = fetched.messages.get(ref["id"])
+        if msg is None:
+            continue
+
+        preview, due_date = analyze_message(msg)
+        previews.append(preview)
+        payment_link_hits += int(preview["has_payment_link"])
+        invoice_hint_hits += int(preview["has_invoice_hint"])
+
+        if not import_invoices:
+            continue
+
+        if preview["amount_guess"] is None:
+            skipped_no_amount += 1
+            continue
+
+        import_candidates.append(
+            {
+                "gmail_message_id": str(msg.get("id") or ref["id"]),
+                "name": build_invoice_name(preview["subject"], preview["from"]),
+                "amount": preview["amount_guess"],
+                "currency": preview["currency_guess"] or "HUF",
+                "due_date": due_date or (datetime.now(timezone.utc).date() + timedelta(days=7)),
+                "payment_link": preview["payment_link_guess"],
+                "sender": preview["from"][:255] or None,
+            }
+        )
+
+    imported, skipped_duplicates = import_gmail_invoices(account, import_candidates)
+    account_emails = {account.id: account.email}
+    imported_preview = [invoice.to_dict(account_emails=account_emails) for invoice in imported[:20]]
+
+    account.last_sync = datetime.now(timezone.utc).replace(tzinfo=None)
+    # Keep the old history id after transient fetch failures so the next sync
+    # retries them; a message that is gone (404) would only fail again.
+    if history_id and not fetched.retryable:
+        account.history_id = history_id
+    db.session.commit()
+
+    return {
+        "account_id": account.id,
+        "email": account.email,
+        "label_name": label_name,
+        "gmail_query": gmail_query,
+        "effective_query": effective_query,
+        "sync_mode": sync_mode,
+        "history_id": account.history_id,
+        "scanned_messages": len(refs),
+        "batch_requests": fetched.batches,
+        "fetch_errors": len(fetched.errors),
+        "fetch_error_samples": [
+            {"id": message_id, "error": error} for message_id, error in list(fetched.errors.items())[:20]
+        ],
+        "skipped_not_invoice": skipped_not_invoice,
+        "payment_link_hits": payment_link_hits,
+        "invoice_hint_hits": invoice_hint_hits,
+        "import_invoices": import_invoices,
+        "imported_invoices": len(imported),
+        "skipped_no_amount": skipped_no_amount,
+        "skipped_duplicates": skipped_duplicates,
+        "imported_invoice_samples": imported_preview[:20],
+        "sample_messages": previews[:20],
+        "synced_at": account.last_sync.isoformat(),
+    }
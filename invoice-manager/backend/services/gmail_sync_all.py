@@ -0,0 +1,93 @@
+"""Concurrent Gmail sync of every active account.
+
+Each account is synced on a bounded thread pool inside its own app context,
+so every worker gets its own scoped DB session. A per-account lock keeps a
+manual sync and a sync-all run in this process from overlapping on the same
+account; overlap across processes is harmless because imports are
+deduplicated by the unique (account, Gmail message id) index.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from flask import Flask
+
+from extensions import db
+from models.database import GmailAccount
+from services.gmail_sync import sync_account_messages
+
+_locks_guard = threading.Lock()
+_account_locks: dict[int, threading.Lock] = {}
+
+
+def account_sync_lock(account_id: int) -> threading.Lock:
+    """Process-wide lock serializing syncs of one account."""
+    with _locks_guard:
+        return _account_locks.setdefault(account_id, threading.Lock())
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+def _sync_one(app: Flask, account_id: int, email: str, max_results: int) -> dict[str, Any]:
+    report: dict[str, Any] = {"account_id": account_id, "email": email, "result": None, "error": None}
+    started = time.perf_counter()
+    lock = account_sync_lock(account_id)
+    if not lock.acquire(blocking=False):
+        return {**report, "status": "skipped", "error": "Sync already running for this account", "duration_ms": 0.0}
+    try:
+        with app.app_context():
+            try:
+                account = db.session.get(GmailAccount, account_id)
+                if account is None:
+                    report.update(status="skipped", error="Gmail account not found")
+                else:
+                    report["result"] = sync_account_messages(account, max_results=max_results)
+                    report["status"] = "ok"
+            except Exception as exc:
+                db.session.rollback()
+                report["status"] = "error"
+                report["error"] = str(exc)
+    finally:
+        lock.release()
+    report["duration_ms"] = _elapsed_ms(started)
+    return report
+
+
+def sync_all_accounts(app: Flask, max_results: int, max_workers: int) -> dict[str, Any]:
+    """Sync all active accounts concurrently and return an aggregated report."""
+    started = time.perf_counter()
+    accounts = (
+        db.session.query(GmailAccount.id, GmailAccount.email)
+        .filter(GmailAccount.is_active.is_(True))
+        .order_by(GmailAccount.id)
+        .all()
+    )
+    # End the caller's read transaction so worker commits are not held up by it.
+    db.session.rollback()
+
+    reports: list[dict[str, Any]] = []
+    if accounts:
+        workers = max(1, min(int(max_workers), len(accounts)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gmail-sync") as pool:
+            reports = list(pool.map(
+                lambda account: _sync_one(app, account.id, account.email, max_results),
+                accounts,
+            ))
+
+    results = [report["result"] for report in reports if report["result"]]
+    return {
+        "accounts": len(reports),
+        "succeeded": sum(report["status"] == "ok" for report in reports),
+        "failed": sum(report["status"] == "error" for report in reports),
+        "skipped": sum(report["status"] == "skipped" for report in reports),
+        "scanned_messages": sum(result["scanned_messages"] for result in results),
+        "imported_invoices": sum(result["imported_invoices"] for result in results),
+        "duration_ms": _elapsed_ms(started),
+        "results": reports,
+    }
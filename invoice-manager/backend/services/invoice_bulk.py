@@ -0,0 +1,65 @@
+"""Set-based execution of bulk invoice operations in one transaction."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, insert, select, update
+
+from extensions import db
+from models.database import Invoice
+
+
+@dataclass
+class BulkOutcome:
+    created_ids: list[int] = field(default_factory=list)
+    paid_ids: set[int] = field(default_factory=set)
+    deleted_ids: set[int] = field(default_factory=set)
+    paid_date: datetime | None = None
+
+
+def apply_bulk_operations(
+    creates: list[dict],
+    pay_ids: set[int],
+    delete_ids: set[int],
+) -> BulkOutcome:
+    """Insert, pay and delete invoices with one statement per kind, then commit once.
+
+    Ids that do not exist are left out of ``paid_ids``/``deleted_ids`` so the
+    caller can report them per item. Any failure rolls back the whole batch.
+    """
+    outcome = BulkOutcome()
+    try:
+        targets = pay_ids | delete_ids
+        existing = set()
+        if targets:
+            existing = set(db.session.scalars(select(Invoice.id).where(Invoice.id.in_(targets))))
+
+        if creates:
+            stmt = insert(Invoice).returning(Invoice.id, sort_by_parameter_order=True)
+            outcome.created_ids = list(db.session.scalars(stmt, creates))
+
+        outcome.paid_ids = pay_ids & existing
+        if outcome.paid_ids:
+            outcome.paid_date = datetime.now(timezone.utc).replace(tzinfo=None)
+            db.session.execute(
+                update(Invoice)
+                .where(Invoice.id.in_(outcome.paid_ids))
+                .values(paid=True, paid_date=outcome.paid_date)
+                .execution_options(synchronize_session=False)
+            )
+
+        outcome.deleted_ids = delete_ids & existing
+        if outcome.deleted_ids:
+            db.session.execute(
+                delete(Invoice)
+                .where(Invoice.id.in_(outcome.deleted_ids))
+                .execution_options(synchronize_session=False)
+            )
+
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return outcome
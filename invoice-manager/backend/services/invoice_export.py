@@ -0,0 +1,103 @@
+"""Streaming invoice exports (CSV / NDJSON) with constant memory."""
+
+from __future__ import annotations
+
+import csv
+import io
+from typing import Iterator
+
+from flask import current_app
+from sqlalchemy import select
+
+from extensions import db
+from models.database import GmailAccount, Invoice
+from services.invoice_queries import apply_invoice_filters, order_invoices_for_listing
+from services.invoice_search import apply_text_search
+
+EXPORT_FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+EXPORT_FIELDS = (
+    "id",
+    "gmail_account_id",
+    "gmail_account_email",
+    "name",
+    "amount",
+    "currency",
+    "due_date",
+    "paid",
+    "paid_date",
+    "payment_link",
+    "pdf_path",
+    "iban",
+    "sender",
+    "gmail_message_id",
+    "is_recurring",
+    "recurring_invoice_id",
+    "created_at",
+)
+
+
+def _export_statement(status: str, account_id: int | None, search: str = ""):
+    columns = [
+        getattr(Invoice, field)
+        for field in EXPORT_FIELDS
+        if field != "gmail_account_email"
+    ]
+    stmt = select(*columns, GmailAccount.email.label("gmail_account_email")).outerjoin(
+        GmailAccount, Invoice.gmail_account_id == GmailAccount.id
+    )
+    stmt = apply_invoice_filters(stmt, status, account_id)
+    if search:
+        return apply_text_search(stmt, search)
+    return order_invoices_for_listing(stmt)
+
+
+def _csv_values(row: dict) -> dict:
+    """Text forms of the typed columns, matching the JSON encoding."""
+    data = dict(row)
+    data["amount"] = float(data["amount"])
+    for key in ("due_date", "paid_date", "created_at"):
+        if data[key] is not None:
+            data[key] = data[key].isoformat()
+    return data
+
+
+def iter_invoice_rows(
+    status: str = "all",
+    account_id: int | None = None,
+    search: str = "",
+    chunk_size: int = 1000,
+) -> Iterator[dict]:
+    """Yield invoice rows as dicts, fetched from the cursor in fixed-size chunks.
+
+    Values stay raw (Decimal, date, datetime); each encoder converts them.
+    ``search`` applies the same full-text filter and ranking as the list endpoint.
+    """
+    stmt = _export_statement(status, account_id, search).execution_options(yield_per=chunk_size)
+    for row in db.session.execute(stmt):
+        data = row._mapping
+        yield {field: data[field] for field in EXPORT_FIELDS}
+
+
+def _drain(buffer: io.StringIO) -> str:
+    value = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return value
+
+
+def iter_csv(rows: Iterator[dict]) -> Iterator[str]:
+    """Encode rows as CSV lines, header first."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    yield _drain(buffer)
+    for row in rows:
+        writer.writerow(_csv_values(row))
+        yield _drain(buffer)
+
+
+def iter_ndjson(rows: Iterator[dict]) -> Iterator[str]:
+    """Encode rows as newline-delimited JSON."""
+    provider = current_app.json
+    for row in rows:
+        yield provider.dumps(row, sort_keys=False) + "\n"
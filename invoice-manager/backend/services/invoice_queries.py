@@ -0,0 +1,69 @@
+"""Shared invoice list filtering and keyset pagination helpers."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import date
+
+from sqlalchemy import tuple_
+
+from models.database import Invoice
+
+INVOICE_STATUSES = ("all", "paid", "unpaid")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def apply_invoice_filters(query, status: str = "all", account_id: int | None = None):
+    """Apply the status/account filters shared by invoice list endpoints."""
+    if status == "unpaid":
+        query = query.filter(Invoice.paid.is_(False))
+    elif status == "paid":
+        query = query.filter(Invoice.paid.is_(True))
+
+    if account_id:
+        query = query.filter(Invoice.gmail_account_id == account_id)
+    return query
+
+
+def order_invoices_for_listing(query):
+    """Order newest due date first with id as a stable tiebreaker."""
+    return query.order_by(Invoice.due_date.desc(), Invoice.id.desc())
+
+
+def encode_cursor(due_date: date, invoice_id: int) -> str:
+    """Build an opaque cursor pointing after the given (due_date, id) row."""
+    raw = f"{due_date.isoformat()}|{invoice_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        due_raw, id_raw = raw.split("|", 1)
+        return date.fromisoformat(due_raw), int(id_raw)
+    except (ValueError, UnicodeError, binascii.Error) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+
+
+def apply_keyset(query, cursor: str | None):
+    """Restrict an ordered listing query to rows after the cursor position."""
+    if not cursor:
+        return query
+    due_date, invoice_id = decode_cursor(cursor)
+    return query.filter(tuple_(Invoice.due_date, Invoice.id) < (due_date, invoice_id))
+
+
+def fetch_keyset_page(query, cursor: str | None, limit: int) -> tuple[list[Invoice], str | None]:
+    """Fetch one keyset page and the cursor for the next page (None at the end)."""
+    rows = order_invoices_for_listing(apply_keyset(query, cursor)).limit(limit + 1).all()
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and page:
+        next_cursor = encode_cursor(page[-1].due_date, page[-1].id)
+    return page, next_cursor
@@ -0,0 +1,55 @@
+"""Full-text invoice search backed by the SQLite FTS5 index."""
+
+from __future__ import annotations
+
+import re
+
+import sqlalchemy as sa
+
+from extensions import db
+from models.database import Invoice
+from models.invoice_search_index import INVOICE_FTS_TABLE
+
+MAX_SEARCH_TERMS = 8
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_fts = sa.table(
+    INVOICE_FTS_TABLE,
+    sa.column("rowid"),
+    sa.column("rank"),
+    sa.column(INVOICE_FTS_TABLE),
+)
+
+
+def build_match_expression(text: str) -> str | None:
+    """Turn free text into an FTS5 query of AND-ed prefix terms.
+
+    Only word characters survive, so user input can never inject FTS
+    operators or unbalanced quotes.
+    """
+    tokens = _TOKEN_RE.findall(text or "")[:MAX_SEARCH_TERMS]
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def apply_text_search(query, text: str):
+    """Filter an invoice query by ``text`` and order it by relevance."""
+    match = build_match_expression(text)
+    if match is None:
+        return query.filter(sa.false())
+
+    if db.session.get_bind().dialect.name != "sqlite":
+        # No FTS5 outside SQLite: degrade to a substring scan.
+        pattern = f"%{text.strip()}%"
+        return query.filter(sa.or_(
+            Invoice.name.ilike(pattern),
+            Invoice.payment_link.ilike(pattern),
+            Invoice.sender.ilike(pattern),
+        )).order_by(Invoice.due_date.desc(), Invoice.id.desc())
+
+    return (
+        query.join(_fts, _fts.c.rowid == Invoice.id)
+        .filter(_fts.c[INVOICE_FTS_TABLE].match(match))
+        .order_by(_fts.c.rank, Invoice.due_date.desc(), Invoice.id.desc())
+    )
@@ -0,0 +1,31 @@
+"""Batch serialization helpers for invoice list responses."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from sqlalchemy import select
+
+from extensions import db
+from models.database import GmailAccount, Invoice
+
+
+def load_account_emails(account_ids: Iterable[int | None]) -> dict[int, str]:
+    """Load Gmail account emails for the given ids with a single query."""
+    ids = {account_id for account_id in account_ids if account_id is not None}
+    if not ids:
+        return {}
+    rows = db.session.execute(
+        select(GmailAccount.id, GmailAccount.email).where(GmailAccount.id.in_(ids))
+    )
+    return {account_id: email for account_id, email in rows}
+
+
+def serialize_invoices(invoices: list[Invoice]) -> list[dict]:
+    """Serialize invoices for list responses without per-row account lookups.
+
+    Values stay raw (Decimal, date, datetime); ``jsonify`` encodes them in
+    one pass through the app's JSON provider.
+    """
+    account_emails = load_account_emails(inv.gmail_account_id for inv in invoices)
+    return [inv.to_dict(account_emails=account_emails, raw=True) for inv in invoices]
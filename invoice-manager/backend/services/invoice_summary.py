@@ -0,0 +1,77 @@
+"""SQL aggregate summaries of invoice totals."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import and_, case, extract, func, select
+
+from extensions import db
+from models.database import Invoice
+
+
+_COUNT_KEYS = ("count", "paid_count", "unpaid_count", "overdue_count")
+_TOTAL_KEYS = ("total", "paid_total", "unpaid_total", "overdue_total")
+
+
+def _bucket() -> dict:
+    bucket = {key: 0 for key in _COUNT_KEYS}
+    bucket.update({key: 0.0 for key in _TOTAL_KEYS})
+    return bucket
+
+
+def _add_row(bucket: dict, row) -> None:
+    for key in _COUNT_KEYS:
+        bucket[key] += int(getattr(row, key) or 0)
+    for key in _TOTAL_KEYS:
+        bucket[key] = round(bucket[key] + float(getattr(row, key) or 0), 2)
+
+
+def summarize_invoices(as_of: date, account_id: int | None = None) -> dict:
+    """Return invoice counts and sums grouped by currency and due month.
+
+    Everything is computed with one GROUP BY over (currency, year, month);
+    per-currency totals are rolled up from those few grouped rows.
+    """
+    is_paid = Invoice.paid.is_(True)
+    is_unpaid = Invoice.paid.is_(False)
+    is_overdue = and_(is_unpaid, Invoice.due_date < as_of)
+    year = extract("year", Invoice.due_date).label("year")
+    month = extract("month", Invoice.due_date).label("month")
+
+    stmt = select(
+        Invoice.currency,
+        year,
+        month,
+        func.count(Invoice.id).label("count"),
+        func.sum(Invoice.amount).label("total"),
+        func.sum(case((is_paid, 1), else_=0)).label("paid_count"),
+        func.sum(case((is_paid, Invoice.amount), else_=0)).label("paid_total"),
+        func.sum(case((is_unpaid, 1), else_=0)).label("unpaid_count"),
+        func.sum(case((is_unpaid, Invoice.amount), else_=0)).label("unpaid_total"),
+        func.sum(case((is_overdue, 1), else_=0)).label("overdue_count"),
+        func.sum(case((is_overdue, Invoice.amount), else_=0)).label("overdue_total"),
+    ).group_by(Invoice.currency, year, month).order_by(Invoice.currency, year, month)
+    if account_id:
+        stmt = stmt.where(Invoice.gmail_account_id == account_id)
+
+    by_currency: dict[str, dict] = {}
+    by_month: list[dict] = []
+    for row in db.session.execute(stmt):
+        month_bucket = _bucket()
+        _add_row(month_bucket, row)
+        by_month.append({
+            "month": f"{int(row.year):04d}-{int(row.month):02d}",
+            "currency": row.currency,
+            **month_bucket,
+        })
+        _add_row(by_currency.setdefault(row.currency, _bucket()), row)
+
+    return {
+        "as_of": as_of.isoformat(),
+        "by_currency": [
+            {"currency": currency, **bucket}
+            for currency, bucket in sorted(by_currency.items())
+        ],
+        "by_month": by_month,
+    }
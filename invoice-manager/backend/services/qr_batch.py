@@ -0,0 +1,84 @@
+"""Rendering of many payment QR codes through the QR cache."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator
+import zipfile
+
+from services.qr_cache import QRCache, qr_cache_key
+from services.qr_generator import generate_payment_qr
+
+QR_MIMETYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+
+@dataclass
+class QRJob:
+    invoice_id: int
+    iban: str
+    amount: float
+    name: str
+
+
+class _ChunkWriter:
+    """Write-only file object whose buffered bytes are drained after each ZIP member."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _render_one(job: QRJob, cache: QRCache, kind: str) -> tuple[int, bytes | None, str | None]:
+    key = qr_cache_key(iban=job.iban, amount=job.amount, name=job.name, kind=kind)
+    try:
+        data = cache.get_or_render(
+            key,
+            lambda: generate_payment_qr(iban=job.iban, amount=job.amount, name=job.name, kind=kind),
+        )
+    except Exception as exc:
+        return job.invoice_id, None, str(exc)
+    return job.invoice_id, data, None
+
+
+def render_qr_batch(
+    jobs: list[QRJob],
+    cache: QRCache,
+    kind: str = "png",
+) -> dict[int, tuple[bytes | None, str | None]]:
+    """Render QR codes in job order, returning invoice id -> (bytes, error).
+
+    Cached images are returned without rendering; only misses reach segno.
+    Rendering is pure Python and holds the GIL, so misses are rendered one
+    after another rather than on a thread pool.
+    """
+    rendered = (_render_one(job, cache, kind) for job in jobs)
+    return {invoice_id: (data, error) for invoice_id, data, error in rendered}
+
+
+def iter_qr_zip(jobs: list[QRJob], cache: QRCache, kind: str = "png") -> Iterator[bytes]:
+    """Stream a stored ZIP of ``invoice_<id>_qr.<kind>`` members in job order.
+
+    Each QR code is rendered just before its member is written and the bytes
+    are yielded right away, so at most one image is buffered at a time.
+    Jobs that fail to render are left out of the archive.
+    """
+    sink = _ChunkWriter()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as archive:
+        for job in jobs:
+            invoice_id, data, _error = _render_one(job, cache, kind)
+            if data is None:
+                continue
+            archive.writestr(f"invoice_{invoice_id}_qr.{kind}", data)
+            yield sink.drain()
+    yield sink.drain()
@@ -0,0 +1,170 @@
+"""Content-addressed cache for rendered payment QR codes."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from flask import current_app
+
+
+def qr_cache_key(
+    iban: str,
+    amount: float,
+    name: str,
+    reference: str = "",
+    scale: int = 5,
+    kind: str = "png",
+) -> str:
+    """Hash every input that affects the rendered image into a stable key."""
+    iban_clean = iban.replace(" ", "").strip()
+    raw = f"{iban_clean}|{float(amount):.2f}|{name}|{reference}|{scale}|{kind}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class QRCache:
+    """Thread-safe LRU of rendered images bounded by total bytes.
+
+    When ``disk_path`` is set, rendered images are also written there and
+    survive process restarts; memory misses fall back to disk before
+    rendering again. The disk tier is bounded by ``disk_max_bytes``: once a
+    write pushes it over, the least recently used files (by mtime, which a
+    disk hit refreshes) are deleted down to ``DISK_PRUNE_RATIO`` of the budget.
+    """
+
+    DISK_PRUNE_RATIO = 0.8
+
+    def __init__(self, max_bytes: int, disk_path: str | None = None, disk_max_bytes: int = 64 * 1024 * 1024):
+        self._max_bytes = max(0, int(max_bytes))
+        self._disk_path = disk_path
+        self._disk_max_bytes = max(0, int(disk_max_bytes))
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._disk_size = 0
+        if disk_path:
+            os.makedirs(disk_path, exist_ok=True)
+            self._disk_size = sum(size for _mtime, size, _path in self._disk_files())
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    @property
+    def disk_size_bytes(self) -> int:
+        return self._disk_size
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                return data
+        data = self._read_disk(key)
+        if data is not None:
+            self._remember(key, data)
+        return data
+
+    def get_or_render(self, key: str, render: Callable[[], bytes]) -> bytes:
+        """Return cached bytes for ``key`` or render, store and return them."""
+        data = self.get(key)
+        if data is None:
+            data = render()
+            self._remember(key, data)
+            self._write_disk(key, data)
+        return data
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if len(data) > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self._max_bytes:
+                _evicted_key, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _disk_file(self, key: str) -> str:
+        return os.path.join(self._disk_path, f"{key}.bin")
+
+    def _read_disk(self, key: str) -> bytes | None:
+        if not self._disk_path:
+            return None
+        path = self._disk_file(key)
+        try:
+            with open(path, "rb") as handle:
+                data = handle.read()
+            os.utime(path)  # mark as recently used for pruning
+        except OSError:
+            return None
+        return data
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        if not self._disk_path:
+            return
+        target = self._disk_file(key)
+        tmp_path = f"{target}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_path, target)
+        except OSError:
+            # Disk tier is best-effort; the memory tier already holds the image.
+            return
+        with self._disk_lock:
+            self._disk_size += len(data)
+            if self._disk_size > self._disk_max_bytes:
+                self._prune_disk()
+
+    def _disk_files(self) -> list[tuple[float, int, str]]:
+        files = []
+        with os.scandir(self._disk_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".bin"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue  # removed by another process meanwhile
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def _prune_disk(self) -> None:
+        """Delete least recently used files until the tier is under its low-water mark.
+
+        The directory is rescanned, so files written by other processes are
+        counted and the running size estimate is corrected.
+        """
+        files = sorted(self._disk_files())
+        total = sum(size for _mtime, size, _path in files)
+        target = self._disk_max_bytes * self.DISK_PRUNE_RATIO
+        for _mtime, size, path in files:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._disk_size = total
+
+
+def get_qr_cache() -> QRCache:
+    """Return the QR cache attached to the current app."""
+    return current_app.extensions["qr_cache"]
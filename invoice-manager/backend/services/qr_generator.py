@@ -11,6 +11,7 @@ def generate_payment_qr(
     name: str,
     reference: str = "",
     scale: int = 5,
+    kind: str = "png",
 ) -> bytes:
     """
     Generate EPC QR code for SEPA payment.
@@ -21,9 +22,10 @@ def generate_payment_qr(
         name: Recipient name
         reference: Payment reference (optional)
         scale: QR code scale/size (default 5)
+        kind: Image format, "png" or "svg" (default "png")
 
     Returns:
-        PNG image as bytes
+        Image as bytes
     """
     # Clean IBAN - remove spaces
     iban_clean = iban.replace(" ", "").strip()
@@ -39,5 +41,5 @@ def generate_payment_qr(
     )
 
     buffer = io.BytesIO()
-    qr.save(buffer, kind="png", scale=scale)
+    qr.save(buffer, kind=kind, scale=scale)
     return buffer.getvalue()
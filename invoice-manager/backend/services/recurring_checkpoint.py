@@ -0,0 +1,54 @@
+"""Persisted resume point for chunked recurring generation.
+
+Generation commits after every chunk of templates. The id of the last
+template in a committed chunk is stored on the shared run-state row in the
+same transaction, so an interrupted run continues after it instead of
+rescanning templates that are already caught up.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import insert
+
+from extensions import db
+from models.scheduler_state import RecurringRunState
+from services.conflict_insert import insert_ignoring_conflicts
+
+RUN_STATE_ID = 1
+
+
+def load_run_state() -> RecurringRunState:
+    """Return the single run-state row, creating it on first use."""
+    state = db.session.get(RecurringRunState, RUN_STATE_ID, populate_existing=True)
+    if state is not None:
+        return state
+    stmt = insert_ignoring_conflicts(RecurringRunState.__table__, ["id"])
+    if stmt is None:
+        stmt = insert(RecurringRunState.__table__)
+    db.session.execute(stmt.values(id=RUN_STATE_ID, total_runs=0))
+    return db.session.get(RecurringRunState, RUN_STATE_ID, populate_existing=True)
+
+
+def resume_cursor(run_date: date) -> int:
+    """Template id to continue after; 0 unless a run for ``run_date`` was interrupted."""
+    state = db.session.get(RecurringRunState, RUN_STATE_ID, populate_existing=True)
+    if state is None or state.checkpoint_run_date != run_date:
+        return 0
+    return state.checkpoint_template_id or 0
+
+
+def save_checkpoint(run_date: date, template_id: int) -> None:
+    """Stage the resume point; it is committed together with the chunk."""
+    state = load_run_state()
+    state.checkpoint_run_date = run_date
+    state.checkpoint_template_id = template_id
+
+
+def clear_checkpoint() -> None:
+    """Stage removal of the resume point once a run has caught up."""
+    state = db.session.get(RecurringRunState, RUN_STATE_ID)
+    if state is not None and state.checkpoint_run_date is not None:
+        state.checkpoint_run_date = None
+        state.checkpoint_template_id = None
@@ -0,0 +1,64 @@
+"""Due-template selection shared by recurring generation and its dry-run preview.
+
+Both the generator and the preview walk the same keyset chunks of due
+templates and check existing invoices the same way, so a preview always
+reports exactly what a run for the same date would create.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+from flask import current_app
+
+from extensions import db
+from models.database import Invoice, RecurringInvoice
+from models.recurrence_rules import rule_for_template
+
+
+def iter_due_dates(template: RecurringInvoice, run_date: date) -> list[date]:
+    """Ungenerated due dates of ``template`` up to ``run_date``."""
+    return rule_for_template(template).due_dates_until(template.last_generated, run_date)
+
+
+def due_filter(run_date: date):
+    """Filter criteria of templates that are active and due on ``run_date``."""
+    return RecurringInvoice.is_active.is_(True), RecurringInvoice.next_due_date <= run_date
+
+
+def has_due_templates(run_date: date) -> bool:
+    """One probe of ix_recurring_invoices_active_next_due: is anything due?"""
+    return db.session.query(RecurringInvoice.query.filter(*due_filter(run_date)).exists()).scalar()
+
+
+def load_due_templates(run_date: date, after_id: int, limit: int) -> list[RecurringInvoice]:
+    """Next keyset chunk of due templates with an id greater than ``after_id``."""
+    return (
+        RecurringInvoice.query.filter(*due_filter(run_date), RecurringInvoice.id > after_id)
+        .order_by(RecurringInvoice.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def chunk_limits() -> tuple[int, int]:
+    """Configured (templates per chunk, due dates per template per chunk)."""
+    config = current_app.config
+    return (
+        max(1, int(config.get("RECURRING_GENERATION_CHUNK_TEMPLATES", 500))),
+        max(1, int(config.get("RECURRING_GENERATION_CHUNK_PERIODS", 24))),
+    )
+
+
+def existing_recurring_pairs(
+    template_ids: list[int],
+    start: date,
+    end: date,
+) -> set[tuple[int, date]]:
+    """Prefetch generated (template id, due date) pairs of one chunk in one query."""
+    rows = db.session.query(Invoice.recurring_invoice_id, Invoice.due_date).filter(
+        Invoice.recurring_invoice_id.in_(template_ids),
+        Invoice.due_date >= start,
+        Invoice.due_date <= end,
+    )
+    return {(template_id, due_date) for template_id, due_date in rows}
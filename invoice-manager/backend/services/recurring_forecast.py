@@ -0,0 +1,82 @@
+"""Portfolio-wide forecast of recurring invoices and projected cash flow."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+
+from dateutil.relativedelta import relativedelta
+
+from extensions import db
+from models.database import Invoice, RecurringInvoice
+from models.recurrence_rules import rule_for_template
+
+
+def _generated_pairs(start: date, end: date) -> set[tuple[int, date]]:
+    """One join over active templates instead of a query per template."""
+    rows = (
+        db.session.query(Invoice.recurring_invoice_id, Invoice.due_date)
+        .join(RecurringInvoice, RecurringInvoice.id == Invoice.recurring_invoice_id)
+        .filter(
+            RecurringInvoice.is_active.is_(True),
+            Invoice.due_date >= start,
+            Invoice.due_date < end,
+        )
+    )
+    return {(template_id, due_date) for template_id, due_date in rows}
+
+
+def forecast_portfolio(from_date: date, months: int) -> dict:
+    """Forecast every active template over ``months`` months from ``from_date``.
+
+    Returns per-template due dates plus totals per (month, currency) and per
+    currency, so a cash-flow view needs a single request.
+    """
+    until = from_date + relativedelta(months=months)
+    templates = (
+        RecurringInvoice.query.filter(RecurringInvoice.is_active.is_(True))
+        .order_by(RecurringInvoice.name, RecurringInvoice.id)
+        .all()
+    )
+    generated = _generated_pairs(from_date, until)
+
+    by_month: dict[tuple[str, str], dict] = defaultdict(
+        lambda: {"count": 0, "total": Decimal("0"), "already_generated": 0}
+    )
+    template_items = []
+    for template in templates:
+        forecast = []
+        for due_date in rule_for_template(template).occurrences_between(from_date, until):
+            already_generated = (template.id, due_date) in generated
+            forecast.append({"due_date": due_date.isoformat(), "already_generated": already_generated})
+            bucket = by_month[(due_date.strftime("%Y-%m"), template.currency)]
+            bucket["count"] += 1
+            bucket["total"] += Decimal(template.amount)
+            bucket["already_generated"] += int(already_generated)
+        template_items.append({
+            "recurring_id": template.id,
+            "name": template.name,
+            "amount": float(template.amount),
+            "currency": template.currency,
+            "forecast": forecast,
+        })
+
+    by_currency: dict[str, dict] = defaultdict(lambda: {"count": 0, "total": Decimal("0")})
+    month_rows = []
+    for (month, currency), bucket in sorted(by_month.items()):
+        month_rows.append({"month": month, "currency": currency, **bucket, "total": float(bucket["total"])})
+        by_currency[currency]["count"] += bucket["count"]
+        by_currency[currency]["total"] += bucket["total"]
+
+    return {
+        "from_date": from_date.isoformat(),
+        "until": until.isoformat(),
+        "months": months,
+        "templates": template_items,
+        "by_month": month_rows,
+        "by_currency": [
+            {"currency": currency, "count": bucket["count"], "total": float(bucket["total"])}
+            for currency, bucket in sorted(by_currency.items())
+        ],
+    }
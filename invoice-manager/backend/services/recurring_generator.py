@@ -2,60 +2,26 @@
 
 from __future__ import annotations
 
-from calendar import monthrange
-from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime, timezone
+from typing import Callable
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import case, func, insert
 
 from extensions import db
 from models.database import Invoice, RecurringInvoice
-
-
-@dataclass
-class GenerationStats:
-    generated: int = 0
-    skipped_existing: int = 0
-    skipped_paused: int = 0
-    skipped_not_due: int = 0
-    processed_templates: int = 0
-
-    def to_dict(self) -> dict:
-        return {
-            "generated": self.generated,
-            "skipped_existing": self.skipped_existing,
-            "skipped_paused": self.skipped_paused,
-            "skipped_not_due": self.skipped_not_due,
-            "processed_templates": self.processed_templates,
-        }
-
-
-def _month_start(value: date) -> date:
-    return value.replace(day=1)
-
-
-def _next_month(value: date) -> date:
-    year = value.year + (1 if value.month == 12 else 0)
-    month = 1 if value.month == 12 else value.month + 1
-    return date(year, month, 1)
-
-
-def _due_date_for_month(year: int, month: int, day_of_month: int) -> date:
-    last_day = monthrange(year, month)[1]
-    return date(year, month, min(day_of_month, last_day))
-
-
-def _iter_due_dates(template: RecurringInvoice, run_date: date):
-    created_date = template.created_at.date()
-    if template.last_generated is not None:
-        cursor = _next_month(_month_start(template.last_generated))
-    else:
-        cursor = _month_start(created_date)
-    end = _month_start(run_date)
-
-    while cursor <= end:
-        due_date = _due_date_for_month(cursor.year, cursor.month, template.day_of_month)
-        if due_date >= created_date and due_date <= run_date:
-            yield due_date
-        cursor = _next_month(cursor)
+from models.recurrence_rules import rule_for_template
+from services.conflict_insert import insert_ignoring_conflicts
+from services.recurring_checkpoint import clear_checkpoint, resume_cursor, save_checkpoint
+from services.recurring_due import (
+    chunk_limits,
+    existing_recurring_pairs,
+    has_due_templates,
+    iter_due_dates,
+    load_due_templates,
+)
+from services.recurring_stats import GenerationStats
+from services.scheduler_lease import LeaseLostError
 
 
 def forecast_recurring_due_dates(
@@ -63,65 +29,152 @@ def forecast_recurring_due_dates(
     months: int,
     from_date: date,
 ) -> list[date]:
-    """Forecast next due dates for recurring template from a given date."""
-    if months <= 0:
-        return []
-
-    anchor_date = max(from_date, template.created_at.date())
-    cursor = _month_start(anchor_date)
-    due_dates: list[date] = []
-
-    while len(due_dates) < months:
-        due_date = _due_date_for_month(cursor.year, cursor.month, template.day_of_month)
-        if due_date >= anchor_date:
-            due_dates.append(due_date)
-        cursor = _next_month(cursor)
-
-    return due_dates
-
+    """Forecast a template's due dates over ``months`` months.
+
+    The window opens at ``from_date``, or at the template's start when that is
+    later, and spans calendar months whatever the frequency.
+    """
+    rule = rule_for_template(template)
+    start = max(from_date, rule.start)
+    return rule.occurrences_between(start, start + relativedelta(months=months))
+
+
+def _count_templates(run_date: date) -> tuple[int, int, int]:
+    """Count paused, not-yet-due and due templates without loading them.
+
+    This scans the whole table, so it only runs when something is due.
+    """
+    active = RecurringInvoice.is_active.is_(True)
+    paused, not_due, due = db.session.query(
+        func.count(case((RecurringInvoice.is_active.is_(False), 1))),
+        func.count(case((active & (RecurringInvoice.next_due_date > run_date), 1))),
+        func.count(case((active & (RecurringInvoice.next_due_date <= run_date), 1))),
+    ).one()
+    return paused, not_due, due
+
+
+def _insert_recurring_rows(rows: list[dict]) -> int:
+    """Bulk insert generated invoices; return how many were inserted.
+
+    The unique (recurring_invoice_id, due_date) index is the idempotency
+    guarantee: rows another writer inserted since the prefetch are skipped.
+    """
+    if not rows:
+        return 0
+    stmt = insert_ignoring_conflicts(Invoice.__table__, ["recurring_invoice_id", "due_date"])
+    if stmt is None:
+        stmt = insert(Invoice.__table__)
+    return db.session.execute(stmt, rows).rowcount
+
+
+def _generate_chunk(
+    templates: list[RecurringInvoice],
+    run_date: date,
+    max_periods: int,
+    stats: GenerationStats,
+) -> None:
+    """Insert up to ``max_periods`` missing invoices per template (not committed)."""
+    with stats.phase("template_scan"):
+        due_by_template: list[tuple[RecurringInvoice, list[date]]] = []
+        for template in templates:
+            due_dates = iter_due_dates(template, run_date)[:max_periods]
+            if not due_dates:
+                # Stale next_due_date; recompute it so the template leaves the due set.
+                template.next_due_date = rule_for_template(template).next_due_date(template.last_generated)
+                stats.skipped_not_due += 1
+                continue
+            due_by_template.append((template, due_dates))
+
+    with stats.phase("existence_check"):
+        existing: set[tuple[int, date]] = set()
+        if due_by_template:
+            existing = existing_recurring_pairs(
+                [template.id for template, _dates in due_by_template],
+                min(dates[0] for _template, dates in due_by_template),
+                max(dates[-1] for _template, dates in due_by_template),
+            )
+        created_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        rows: list[dict] = []
+        for template, due_dates in due_by_template:
+            for due_date in due_dates:
+                if (template.id, due_date) in existing:
+                    stats.skipped_existing += 1
+                    continue
+                rows.append({
+                    "name": template.name,
+                    "amount": template.amount,
+                    "currency": template.currency,
+                    "due_date": due_date,
+                    "paid": False,
+                    "is_recurring": True,
+                    "recurring_invoice_id": template.id,
+                    "created_at": created_at,
+                })
+            if template.last_generated is None or due_dates[-1] > template.last_generated:
+                template.last_generated = due_dates[-1]
+
+    with stats.phase("insert"):
+        inserted = _insert_recurring_rows(rows)
+    stats.generated += inserted
+    stats.skipped_existing += len(rows) - inserted
+
+
+def _commit_chunk(stats: GenerationStats, renew_lease: Callable[[], bool] | None) -> None:
+    """Commit the pending chunk, first renewing the lease in the same transaction."""
+    if renew_lease is not None and not renew_lease():
+        db.session.rollback()
+        raise LeaseLostError("Generation lease was taken over by another worker; run stopped")
+    with stats.phase("commit"):
+        db.session.commit()
+
+
+def generate_due_recurring_invoices(
+    run_date: date,
+    chunk_templates: int | None = None,
+    chunk_periods: int | None = None,
+    renew_lease: Callable[[], bool] | None = None,
+) -> dict:
+    """Generate missing recurring invoices up to run_date in an idempotent way.
+
+    Due templates are processed in id order, ``chunk_templates`` at a time and
+    at most ``chunk_periods`` due dates per template per chunk. Every chunk is
+    committed together with a checkpoint, so a long backfill never holds one
+    large write transaction and an interrupted run resumes after the last
+    committed chunk. Templates still behind after a pass get another pass.
+
+    ``renew_lease`` is called before every commit; when it reports the lease
+    lost, the chunk is rolled back and ``LeaseLostError`` stops the run.
+    """
+    default_templates, default_periods = chunk_limits()
+    chunk_templates = chunk_templates or default_templates
+    chunk_periods = chunk_periods or default_periods
 
-def generate_due_recurring_invoices(run_date: date) -> dict:
-    """Generate missing recurring invoices up to run_date in an idempotent way."""
     stats = GenerationStats()
-    templates = RecurringInvoice.query.order_by(RecurringInvoice.id).all()
-    stats.processed_templates = len(templates)
-
-    for template in templates:
-        if not template.is_active:
-            stats.skipped_paused += 1
+    with stats.phase("template_scan"):
+        has_due = has_due_templates(run_date)
+    if not has_due:
+        # Idle run: skip counters stay zero rather than scanning every template.
+        return stats.to_dict()
+    with stats.phase("template_scan"):
+        stats.skipped_paused, stats.skipped_not_due, due = _count_templates(run_date)
+        stats.processed_templates = stats.skipped_paused + stats.skipped_not_due + due
+        cursor = resume_cursor(run_date)
+
+    while True:
+        with stats.phase("template_scan"):
+            templates = load_due_templates(run_date, cursor, chunk_templates)
+        if not templates:
+            if cursor == 0:
+                break
+            cursor = 0
             continue
 
-        template_had_due = False
-        latest_due = template.last_generated
-        for due_date in _iter_due_dates(template, run_date):
-            template_had_due = True
-            latest_due = due_date if latest_due is None else max(latest_due, due_date)
-            existing = Invoice.query.filter_by(
-                recurring_invoice_id=template.id,
-                due_date=due_date,
-                is_recurring=True,
-            ).first()
-            if existing:
-                stats.skipped_existing += 1
-                continue
-
-            db.session.add(
-                Invoice(
-                    name=template.name,
-                    amount=template.amount,
-                    currency=template.currency,
-                    due_date=due_date,
-                    paid=False,
-                    is_recurring=True,
-                    recurring_invoice_id=template.id,
-                )
-            )
-            stats.generated += 1
-
-        if template_had_due and latest_due is not None:
-            template.last_generated = latest_due
-        else:
-            stats.skipped_not_due += 1
+        _generate_chunk(templates, run_date, chunk_periods, stats)
+        cursor = templates[-1].id
+        save_checkpoint(run_date, cursor)
+        _commit_chunk(stats, renew_lease)
+        stats.chunks += 1
 
-    db.session.commit()
+    clear_checkpoint()
+    _commit_chunk(stats, renew_lease)
     return stats.to_dict()
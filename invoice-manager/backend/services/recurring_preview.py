@@ -0,0 +1,72 @@
+"""Read-only preview of what recurring generation would create."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+
+from extensions import db
+from services.recurring_due import chunk_limits, existing_recurring_pairs, iter_due_dates, load_due_templates
+
+
+def preview_recurring_generation(run_date: date) -> dict:
+    """Report the invoices a run for ``run_date`` would generate, without writing.
+
+    Due templates come from the indexed ``next_due_date`` column in keyset
+    chunks and existing invoices are checked with one query per chunk, as in
+    a real run; templates are never modified and nothing is flushed.
+    """
+    chunk_templates, _chunk_periods = chunk_limits()
+    template_items = []
+    by_currency: dict[str, dict] = defaultdict(lambda: {"count": 0, "total": Decimal("0")})
+    skipped_existing = 0
+    cursor = 0
+    with db.session.no_autoflush:
+        while True:
+            templates = load_due_templates(run_date, cursor, chunk_templates)
+            if not templates:
+                break
+            cursor = templates[-1].id
+
+            due_by_template = [(template, iter_due_dates(template, run_date)) for template in templates]
+            due_by_template = [(template, dates) for template, dates in due_by_template if dates]
+            if not due_by_template:
+                continue
+            existing = existing_recurring_pairs(
+                [template.id for template, _dates in due_by_template],
+                min(dates[0] for _template, dates in due_by_template),
+                max(dates[-1] for _template, dates in due_by_template),
+            )
+            for template, due_dates in due_by_template:
+                missing = [due_date for due_date in due_dates if (template.id, due_date) not in existing]
+                skipped_existing += len(due_dates) - len(missing)
+                if not missing:
+                    continue
+                total = Decimal(template.amount) * len(missing)
+                template_items.append({
+                    "recurring_id": template.id,
+                    "name": template.name,
+                    "amount": float(template.amount),
+                    "currency": template.currency,
+                    "count": len(missing),
+                    "total": float(total),
+                    "first_due_date": missing[0].isoformat(),
+                    "last_due_date": missing[-1].isoformat(),
+                })
+                by_currency[template.currency]["count"] += len(missing)
+                by_currency[template.currency]["total"] += total
+    db.session.rollback()
+
+    return {
+        "templates": template_items,
+        "total": {
+            "invoices": sum(item["count"] for item in template_items),
+            "templates": len(template_items),
+            "skipped_existing": skipped_existing,
+            "by_currency": [
+                {"currency": currency, "count": bucket["count"], "total": float(bucket["total"])}
+                for currency, bucket in sorted(by_currency.items())
+            ],
+        },
+    }
@@ -0,0 +1,102 @@
+"""Persistent history of recurring generation runs and latency percentiles."""
+
+from __future__ import annotations
+
+import math
+from datetime import date, datetime, timedelta, timezone
+
+from flask import current_app
+
+from extensions import db
+from models.scheduler_state import RecurringRun
+
+RUN_PHASES = ("template_scan", "existence_check", "insert", "commit")
+_COUNTERS = ("generated", "skipped_existing", "skipped_paused", "skipped_not_due", "processed_templates")
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def record_recurring_run(
+    run_date: date,
+    started_at: datetime,
+    result: dict | None,
+    error: Exception | None,
+    holder: str,
+) -> RecurringRun:
+    """Add one history row (committed by the caller) and prune expired rows."""
+    finished_at = _utc_now()
+    run = RecurringRun(
+        run_date=run_date,
+        started_at=started_at,
+        finished_at=finished_at,
+        duration_ms=round((finished_at - started_at).total_seconds() * 1000, 3),
+        status="success" if error is None else "error",
+        error=None if error is None else str(error),
+        holder=holder,
+    )
+    if result is not None:
+        for counter in _COUNTERS:
+            setattr(run, counter, result.get(counter))
+        timings = result.get("timings_ms") or {}
+        for phase in RUN_PHASES:
+            setattr(run, f"{phase}_ms", timings.get(phase))
+    db.session.add(run)
+
+    retention_days = int(current_app.config.get("RECURRING_RUN_HISTORY_DAYS", 90))
+    RecurringRun.query.filter(
+        RecurringRun.started_at < finished_at - timedelta(days=retention_days)
+    ).delete(synchronize_session=False)
+    return run
+
+
+def _percentile(ordered: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _latency(values: list[float | None]) -> dict:
+    ordered = sorted(value for value in values if value is not None)
+    return {
+        "p50": _percentile(ordered, 50),
+        "p95": _percentile(ordered, 95),
+        "max": ordered[-1] if ordered else None,
+    }
+
+
+def recurring_run_report(window_days: int, limit: int) -> dict:
+    """Summarize runs of the last ``window_days`` and list the newest ``limit``."""
+    since = _utc_now() - timedelta(days=window_days)
+    window = (
+        db.session.query(
+            RecurringRun.status,
+            RecurringRun.duration_ms,
+            RecurringRun.processed_templates,
+            *(getattr(RecurringRun, f"{phase}_ms") for phase in RUN_PHASES),
+        )
+        .filter(RecurringRun.started_at >= since)
+        .all()
+    )
+    recent = (
+        RecurringRun.query.filter(RecurringRun.started_at >= since)
+        .order_by(RecurringRun.started_at.desc(), RecurringRun.id.desc())
+        .limit(limit)
+        .all()
+    )
+    return {
+        "window_days": window_days,
+        "summary": {
+            "runs": len(window),
+            "errors": sum(1 for row in window if row.status == "error"),
+            "max_processed_templates": max((row.processed_templates or 0 for row in window), default=0),
+            "duration_ms": _latency([row.duration_ms for row in window]),
+            "phases_ms": {
+                phase: _latency([getattr(row, f"{phase}_ms") for row in window]) for phase in RUN_PHASES
+            },
+        },
+        "runs": [run.to_dict() for run in recent],
+    }
@@ -1,86 +1,104 @@
-"""Background scheduler for recurring invoice generation."""
+"""Background scheduler for recurring invoice generation.
+
+Every worker process may run a scheduler, but only the holder of the
+``recurring-generation`` lease generates invoices on a tick. Run status is
+stored in the database so every worker reports the same state.
+"""
 
 from __future__ import annotations
 
 import threading
 from datetime import datetime, timezone
+from functools import partial
 
+from extensions import db
+from models.scheduler_state import RecurringRunState
+from services.recurring_checkpoint import RUN_STATE_ID, load_run_state
 from services.recurring_generator import generate_due_recurring_invoices
+from services.recurring_runs import record_recurring_run
+from services.scheduler_lease import (
+    get_lease,
+    process_holder_id,
+    release_lease,
+    renew_lease_in_transaction,
+    try_acquire_lease,
+)
+
+RECURRING_LEASE_NAME = "recurring-generation"
+
+# Serializes runs between the scheduler thread and run-now requests of one process.
+_generation_lock = threading.Lock()
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _record_run(run_date, started_at: datetime, result: dict | None, error: Exception | None) -> None:
+    state = load_run_state()
+    state.total_runs = RecurringRunState.total_runs + 1
+    state.last_run_at = _utc_now()
+    state.last_run_date = run_date
+    if error is None:
+        state.last_result = result
+    state.last_error = None if error is None else str(error)
+    state.last_holder = process_holder_id()
+    record_recurring_run(run_date, started_at, result, error, process_holder_id())
+    db.session.commit()
+
+
+def run_recurring_generation_for_date(run_date, lease_ttl_seconds: int | None = None):
+    """Execute one recurring generation run and persist its state and history.
+
+    With ``lease_ttl_seconds`` the run holds the generation lease and renews it
+    before every chunk commit, so a backfill outliving one TTL cannot overlap
+    with a worker that took the lease over.
+    """
+    renew_lease = None
+    if lease_ttl_seconds:
+        renew_lease = partial(renew_lease_in_transaction, RECURRING_LEASE_NAME, process_holder_id(), lease_ttl_seconds)
+
+    with _generation_lock:
+        started_at = _utc_now()
+        try:
+            result = generate_due_recurring_invoices(run_date, renew_lease=renew_lease)
+        except Exception as exc:
+            db.session.rollback()
+            _record_run(run_date, started_at, None, exc)
+            raise
+        _record_run(run_date, started_at, result, None)
+        return result
 
 
-class _RecurringRunState:
-    """Thread-safe in-memory state for recurring generation runs."""
-
-    def __init__(self):
-        self._lock = threading.Lock()
-        self._state = {
-            "total_runs": 0,
-            "last_run_at": None,
-            "last_run_date": None,
-            "last_result": None,
-            "last_error": None,
-        }
-
-    def mark_success(self, run_date, result: dict):
-        with self._lock:
-            self._state["total_runs"] += 1
-            self._state["last_run_at"] = datetime.now(timezone.utc).isoformat()
-            self._state["last_run_date"] = run_date.isoformat()
-            self._state["last_result"] = result
-            self._state["last_error"] = None
-
-    def mark_error(self, run_date, error: Exception):
-        with self._lock:
-            self._state["total_runs"] += 1
-            self._state["last_run_at"] = datetime.now(timezone.utc).isoformat()
-            self._state["last_run_date"] = run_date.isoformat()
-            self._state["last_error"] = str(error)
-
-    def snapshot(self) -> dict:
-        with self._lock:
-            return dict(self._state)
-
-    def reset(self):
-        with self._lock:
-            self._state = {
-                "total_runs": 0,
-                "last_run_at": None,
-                "last_run_date": None,
-                "last_result": None,
-                "last_error": None,
-            }
-
-
-_run_state = _RecurringRunState()
-
-
-def run_recurring_generation_for_date(run_date):
-    """Execute one recurring generation run and update run-state."""
-    try:
-        result = generate_due_recurring_invoices(run_date)
-        _run_state.mark_success(run_date, result)
-        return result
-    except Exception as exc:
-        _run_state.mark_error(run_date, exc)
-        raise
+def acquire_recurring_lease(ttl_seconds: int) -> bool:
+    """Acquire or renew the generation lease for this process."""
+    return try_acquire_lease(RECURRING_LEASE_NAME, process_holder_id(), ttl_seconds)
 
 
-def get_recurring_run_status() -> dict:
-    """Return snapshot of recurring generation run status."""
-    return _run_state.snapshot()
+def release_recurring_lease() -> None:
+    """Give up the generation lease if this process holds it."""
+    release_lease(RECURRING_LEASE_NAME, process_holder_id())
 
 
-def reset_recurring_run_status():
-    """Reset recurring generation run status (used by tests)."""
-    _run_state.reset()
+def get_recurring_run_status() -> dict:
+    """Return the shared recurring generation run status."""
+    state = db.session.get(RecurringRunState, RUN_STATE_ID, populate_existing=True)
+    status = state.to_dict() if state else RecurringRunState(total_runs=0).to_dict()
+    lease = get_lease(RECURRING_LEASE_NAME)
+    status["lease_holder"] = lease.holder if lease else None
+    status["lease_expires_at"] = lease.expires_at.isoformat() if lease else None
+    status["lease_held_by_this_worker"] = bool(lease and lease.holder == process_holder_id())
+    return status
 
 
 class RecurringScheduler:
-    """Small background loop that runs recurring generation periodically."""
+    """Small background loop that runs recurring generation while holding the lease."""
 
-    def __init__(self, app, interval_seconds: int):
+    def __init__(self, app, interval_seconds: int, lease_ttl_seconds: int | None = None):
         self._app = app
         self._interval_seconds = max(30, int(interval_seconds))
+        # The leader renews every interval, so the lease must outlive one interval.
+        self._lease_ttl_seconds = max(int(lease_ttl_seconds or 0), self._interval_seconds * 2)
         self._stop_event = threading.Event()
         self._thread = threading.Thread(
             target=self._run_loop,
@@ -94,10 +112,23 @@ class RecurringScheduler:
     def stop(self):
         self._stop_event.set()
         self._thread.join(timeout=2)
+        with self._app.app_context():
+            try:
+                release_recurring_lease()
+            except Exception:
+                db.session.rollback()
+
+    def _tick(self):
+        if acquire_recurring_lease(self._lease_ttl_seconds):
+            run_recurring_generation_for_date(datetime.now(timezone.utc).date(), self._lease_ttl_seconds)
 
     def _run_loop(self):
         while not self._stop_event.is_set():
-            today = datetime.now(timezone.utc).date()
             with self._app.app_context():
-                run_recurring_generation_for_date(today)
+                try:
+                    self._tick()
+                except Exception:
+                    # The failure is already recorded in run-state; keep ticking.
+                    db.session.rollback()
+                    self._app.logger.exception("Recurring generation tick failed")
             self._stop_event.wait(self._interval_seconds)
@@ -0,0 +1,39 @@
+"""Counters and phase timings of one recurring generation run."""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+@dataclass
+class GenerationStats:
+    generated: int = 0
+    skipped_existing: int = 0
+    skipped_paused: int = 0
+    skipped_not_due: int = 0
+    processed_templates: int = 0
+    chunks: int = 0
+    timings_ms: dict[str, float] = field(default_factory=dict)
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block and store its duration under ``timings_ms[name]``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.timings_ms[name] = round(self.timings_ms.get(name, 0.0) + elapsed, 3)
+
+    def to_dict(self) -> dict:
+        return {
+            "generated": self.generated,
+            "skipped_existing": self.skipped_existing,
+            "skipped_paused": self.skipped_paused,
+            "skipped_not_due": self.skipped_not_due,
+            "processed_templates": self.processed_templates,
+            "chunks": self.chunks,
+            "timings_ms": dict(self.timings_ms),
+        }
@@ -0,0 +1,95 @@
+"""Database-backed leader leases for background jobs shared by worker processes."""
+
+from __future__ import annotations
+
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert, or_, update
+from sqlalchemy.exc import IntegrityError
+
+from extensions import db
+from models.scheduler_state import SchedulerLease
+from services.conflict_insert import insert_ignoring_conflicts
+
+_holder_ids: dict[int, str] = {}
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def process_holder_id() -> str:
+    """Return a lease holder id unique to this process.
+
+    Keyed by pid so workers forked from a preloaded app get distinct ids.
+    """
+    pid = os.getpid()
+    if pid not in _holder_ids:
+        _holder_ids[pid] = f"{socket.gethostname()}:{pid}:{uuid.uuid4().hex[:8]}"
+    return _holder_ids[pid]
+
+
+class LeaseLostError(RuntimeError):
+    """Raised when a long-running job finds another worker now holds its lease."""
+
+
+def _claim(name: str, holder: str, ttl_seconds: int, now: datetime):
+    """Take over an expired lease or renew our own, without committing."""
+    table = SchedulerLease.__table__
+    return db.session.execute(
+        update(table)
+        .where(table.c.name == name, or_(table.c.holder == holder, table.c.expires_at < now))
+        .values(holder=holder, expires_at=now + timedelta(seconds=ttl_seconds))
+    )
+
+
+def try_acquire_lease(name: str, holder: str, ttl_seconds: int, now: datetime | None = None) -> bool:
+    """Acquire or renew ``name`` for ``holder``; return whether it is held.
+
+    A single conditional UPDATE takes over expired leases and renews our
+    own, so two workers can never both observe success for the same lease.
+    """
+    now = now or _utc_now()
+    expires_at = now + timedelta(seconds=ttl_seconds)
+    table = SchedulerLease.__table__
+    result = _claim(name, holder, ttl_seconds, now)
+    if result.rowcount == 0:
+        stmt = insert_ignoring_conflicts(table, ["name"])
+        if stmt is None:
+            stmt = insert(table)
+        try:
+            result = db.session.execute(stmt.values(name=name, holder=holder, expires_at=expires_at))
+        except IntegrityError:
+            db.session.rollback()
+            return False
+    db.session.commit()
+    return result.rowcount == 1
+
+
+def renew_lease_in_transaction(name: str, holder: str, ttl_seconds: int, now: datetime | None = None) -> bool:
+    """Renew ``name`` inside the caller's open transaction; return whether it is held.
+
+    Nothing is committed, so the caller's pending writes and the renewal land
+    together: if another worker took the lease over, the caller rolls back
+    instead of committing work the new holder may be repeating.
+    """
+    return _claim(name, holder, ttl_seconds, now or _utc_now()).rowcount == 1
+
+
+def release_lease(name: str, holder: str) -> None:
+    """Expire ``name`` immediately if ``holder`` owns it, enabling fast failover."""
+    table = SchedulerLease.__table__
+    db.session.execute(
+        update(table)
+        .where(table.c.name == name, table.c.holder == holder)
+        .values(expires_at=_utc_now())
+    )
+    db.session.commit()
+
+
+def get_lease(name: str) -> SchedulerLease | None:
+    """Return the current lease row for ``name``, if any."""
+    return db.session.get(SchedulerLease, name, populate_existing=True)
@@ -0,0 +1,54 @@
+"""
+SQLite connection tuning applied through SQLAlchemy connect events.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+
+
+def _choice(value: Any, allowed: set[str], name: str) -> str:
+    normalized = str(value).strip().upper()
+    if normalized not in allowed:
+        raise ValueError(f"{name} must be one of {sorted(allowed)}")
+    return normalized
+
+
+def build_sqlite_pragmas(config: dict) -> list[tuple[str, str]]:
+    """Translate SQLITE_* config values into validated PRAGMA statements."""
+    return [
+        ("journal_mode", _choice(config.get("SQLITE_JOURNAL_MODE", "WAL"), _JOURNAL_MODES, "SQLITE_JOURNAL_MODE")),
+        ("synchronous", _choice(config.get("SQLITE_SYNCHRONOUS", "NORMAL"), _SYNCHRONOUS_MODES, "SQLITE_SYNCHRONOUS")),
+        ("busy_timeout", str(int(config.get("SQLITE_BUSY_TIMEOUT_MS", 5000)))),
+        ("cache_size", str(int(config.get("SQLITE_CACHE_SIZE", -64000)))),
+        ("mmap_size", str(int(config.get("SQLITE_MMAP_SIZE", 268435456)))),
+        ("temp_store", _choice(config.get("SQLITE_TEMP_STORE", "MEMORY"), _TEMP_STORES, "SQLITE_TEMP_STORE")),
+    ]
+
+
+def apply_sqlite_profile(engine: Engine, config: dict) -> bool:
+    """Run the tuning PRAGMAs on every new connection of a SQLite engine.
+
+    Returns whether the profile was installed (non-SQLite engines and
+    ``SQLITE_TUNING_ENABLED = False`` are left untouched).
+    """
+    if engine.dialect.name != "sqlite" or not config.get("SQLITE_TUNING_ENABLED", True):
+        return False
+    pragmas = build_sqlite_pragmas(config)
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return True
@@ -2,27 +2,26 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
 import sys
 
 import pytest
+from sqlalchemy import event
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import app as app_module
 from extensions import db
-from services.recurring_scheduler import reset_recurring_run_status
+from services.gmail_client_cache import gmail_client_cache
 
 
-@pytest.fixture()
-def app(tmp_path: Path):
-    """Create an isolated app instance with in-memory database."""
-
+def _create_test_app(tmp_path: Path, database_uri: str):
     class TestConfig:
         DEBUG = False
         TESTING = True
         SECRET_KEY = "test-secret"
-        SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+        SQLALCHEMY_DATABASE_URI = database_uri
         SQLALCHEMY_TRACK_MODIFICATIONS = False
         CORS_ORIGINS = ["http://localhost:5173"]
         PDF_STORAGE_PATH = str(tmp_path / "invoices")
@@ -33,6 +32,7 @@ def app(tmp_path: Path):
         GMAIL_SCOPES = []
         GMAIL_REDIRECT_URI = "http://localhost:5000/api/accounts/oauth/callback"
         GMAIL_SYNC_MAX_RESULTS = 50
+        GMAIL_BATCH_RETRY_BACKOFF_SECONDS = 0
         FRONTEND_BASE_URL = "http://localhost:5173"
         MAX_GMAIL_ACCOUNTS = 2
         TIMEZONE = "Europe/Budapest"
@@ -40,27 +40,59 @@ def app(tmp_path: Path):
         RECURRING_SCHEDULER_INTERVAL_SECONDS = 300
 
     app_module.config["test"] = TestConfig
+    gmail_client_cache.invalidate()  # account ids repeat between tests
     test_app = app_module.create_app("test")
 
     with test_app.app_context():
         db.create_all()
+    return test_app
 
-    yield test_app
 
+def _drop_test_app(test_app) -> None:
     with test_app.app_context():
         db.session.remove()
         db.drop_all()
 
 
+@pytest.fixture()
+def app(tmp_path: Path):
+    """Create an isolated app instance with in-memory database."""
+    test_app = _create_test_app(tmp_path, "sqlite:///:memory:")
+    yield test_app
+    _drop_test_app(test_app)
+
+
+@pytest.fixture()
+def file_db_app(tmp_path: Path):
+    """App on a SQLite file, so threads get their own connections (unlike :memory:)."""
+    test_app = _create_test_app(tmp_path, f"sqlite:///{tmp_path / 'test.db'}")
+    yield test_app
+    _drop_test_app(test_app)
+
+
 @pytest.fixture()
 def client(app):
     """Flask test client."""
     return app.test_client()
 
 
-@pytest.fixture(autouse=True)
-def reset_recurring_state():
-    """Keep recurring run-state isolated between tests."""
-    reset_recurring_run_status()
-    yield
-    reset_recurring_run_status()
+@pytest.fixture()
+def count_queries(app):
+    """Context manager factory counting SQL statements sent by the app's engine."""
+
+    @contextmanager
+    def counting():
+        counter = {"count": 0}
+
+        def before_cursor_execute(*_args, **_kwargs):
+            counter["count"] += 1
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield counter
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return counting
@@ -0,0 +1,74 @@
+"""Offline Gmail API doubles built on googleapiclient's HttpMockSequence."""
+
+from __future__ import annotations
+
+import base64
+import json
+
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpMockSequence
+
+_BOUNDARY = "batch_boundary"
+_REASONS = {200: "OK", 404: "Not Found", 503: "Service Unavailable"}
+
+
+def gmail_message(message_id: str, text: str = "Invoice total: 4 990 HUF") -> dict:
+    body = base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii")
+    return {
+        "id": message_id,
+        "snippet": text,
+        "payload": {
+            "mimeType": "text/plain",
+            "headers": [
+                {"name": "Subject", "value": f"Invoice {message_id}"},
+                {"name": "Message-ID", "value": f"<{message_id}@mail.example>"},
+            ],
+            "body": {"data": body},
+        },
+    }
+
+
+def error_payload(status: int) -> dict:
+    return {"error": {"code": status, "message": _REASONS[status]}}
+
+
+def batch_response(*parts: tuple) -> tuple[dict, str]:
+    """Multipart batch response; each part is (message id, HTTP status[, message])."""
+    chunks = []
+    for message_id, status, *message in parts:
+        payload = (message[0] if message else gmail_message(message_id)) if status == 200 else error_payload(status)
+        chunks.append(
+            f"--{_BOUNDARY}\r\nContent-Type: application/http\r\n"
+            f"Content-ID: <response-batch + {message_id}>\r\n\r\n"
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\nContent-Type: application/json\r\n\r\n"
+            f"{json.dumps(payload)}\r\n"
+        )
+    headers = {"status": "200", "content-type": f"multipart/mixed; boundary={_BOUNDARY}"}
+    return headers, "".join(chunks) + f"--{_BOUNDARY}--"
+
+
+class RecordingHttpMockSequence(HttpMockSequence):
+    """HttpMockSequence that also keeps (uri, body) of every request."""
+
+    def __init__(self, iterable):
+        super().__init__(iterable)
+        self.requests: list[tuple[str, str]] = []
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=1, connection_type=None):
+        self.requests.append((uri, body or ""))
+        return super().request(uri, method, body, headers, redirections, connection_type)
+
+
+def mock_gmail(*responses):
+    """Gmail service answering requests with ``responses`` in order (static discovery)."""
+    return build("gmail", "v1", http=HttpMockSequence(list(responses)), static_discovery=True)
+
+
+def recording_gmail(*responses):
+    """Like ``mock_gmail``; also returns the list of recorded (uri, body) requests."""
+    http = RecordingHttpMockSequence(list(responses))
+    return build("gmail", "v1", http=http, static_discovery=True), http.requests
+
+
+def json_response(payload: dict, status: int = 200) -> tuple[dict, str]:
+    return {"status": str(status)}, json.dumps(payload)
@@ -0,0 +1,89 @@
+"""API tests for ETag / If-None-Match support on list endpoints."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import text
+
+from extensions import db
+from models.database import Invoice, RecurringInvoice
+from models.table_versions import TableVersion
+
+
+def test_unchanged_invoice_list_returns_304(client):
+    client.post("/api/invoices", json={"name": "Gas", "amount": 5000, "due_date": "2026-03-01"})
+    first = client.get("/api/invoices")
+    etag = first.headers["ETag"]
+
+    second = client.get("/api/invoices", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert second.data == b""
+
+
+def test_invoice_write_invalidates_etag(client, app):
+    first = client.get("/api/invoices")
+    etag = first.headers["ETag"]
+
+    with app.app_context():
+        db.session.add(Invoice(name="Water", amount=3000, due_date=date(2026, 3, 2), is_recurring=False))
+        db.session.commit()
+
+    second = client.get("/api/invoices", headers={"If-None-Match": etag})
+
+    assert second.status_code == 200
+    assert second.headers["ETag"] != etag
+    assert len(second.get_json()["data"]) == 1
+
+
+def test_rolled_back_write_keeps_etag(client, app):
+    etag = client.get("/api/recurring").headers["ETag"]
+
+    with app.app_context():
+        db.session.add(RecurringInvoice(name="Rollback", amount=100, day_of_month=1))
+        db.session.flush()
+        db.session.rollback()
+
+    response = client.get("/api/recurring", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+
+
+def test_account_etag_ignores_unrelated_tables(client):
+    etag = client.get("/api/accounts").headers["ETag"]
+    client.post("/api/recurring", json={"name": "Unrelated", "amount": 990, "day_of_month": 3})
+
+    unchanged = client.get("/api/accounts", headers={"If-None-Match": etag})
+    client.post("/api/accounts", json={"email": "etag@example.com"})
+    changed = client.get("/api/accounts", headers={"If-None-Match": etag})
+
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+
+
+def test_versions_are_shared_through_the_database(client, app):
+    client.post("/api/invoices", json={"name": "Gas", "amount": 5000, "due_date": "2026-03-01"})
+    etag = client.get("/api/invoices").headers["ETag"]
+
+    with app.app_context():
+        assert db.session.get(TableVersion, "invoices").version == 1
+        # Another worker's commit only reaches this process through the table.
+        db.session.execute(text("UPDATE table_versions SET version = version + 1 WHERE table_name = 'invoices'"))
+        db.session.commit()
+
+    response = client.get("/api/invoices", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+
+
+def test_query_arguments_are_part_of_the_etag(client):
+    all_tag = client.get("/api/invoices?status=all").headers["ETag"]
+    paid_tag = client.get("/api/invoices?status=paid").headers["ETag"]
+
+    response = client.get("/api/invoices?status=paid", headers={"If-None-Match": all_tag})
+
+    assert all_tag != paid_tag
+    assert response.status_code == 200
@@ -0,0 +1,73 @@
+"""Offline tests for batched Gmail message fetching."""
+
+from __future__ import annotations
+
+from extensions import db
+from gmail_http_mocks import batch_response, json_response, mock_gmail
+from models.database import GmailAccount
+from services.gmail_batch import fetch_messages
+
+
+def test_fetches_in_chunks(app):
+    gmail = mock_gmail(batch_response(("m1", 200), ("m2", 200)), batch_response(("m3", 200)))
+
+    with app.app_context():
+        result = fetch_messages(gmail, ["m1", "m2", "m3"], chunk_size=2)
+
+    assert list(result.messages) == ["m1", "m2", "m3"]
+    assert result.errors == {}
+    assert result.batches == 2
+    assert result.retried == 0
+
+
+def test_retries_only_transient_sub_request_failures(app):
+    gmail = mock_gmail(
+        batch_response(("m1", 200), ("m2", 503), ("m3", 404)),
+        batch_response(("m2", 200)),
+    )
+
+    with app.app_context():
+        result = fetch_messages(gmail, ["m1", "m2", "m3"])
+
+    assert set(result.messages) == {"m1", "m2"}
+    assert result.errors == {"m3": "HTTP 404: Not Found"}
+    assert result.retryable == set()
+    assert result.batches == 2
+    assert result.retried == 1
+
+
+def test_failed_batch_is_retried_then_reported(app):
+    unavailable = ({"status": "503"}, "")
+    gmail = mock_gmail(unavailable, unavailable)
+
+    with app.app_context():
+        result = fetch_messages(gmail, ["m1", "m2"], max_retries=1)
+
+    assert result.messages == {}
+    assert set(result.errors) == {"m1", "m2"}
+    assert result.retryable == {"m1", "m2"}
+    assert result.batches == 2
+
+
+def test_sync_reports_fetch_errors(client, app, monkeypatch):
+    gmail = mock_gmail(
+        json_response({"historyId": "500"}),
+        json_response({"messages": [{"id": "m1"}, {"id": "m2"}]}),
+        batch_response(("m1", 200), ("m2", 404)),  # metadata pass
+        batch_response(("m1", 200)),
+    )
+    monkeypatch.setattr("services.gmail_service._load_credentials", lambda account: None)
+    monkeypatch.setattr("services.gmail_service.build", lambda *args, **kwargs: gmail)
+    with app.app_context():
+        account = GmailAccount(email="batch@example.com", is_active=True, credentials_json="{}")
+        db.session.add(account)
+        db.session.commit()
+        account_id = account.id
+
+    data = client.post(f"/api/accounts/{account_id}/sync").get_json()["data"]
+
+    assert data["scanned_messages"] == 2
+    assert data["batch_requests"] == 2
+    assert data["imported_invoices"] == 1
+    assert data["fetch_errors"] == 1
+    assert data["fetch_error_samples"] == [{"id": "m2", "error": "HTTP 404: Not Found"}]
@@ -0,0 +1,114 @@
+"""Tests for the per-account Gmail client cache."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from google.oauth2.credentials import Credentials
+import pytest
+
+from extensions import db
+from models.database import GmailAccount
+from services.gmail_client_cache import gmail_client_cache
+from services.gmail_filters import embed_oauth_credentials, extract_oauth_credentials
+from services.gmail_service import build_gmail_client
+
+
+def _oauth(token: str, expires_in: timedelta = timedelta(hours=1)) -> dict:
+    return {
+        "token": token,
+        "refresh_token": "refresh",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "client_id": "client",
+        "client_secret": "secret",
+        "scopes": [],
+        "expiry": (datetime.utcnow() + expires_in).isoformat(),
+    }
+
+
+@pytest.fixture()
+def builds(monkeypatch):
+    calls = []
+
+    def build(*_args, credentials, **_kwargs):
+        calls.append(credentials)
+        return object()
+
+    monkeypatch.setattr("services.gmail_service.build", build)
+    return calls
+
+
+def _account(app, token: str = "first") -> int:
+    with app.app_context():
+        account = GmailAccount(email="cache@example.com", credentials_json=embed_oauth_credentials("{}", _oauth(token)))
+        db.session.add(account)
+        db.session.commit()
+        return account.id
+
+
+def test_repeated_builds_reuse_the_client(app, builds):
+    account_id = _account(app)
+
+    with app.app_context():
+        account = db.session.get(GmailAccount, account_id)
+        first = build_gmail_client(account)
+        second = build_gmail_client(account)
+
+    assert first is second
+    assert len(builds) == 1
+
+
+def test_changed_credentials_json_rebuilds(app, builds):
+    account_id = _account(app)
+
+    with app.app_context():
+        account = db.session.get(GmailAccount, account_id)
+        first = build_gmail_client(account)
+        account.credentials_json = embed_oauth_credentials(account.credentials_json, _oauth("reconnected"))
+        second = build_gmail_client(account)
+
+    assert first is not second
+    assert [creds.token for creds in builds] == ["first", "reconnected"]
+
+
+def test_expired_token_is_refreshed_without_rebuilding(app, builds, monkeypatch):
+    def refresh(self, _request):
+        self.token = "refreshed"
+        self.expiry = datetime.utcnow() + timedelta(hours=1)
+
+    monkeypatch.setattr(Credentials, "refresh", refresh)
+    account_id = _account(app)
+
+    with app.app_context():
+        account = db.session.get(GmailAccount, account_id)
+        service = build_gmail_client(account)
+        builds[0].expiry = datetime.utcnow() - timedelta(minutes=1)
+
+        assert build_gmail_client(account) is service
+        assert build_gmail_client(account) is service
+        stored = extract_oauth_credentials(db.session.get(GmailAccount, account_id).credentials_json)
+
+    assert len(builds) == 1
+    assert builds[0].token == stored["token"] == "refreshed"
+
+
+def test_deleting_account_evicts_its_client(client, app, builds):
+    account_id = _account(app)
+    with app.app_context():
+        build_gmail_client(db.session.get(GmailAccount, account_id))
+
+    assert len(gmail_client_cache) == 1
+    client.delete(f"/api/accounts/{account_id}")
+    assert len(gmail_client_cache) == 0
+
+
+def test_cache_can_be_disabled(app, builds):
+    app.config["GMAIL_CLIENT_CACHE"] = False
+    account_id = _account(app)
+
+    with app.app_context():
+        account = db.session.get(GmailAccount, account_id)
+        build_gmail_client(account)
+        build_gmail_client(account)
+
+    assert len(builds) == 2
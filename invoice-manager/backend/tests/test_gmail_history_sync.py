@@ -0,0 +1,159 @@
+"""Offline tests for incremental Gmail sync through the history API."""
+
+from __future__ import annotations
+
+from extensions import db
+from urllib.parse import unquote_plus
+
+from gmail_http_mocks import batch_response, error_payload, gmail_message, json_response, mock_gmail, recording_gmail
+from models.database import GmailAccount
+
+
+def _setup(app, monkeypatch, *responses, history_id: str | None = None, gmail=None) -> int:
+    gmail = gmail or mock_gmail(*responses)
+    monkeypatch.setattr("services.gmail_service._load_credentials", lambda account: None)
+    monkeypatch.setattr("services.gmail_service.build", lambda *args, **kwargs: gmail)
+    with app.app_context():
+        account = GmailAccount(email="history@example.com", credentials_json="{}", history_id=history_id)
+        db.session.add(account)
+        db.session.commit()
+        return account.id
+
+
+def _sync(client, account_id: int) -> dict:
+    return client.post(f"/api/accounts/{account_id}/sync").get_json()["data"]
+
+
+def _stored_history_id(app, account_id: int) -> str | None:
+    with app.app_context():
+        return db.session.get(GmailAccount, account_id).history_id
+
+
+def test_first_sync_is_full_and_stores_history_id(client, app, monkeypatch):
+    account_id = _setup(
+        app,
+        monkeypatch,
+        json_response({"historyId": "100"}),
+        json_response({"messages": [{"id": "m1"}]}),
+        batch_response(("m1", 200)),
+        batch_response(("m1", 200)),
+    )
+
+    data = _sync(client, account_id)
+
+    assert (data["sync_mode"], data["history_id"], data["imported_invoices"]) == ("full", "100", 1)
+    assert _stored_history_id(app, account_id) == "100"
+
+
+def test_incremental_sync_without_changes_is_one_call(client, app, monkeypatch):
+    account_id = _setup(app, monkeypatch, json_response({"historyId": "120"}), history_id="100")
+
+    data = _sync(client, account_id)
+
+    assert (data["sync_mode"], data["scanned_messages"], data["batch_requests"]) == ("incremental", 0, 0)
+    assert _stored_history_id(app, account_id) == "120"
+
+
+def test_incremental_sync_fetches_only_changed_messages(client, app, monkeypatch):
+    gmail, requests = recording_gmail(
+        json_response({"history": [{"messagesAdded": [{"message": {"id": "m3"}}]}], "historyId": "130"}),
+        batch_response(("m3", 200)),  # metadata of the changed message
+        json_response({"messages": [{"id": "m3"}]}),  # query membership of its Message-ID
+        batch_response(("m3", 200)),
+    )
+    account_id = _setup(app, monkeypatch, gmail=gmail, history_id="100")
+
+    data = _sync(client, account_id)
+    membership_uri = unquote_plus(requests[2][0])
+
+    assert data["sync_mode"] == "incremental"
+    assert data["scanned_messages"] == 1
+    assert [sample["gmail_message_id"] for sample in data["imported_invoice_samples"]] == ["m3"]
+    assert _stored_history_id(app, account_id) == "130"
+    # One new mail costs four requests, whatever the mailbox size or max_results.
+    assert len(requests) == 4
+    assert "rfc822msgid:m3@mail.example" in membership_uri
+    assert 'label:"InvoiceManager"' in membership_uri
+
+
+def test_incremental_sync_skips_changes_outside_the_query(client, app, monkeypatch):
+    spam = {**gmail_message("m5"), "labelIds": ["SPAM"]}
+    account_id = _setup(
+        app,
+        monkeypatch,
+        json_response({"history": [{"labelsAdded": [{"message": {"id": "m4"}}, {"message": {"id": "m5"}}]}],
+                       "historyId": "140"}),
+        batch_response(("m4", 200), ("m5", 200, spam)),
+        json_response({}),  # m4 does not match the label/query
+        history_id="100",
+    )
+
+    data = _sync(client, account_id)
+
+    assert (data["sync_mode"], data["scanned_messages"], data["imported_invoices"]) == ("incremental", 0, 0)
+    assert _stored_history_id(app, account_id) == "140"
+
+
+def test_deleted_message_does_not_hold_back_history_id(client, app, monkeypatch):
+    app.config["GMAIL_CLIENT_CACHE"] = False  # the stubbed credentials cannot be revalidated
+    account_id = _setup(
+        app,
+        monkeypatch,
+        json_response({"history": [{"messagesAdded": [{"message": {"id": "gone"}}]}], "historyId": "150"}),
+        batch_response(("gone", 404)),
+        json_response({"historyId": "150"}),
+        history_id="100",
+    )
+
+    first = _sync(client, account_id)
+    second = _sync(client, account_id)
+
+    assert (first["sync_mode"], first["history_id"], first["fetch_errors"]) == ("incremental", "150", 1)
+    assert (second["scanned_messages"], second["batch_requests"]) == (0, 0)
+    assert _stored_history_id(app, account_id) == "150"
+
+
+def test_transient_fetch_error_keeps_history_id(client, app, monkeypatch):
+    app.config["GMAIL_BATCH_MAX_RETRIES"] = 0
+    account_id = _setup(
+        app,
+        monkeypatch,
+        json_response({"history": [{"messagesAdded": [{"message": {"id": "m6"}}]}], "historyId": "160"}),
+        batch_response(("m6", 503)),
+        history_id="100",
+    )
+
+    data = _sync(client, account_id)
+
+    assert (data["sync_mode"], data["fetch_errors"]) == ("incremental", 1)
+    assert _stored_history_id(app, account_id) == "100"
+
+
+def test_expired_history_falls_back_to_full_sync(client, app, monkeypatch):
+    account_id = _setup(
+        app,
+        monkeypatch,
+        json_response(error_payload(404), status=404),
+        json_response({"historyId": "200"}),
+        json_response({"messages": [{"id": "m1"}]}),
+        batch_response(("m1", 200)),
+        batch_response(("m1", 200)),
+        history_id="1",
+    )
+
+    data = _sync(client, account_id)
+
+    assert (data["sync_mode"], data["imported_invoices"]) == ("full", 1)
+    assert _stored_history_id(app, account_id) == "200"
+
+
+def test_filter_change_resets_history_id(client, app, monkeypatch):
+    account_id = _setup(app, monkeypatch, history_id="100")
+
+    unchanged = client.put(f"/api/accounts/{account_id}/filters", json={"is_active": True})
+    stored_after_unchanged = _stored_history_id(app, account_id)
+    client.put(f"/api/accounts/{account_id}/filters", json={"gmail_query": "from:billing@example.com"})
+
+    assert unchanged.status_code == 200
+    assert stored_after_unchanged == "100"
+    assert _stored_history_id(app, account_id) is None
@@ -0,0 +1,128 @@
+"""API tests for deduplicated Gmail invoice import."""
+
+from __future__ import annotations
+
+import base64
+from datetime import date
+from types import SimpleNamespace
+
+from extensions import db
+from models.database import GmailAccount, Invoice
+from services.gmail_import import import_gmail_invoices
+
+
+class _Call:
+    def __init__(self, result):
+        self._result = result
+
+    def execute(self):
+        return self._result
+
+
+class _Batch:
+    def __init__(self, callback):
+        self._callback = callback
+        self._calls = []
+
+    def add(self, call, request_id):
+        self._calls.append((request_id, call))
+
+    def execute(self):
+        for request_id, call in self._calls:
+            self._callback(request_id, call.execute(), None)
+
+
+class FakeGmail:
+    """Minimal stand-in for the googleapiclient Gmail resource."""
+
+    def __init__(self, messages: dict[str, str]):
+        self._messages = messages
+
+    def users(self):
+        return self
+
+    def getProfile(self, userId):
+        # No history id: every sync lists the full query.
+        return _Call({})
+
+    def messages(self):
+        return self
+
+    def list(self, **_kwargs):
+        return _Call({"messages": [{"id": message_id} for message_id in self._messages]})
+
+    def new_batch_http_request(self, callback):
+        return _Batch(callback)
+
+    def get(self, userId, id, **_kwargs):
+        body = base64.urlsafe_b64encode(self._messages[id].encode("utf-8")).decode("ascii")
+        return _Call({
+            "id": id,
+            "payload": {
+                "mimeType": "text/plain",
+                "headers": [{"name": "Subject", "value": f"Invoice {id}"}, {"name": "From", "value": "billing@example.com"}],
+                "body": {"data": body},
+            },
+        })
+
+
+def _setup(app, monkeypatch, messages: dict[str, str]) -> int:
+    monkeypatch.setattr("services.gmail_service._load_credentials", lambda account: SimpleNamespace(valid=True))
+    monkeypatch.setattr("services.gmail_service.build", lambda *args, **kwargs: FakeGmail(messages))
+    with app.app_context():
+        account = GmailAccount(email="sync@example.com", is_active=True, credentials_json="{}")
+        db.session.add(account)
+        db.session.commit()
+        return account.id
+
+
+def test_sync_imports_once_and_reports_duplicates(client, app, monkeypatch):
+    account_id = _setup(app, monkeypatch, {
+        "m1": "Total: 12 500 HUF\nDue date: 2026-03-01",
+        "m2": "Amount to pay 4000 Ft",
+        "m3": "No numbers here",
+    })
+
+    first = client.post(f"/api/accounts/{account_id}/sync").get_json()["data"]
+    second = client.post(f"/api/accounts/{account_id}/sync").get_json()["data"]
+
+    assert (first["imported_invoices"], first["skipped_duplicates"], first["skipped_no_amount"]) == (2, 0, 1)
+    assert (second["imported_invoices"], second["skipped_duplicates"]) == (0, 2)
+    with app.app_context():
+        invoices = Invoice.query.order_by(Invoice.id).all()
+        assert [(inv.gmail_message_id, inv.pdf_path) for inv in invoices] == [("m1", None), ("m2", None)]
+        assert invoices[0].amount == 12500
+        assert invoices[0].sender == "billing@example.com"
+
+
+def test_sync_samples_include_account_email(client, app, monkeypatch):
+    account_id = _setup(app, monkeypatch, {"m1": "Total: 990 HUF"})
+
+    data = client.post(f"/api/accounts/{account_id}/sync").get_json()["data"]
+
+    assert data["imported_invoice_samples"][0]["gmail_account_email"] == "sync@example.com"
+    assert data["imported_invoice_samples"][0]["gmail_message_id"] == "m1"
+
+
+def test_import_dedupes_within_one_batch_and_per_account(app):
+    with app.app_context():
+        first = GmailAccount(email="a@example.com", is_active=True, credentials_json="{}")
+        second = GmailAccount(email="b@example.com", is_active=True, credentials_json="{}")
+        db.session.add_all([first, second])
+        db.session.flush()
+        candidate = {
+            "gmail_message_id": "shared",
+            "name": "Gas",
+            "amount": 100,
+            "currency": "HUF",
+            "due_date": date(2026, 3, 1),
+            "payment_link": None,
+            "sender": None,
+        }
+
+        imported, duplicates = import_gmail_invoices(first, [candidate, dict(candidate)])
+        other, other_duplicates = import_gmail_invoices(second, [candidate])
+        db.session.commit()
+
+        assert (len(imported), duplicates) == (1, 1)
+        assert (len(other), other_duplicates) == (1, 0)
@@ -0,0 +1,71 @@
+"""Tests for the metadata prefilter that precedes full Gmail downloads."""
+
+from __future__ import annotations
+
+from extensions import db
+from gmail_http_mocks import batch_response, json_response, recording_gmail
+from models.database import GmailAccount
+from services.gmail_classifier import is_invoice_candidate
+
+
+def _metadata(subject: str, sender: str = "news@shop.example", snippet: str = "", mime_type: str = "text/plain") -> dict:
+    return {
+        "snippet": snippet,
+        "payload": {
+            "mimeType": mime_type,
+            "headers": [{"name": "Subject", "value": subject}, {"name": "From", "value": sender}],
+        },
+    }
+
+
+def _setup(app, monkeypatch, gmail) -> int:
+    monkeypatch.setattr("services.gmail_service._load_credentials", lambda account: None)
+    monkeypatch.setattr("services.gmail_service.build", lambda *args, **kwargs: gmail)
+    with app.app_context():
+        account = GmailAccount(email="prefilter@example.com", credentials_json="{}")
+        db.session.add(account)
+        db.session.commit()
+        return account.id
+
+
+def test_classifier_keeps_anything_that_may_be_an_invoice():
+    assert is_invoice_candidate(_metadata("Számla érkezett"))
+    assert is_invoice_candidate(_metadata("Your order", snippet="Total 12 990 Ft"))
+    assert is_invoice_candidate(_metadata("March statement", sender="Acme Billing <billing@acme.example>"))
+    assert is_invoice_candidate(_metadata("Documents", mime_type="multipart/mixed"))
+    assert not is_invoice_candidate(_metadata("Weekly deals", snippet="Up to 30% off this weekend"))
+
+
+def test_sync_downloads_only_candidates_in_full(client, app, monkeypatch):
+    newsletter = {"id": "m2", **_metadata("Weekly deals", snippet="New arrivals")}
+    gmail, requests = recording_gmail(
+        json_response({"historyId": "10"}),
+        json_response({"messages": [{"id": "m1"}, {"id": "m2"}]}),
+        batch_response(("m1", 200), ("m2", 200, newsletter)),
+        batch_response(("m1", 200)),
+    )
+    account_id = _setup(app, monkeypatch, gmail)
+
+    data = client.post(f"/api/accounts/{account_id}/sync").get_json()["data"]
+    metadata_batch, full_batch = requests[2][1], requests[3][1]
+
+    assert (data["scanned_messages"], data["skipped_not_invoice"], data["imported_invoices"]) == (2, 1, 1)
+    assert metadata_batch.count("format=metadata") == 2
+    assert "fields=id%2CthreadId%2ClabelIds%2CinternalDate%2Csnippet%2Cpayload%28mimeType%2Cheaders%29" in metadata_batch
+    assert "messages/m1?format=full" in full_batch
+    assert "messages/m2" not in full_batch
+
+
+def test_prefilter_can_be_disabled(client, app, monkeypatch):
+    app.config["GMAIL_METADATA_PREFILTER"] = False
+    gmail, requests = recording_gmail(
+        json_response({"historyId": "10"}),
+        json_response({"messages": [{"id": "m1"}]}),
+        batch_response(("m1", 200)),
+    )
+    account_id = _setup(app, monkeypatch, gmail)
+
+    data = client.post(f"/api/accounts/{account_id}/sync").get_json()["data"]
+
+    assert (data["batch_requests"], data["skipped_not_invoice"], data["imported_invoices"]) == (1, 0, 1)
+    assert len(requests) == 3
@@ -0,0 +1,99 @@
+"""API tests for concurrent sync of all Gmail accounts."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from extensions import db
+from gmail_http_mocks import batch_response, json_response, mock_gmail
+from models.database import GmailAccount, Invoice
+from services.gmail_service import GmailServiceError
+from services.gmail_sync_all import account_sync_lock
+
+
+@pytest.fixture()
+def app(file_db_app):
+    return file_db_app
+
+
+def _mailbox(message_id: str):
+    return mock_gmail(
+        json_response({"historyId": "10"}),
+        json_response({"messages": [{"id": message_id}]}),
+        batch_response((message_id, 200)),
+        batch_response((message_id, 200)),
+    )
+
+
+def _mailboxes(emails: list[str]) -> dict:
+    return {email: _mailbox(f"msg-{index}") for index, email in enumerate(emails)}
+
+
+def _setup(app, monkeypatch, mailboxes: dict, build=None) -> dict[str, int]:
+    def load_credentials(account):
+        if account.email.startswith("broken"):
+            raise GmailServiceError("Stored Gmail token is invalid. Reconnect the account.")
+        return account.email
+
+    monkeypatch.setattr("services.gmail_service._load_credentials", load_credentials)
+    monkeypatch.setattr(
+        "services.gmail_service.build",
+        build or (lambda *_args, credentials, **_kwargs: mailboxes[credentials]),
+    )
+    with app.app_context():
+        accounts = [GmailAccount(email=email, credentials_json="{}") for email in mailboxes]
+        accounts.append(GmailAccount(email="paused@example.com", credentials_json="{}", is_active=False))
+        db.session.add_all(accounts)
+        db.session.commit()
+        return {account.email: account.id for account in accounts}
+
+
+def test_sync_all_runs_active_accounts_concurrently(client, app, monkeypatch):
+    emails = ["a@example.com", "b@example.com"]
+    mailboxes = _mailboxes(emails)
+    both_started = threading.Barrier(2, timeout=5)
+
+    def build(*_args, credentials, **_kwargs):
+        both_started.wait()  # fails unless both accounts are syncing at once
+        return mailboxes[credentials]
+
+    _setup(app, monkeypatch, mailboxes, build=build)
+
+    response = client.post("/api/accounts/sync-all", json={"max_results": 10})
+    data = response.get_json()["data"]
+
+    assert response.status_code == 200
+    assert (data["accounts"], data["succeeded"], data["failed"], data["skipped"]) == (2, 2, 0, 0)
+    assert data["imported_invoices"] == 2
+    assert [item["email"] for item in data["results"]] == emails
+    assert all(item["duration_ms"] > 0 and item["result"]["imported_invoices"] == 1 for item in data["results"])
+    with app.app_context():
+        assert Invoice.query.count() == 2
+
+
+def test_failing_account_does_not_stop_the_others(client, app, monkeypatch):
+    _setup(app, monkeypatch, _mailboxes(["broken@example.com", "ok@example.com"]))
+
+    data = client.post("/api/accounts/sync-all").get_json()["data"]
+    broken, ok = data["results"]
+
+    assert (data["succeeded"], data["failed"]) == (1, 1)
+    assert broken["status"] == "error"
+    assert broken["error"] == "Stored Gmail token is invalid. Reconnect the account."
+    assert ok["status"] == "ok"
+
+
+def test_account_lock_prevents_overlapping_syncs(client, app, monkeypatch):
+    ids = _setup(app, monkeypatch, _mailboxes(["locked@example.com"]))
+    lock = account_sync_lock(ids["locked@example.com"])
+
+    with lock:
+        single = client.post(f"/api/accounts/{ids['locked@example.com']}/sync")
+        data = client.post("/api/accounts/sync-all").get_json()["data"]
+
+    assert single.status_code == 409
+    assert single.get_json()["error"] == "Sync already running for this account"
+    assert (data["skipped"], data["results"][0]["status"]) == (1, "skipped")
+    assert not lock.locked()
@@ -0,0 +1,100 @@
+"""API tests for bulk invoice operations endpoint."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from extensions import db
+from models.database import Invoice
+
+
+def _add_invoice(app, name: str) -> int:
+    with app.app_context():
+        invoice = Invoice(name=name, amount=1000, due_date=date(2026, 3, 1), is_recurring=False)
+        db.session.add(invoice)
+        db.session.commit()
+        return invoice.id
+
+
+def test_bulk_applies_mixed_operations(client, app):
+    pay_id = _add_invoice(app, "Pay me")
+    delete_id = _add_invoice(app, "Delete me")
+
+    response = client.post(
+        "/api/invoices/bulk",
+        json={
+            "operations": [
+                {"op": "create", "data": {"name": "New", "amount": 2500, "due_date": "2026-04-01"}},
+                {"op": "pay", "id": pay_id},
+                {"op": "delete", "id": delete_id},
+            ]
+        },
+    )
+    payload = response.get_json()
+
+    assert response.status_code == 200
+    assert payload["data"]["succeeded"] == 3
+    results = payload["data"]["results"]
+    assert all(result["ok"] for result in results)
+    with app.app_context():
+        assert db.session.get(Invoice, results[0]["id"]).name == "New"
+        assert db.session.get(Invoice, pay_id).paid is True
+        assert db.session.get(Invoice, delete_id) is None
+
+
+def test_bulk_reports_per_item_errors(client, app):
+    response = client.post(
+        "/api/invoices/bulk",
+        json={
+            "operations": [
+                {"op": "create", "data": {"name": "Valid", "amount": 10, "due_date": "2026-04-01"}},
+                {"op": "create", "data": {"name": "Bad", "amount": 0, "due_date": "2026-04-01"}},
+                {"op": "pay", "id": 9999},
+                {"op": "archive", "id": 1},
+            ]
+        },
+    )
+    payload = response.get_json()
+    results = payload["data"]["results"]
+
+    assert response.status_code == 200
+    assert results[0]["ok"] is True
+    assert results[1]["error"] == "Amount must be positive"
+    assert results[2]["error"] == "Invoice not found"
+    assert results[3]["error"] == "op must be one of: create, pay, delete"
+    assert payload["data"]["failed"] == 3
+    with app.app_context():
+        assert Invoice.query.count() == 1
+
+
+def test_bulk_rolls_back_everything_on_failure(client, app, monkeypatch):
+    pay_id = _add_invoice(app, "Unchanged")
+
+    def failing_delete(*_args, **_kwargs):
+        raise RuntimeError("forced-failure")
+
+    monkeypatch.setattr("services.invoice_bulk.delete", failing_delete)
+
+    response = client.post(
+        "/api/invoices/bulk",
+        json={
+            "operations": [
+                {"op": "create", "data": {"name": "Rolled back", "amount": 10, "due_date": "2026-04-01"}},
+                {"op": "pay", "id": pay_id},
+                {"op": "delete", "id": pay_id},
+            ]
+        },
+    )
+
+    assert response.status_code == 500
+    assert response.get_json()["error"] == "forced-failure"
+    with app.app_context():
+        assert Invoice.query.count() == 1
+        assert db.session.get(Invoice, pay_id).paid is False
+
+
+def test_bulk_requires_operations_list(client):
+    response = client.post("/api/invoices/bulk", json={"operations": []})
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "operations must be a non-empty list"
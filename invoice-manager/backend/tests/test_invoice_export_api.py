@@ -0,0 +1,72 @@
+"""API tests for streaming invoice export endpoint."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import date
+
+from extensions import db
+from models.database import GmailAccount, Invoice
+
+
+def _seed(app) -> None:
+    with app.app_context():
+        account = GmailAccount(email="export@example.com", is_active=True, credentials_json="{}")
+        db.session.add(account)
+        db.session.flush()
+        db.session.add_all([
+            Invoice(name="Gas", amount=5000, due_date=date(2026, 3, 1), gmail_account_id=account.id, is_recurring=False),
+            Invoice(name="Water", amount=1234.5, due_date=date(2026, 2, 1), paid=True, is_recurring=False),
+        ])
+        db.session.commit()
+
+
+def test_export_csv_streams_all_rows(client, app):
+    _seed(app)
+
+    response = client.get("/api/invoices/export?format=csv", buffered=False)
+    assert response.is_streamed
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert [row["name"] for row in rows] == ["Gas", "Water"]
+    assert rows[0]["gmail_account_email"] == "export@example.com"
+    assert rows[1]["amount"] == "1234.5"
+
+
+def test_export_ndjson_applies_filters(client, app):
+    _seed(app)
+
+    response = client.get("/api/invoices/export?format=ndjson&status=paid")
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert response.mimetype == "application/x-ndjson"
+    assert len(lines) == 1
+    assert lines[0]["name"] == "Water"
+    assert lines[0]["paid"] is True
+    assert lines[0]["due_date"] == "2026-02-01"
+
+
+def test_export_applies_text_search(client, app):
+    _seed(app)
+
+    response = client.get("/api/invoices/export?format=ndjson&q=wat")
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert [line["name"] for line in lines] == ["Water"]
+
+
+def test_export_csv_without_rows_has_header(client):
+    response = client.get("/api/invoices/export")
+
+    assert response.get_data(as_text=True).startswith("id,gmail_account_id,gmail_account_email,name")
+
+
+def test_export_rejects_unknown_format(client):
+    response = client.get("/api/invoices/export?format=xml")
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "format must be csv or ndjson"
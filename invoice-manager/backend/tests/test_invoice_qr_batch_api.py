@@ -0,0 +1,81 @@
+"""API tests for batch QR rendering endpoint."""
+
+from __future__ import annotations
+
+import base64
+import io
+import zipfile
+from datetime import date
+
+from extensions import db
+from models.database import Invoice
+from services.qr_batch import QRJob, iter_qr_zip
+
+IBAN = "HU42117730161111101800000000"
+
+
+def _seed(app) -> tuple[int, int]:
+    with app.app_context():
+        with_iban = Invoice(name="Gas", amount=5000, due_date=date(2026, 3, 1), iban=IBAN, is_recurring=False)
+        without_iban = Invoice(name="Cash", amount=900, due_date=date(2026, 3, 2), is_recurring=False)
+        db.session.add_all([with_iban, without_iban])
+        db.session.commit()
+        return with_iban.id, without_iban.id
+
+
+def test_batch_returns_base64_images_and_per_item_errors(client, app):
+    with_iban, without_iban = _seed(app)
+
+    response = client.post("/api/invoices/qr/batch", json={"ids": [with_iban, without_iban, 9999]})
+    payload = response.get_json()
+    items = {item["id"]: item for item in payload["data"]}
+
+    assert response.status_code == 200
+    assert items[with_iban]["ok"] is True
+    assert base64.b64decode(items[with_iban]["data"]).startswith(b"\x89PNG")
+    assert items[without_iban]["error"] == "No IBAN available for this invoice"
+    assert items[9999]["error"] == "Invoice not found"
+
+
+def test_batch_svg_zip_output(client, app):
+    with_iban, without_iban = _seed(app)
+
+    response = client.post(
+        "/api/invoices/qr/batch",
+        json={"ids": [with_iban, without_iban], "format": "svg", "output": "zip"},
+    )
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(response.data)) as archive:
+        assert archive.namelist() == [f"invoice_{with_iban}_qr.svg"]
+        assert b"<svg" in archive.read(f"invoice_{with_iban}_qr.svg")
+
+
+def test_batch_rejects_unknown_format(client):
+    response = client.post("/api/invoices/qr/batch", json={"ids": [1], "format": "gif"})
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "format must be png or svg"
+
+
+class _SecondFailsCache:
+    calls = 0
+
+    def get_or_render(self, _key, render):
+        self.calls += 1
+        if self.calls == 2:
+            raise ValueError("render failed")
+        return render()
+
+
+def test_zip_stream_yields_one_chunk_per_member_and_skips_failures():
+    jobs = [QRJob(1, IBAN, 100, "Gas"), QRJob(2, IBAN, 200, "Broken"), QRJob(3, IBAN, 300, "Water")]
+
+    chunks = list(iter_qr_zip(jobs, _SecondFailsCache(), kind="svg"))
+
+    assert len(chunks) == 3  # two members, then the central directory
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert archive.namelist() == ["invoice_1_qr.svg", "invoice_3_qr.svg"]
+        assert archive.testzip() is None
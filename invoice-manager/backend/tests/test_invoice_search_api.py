@@ -0,0 +1,80 @@
+"""API tests for full-text invoice search."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from extensions import db
+from models.database import Invoice
+from services.invoice_search import build_match_expression
+
+
+def _seed(app) -> dict[str, int]:
+    with app.app_context():
+        invoices = {
+            "telekom": Invoice(
+                name="Telekom számla",
+                amount=8500,
+                due_date=date(2026, 2, 20),
+                payment_link="https://simplepay.hu/pay/abc123",
+                is_recurring=False,
+            ),
+            "eon": Invoice(
+                name="E.ON villany",
+                amount=12000,
+                due_date=date(2026, 2, 25),
+                sender="E.ON Ügyfélszolgálat <szamla@eon.hu>",
+                is_recurring=False,
+            ),
+            "rent": Invoice(name="Albérlet", amount=150000, due_date=date(2026, 3, 1), is_recurring=False),
+        }
+        db.session.add_all(invoices.values())
+        db.session.commit()
+        return {key: inv.id for key, inv in invoices.items()}
+
+
+def _search_ids(client, query: str) -> list[int]:
+    response = client.get(f"/api/invoices?q={query}")
+    assert response.status_code == 200
+    return [item["id"] for item in response.get_json()["data"]]
+
+
+def test_search_matches_name_prefix_without_diacritics(client, app):
+    ids = _seed(app)
+
+    assert set(_search_ids(client, "szam")) == {ids["telekom"], ids["eon"]}
+    assert _search_ids(client, "telekom szam") == [ids["telekom"]]
+    assert _search_ids(client, "alber") == [ids["rent"]]
+
+
+def test_search_matches_payment_link_and_sender(client, app):
+    ids = _seed(app)
+
+    assert _search_ids(client, "simplepay") == [ids["telekom"]]
+    assert _search_ids(client, "ugyfelszolgalat") == [ids["eon"]]
+
+
+def test_search_index_follows_updates_and_deletes(client, app):
+    ids = _seed(app)
+
+    with app.app_context():
+        invoice = db.session.get(Invoice, ids["rent"])
+        invoice.name = "Lakbér március"
+        db.session.delete(db.session.get(Invoice, ids["telekom"]))
+        db.session.commit()
+
+    assert _search_ids(client, "alber") == []
+    assert _search_ids(client, "lakber") == [ids["rent"]]
+    assert _search_ids(client, "simplepay") == []
+
+
+def test_search_rejects_cursor_combination(client):
+    response = client.get("/api/invoices?q=gas&cursor=")
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "cursor cannot be combined with q"
+
+
+def test_match_expression_strips_fts_syntax():
+    assert build_match_expression('foo" OR bar*') == '"foo"* "OR"* "bar"*'
+    assert build_match_expression("  --  ") is None
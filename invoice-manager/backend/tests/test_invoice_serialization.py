@@ -0,0 +1,53 @@
+"""Query-count tests for batch invoice serialization."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from extensions import db
+from models.database import GmailAccount, Invoice
+
+
+def _seed(app, accounts: int, invoices_per_account: int) -> None:
+    with app.app_context():
+        for account_index in range(accounts):
+            account = GmailAccount(
+                email=f"user{account_index}@example.com",
+                is_active=True,
+                credentials_json="{}",
+            )
+            db.session.add(account)
+            db.session.flush()
+            for index in range(invoices_per_account):
+                db.session.add(
+                    Invoice(
+                        gmail_account_id=account.id,
+                        name=f"Invoice {account_index}-{index}",
+                        amount=1000,
+                        currency="HUF",
+                        due_date=date(2026, 3, 1 + index % 28),
+                        is_recurring=False,
+                    )
+                )
+        db.session.commit()
+
+
+def test_invoice_list_query_count_is_constant(client, app, count_queries):
+    _seed(app, accounts=6, invoices_per_account=5)
+
+    with count_queries() as small:
+        small_response = client.get("/api/invoices?limit=2")
+    with count_queries() as large:
+        large_response = client.get("/api/invoices?limit=30")
+
+    assert len(small_response.get_json()["data"]) == 2
+    assert len(large_response.get_json()["data"]) == 30
+    assert small["count"] == large["count"]
+
+
+def test_invoice_list_includes_account_email(client, app):
+    _seed(app, accounts=1, invoices_per_account=1)
+
+    payload = client.get("/api/invoices").get_json()
+
+    assert payload["data"][0]["gmail_account_email"] == "user0@example.com"
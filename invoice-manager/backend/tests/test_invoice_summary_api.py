@@ -0,0 +1,61 @@
+"""API tests for invoice summary endpoint."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from extensions import db
+from models.database import Invoice
+
+
+def _add_invoice(amount: float, currency: str, due_date: date, paid: bool = False) -> None:
+    db.session.add(
+        Invoice(
+            name="Summary invoice",
+            amount=amount,
+            currency=currency,
+            due_date=due_date,
+            paid=paid,
+            is_recurring=False,
+        )
+    )
+
+
+def test_summary_groups_by_currency_and_month(client, app):
+    with app.app_context():
+        _add_invoice(1000, "HUF", date(2026, 2, 10), paid=True)
+        _add_invoice(2500.5, "HUF", date(2026, 2, 20))
+        _add_invoice(4000, "HUF", date(2026, 3, 5))
+        _add_invoice(12.5, "EUR", date(2026, 3, 1))
+        db.session.commit()
+
+    response = client.get("/api/invoices/summary?as_of=2026-03-01")
+    payload = response.get_json()
+
+    assert response.status_code == 200
+    assert payload["error"] is None
+    by_currency = {item["currency"]: item for item in payload["data"]["by_currency"]}
+    assert by_currency["HUF"]["count"] == 3
+    assert by_currency["HUF"]["total"] == 7500.5
+    assert by_currency["HUF"]["paid_total"] == 1000.0
+    assert by_currency["HUF"]["unpaid_count"] == 2
+    assert by_currency["HUF"]["overdue_count"] == 1
+    assert by_currency["HUF"]["overdue_total"] == 2500.5
+    assert by_currency["EUR"]["overdue_count"] == 0
+
+    months = [(item["currency"], item["month"], item["count"]) for item in payload["data"]["by_month"]]
+    assert months == [("EUR", "2026-03", 1), ("HUF", "2026-02", 2), ("HUF", "2026-03", 1)]
+
+
+def test_summary_empty_database(client):
+    payload = client.get("/api/invoices/summary").get_json()
+
+    assert payload["data"]["by_currency"] == []
+    assert payload["data"]["by_month"] == []
+
+
+def test_summary_rejects_invalid_as_of(client):
+    response = client.get("/api/invoices/summary?as_of=03-01-2026")
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "as_of must be YYYY-MM-DD"
@@ -0,0 +1,80 @@
+"""API tests for keyset (cursor) pagination of invoice listing."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from extensions import db
+from models.database import Invoice
+
+
+def _seed_invoices(app, count: int, paid_every: int = 0) -> None:
+    with app.app_context():
+        for index in range(count):
+            db.session.add(
+                Invoice(
+                    name=f"Invoice {index}",
+                    amount=1000 + index,
+                    currency="HUF",
+                    # Duplicate due dates to exercise the id tiebreaker.
+                    due_date=date(2026, 1, 1 + index // 2),
+                    paid=bool(paid_every) and index % paid_every == 0,
+                    is_recurring=False,
+                )
+            )
+        db.session.commit()
+
+
+def _collect_pages(client, query: str, limit: int) -> tuple[list[int], int]:
+    ids: list[int] = []
+    pages = 0
+    cursor = ""
+    while cursor is not None:
+        response = client.get(f"/api/invoices?{query}&limit={limit}&cursor={cursor}")
+        payload = response.get_json()
+        assert response.status_code == 200
+        ids.extend(item["id"] for item in payload["data"])
+        cursor = payload["next_cursor"]
+        pages += 1
+    return ids, pages
+
+
+def test_cursor_pages_cover_all_rows_in_order(client, app):
+    _seed_invoices(app, 7)
+
+    ids, pages = _collect_pages(client, "status=all", limit=3)
+    offset_payload = client.get("/api/invoices?limit=100").get_json()
+
+    assert pages == 3
+    assert len(ids) == len(set(ids)) == 7
+    assert ids == [item["id"] for item in offset_payload["data"]]
+
+
+def test_cursor_pagination_respects_status_filter(client, app):
+    _seed_invoices(app, 9, paid_every=3)
+
+    ids, _pages = _collect_pages(client, "status=unpaid", limit=2)
+
+    with app.app_context():
+        expected = {inv.id for inv in Invoice.query.filter_by(paid=False).all()}
+    assert set(ids) == expected
+    assert len(ids) == 6
+
+
+def test_last_page_has_no_next_cursor(client, app):
+    _seed_invoices(app, 2)
+
+    response = client.get("/api/invoices?limit=5&cursor=")
+    payload = response.get_json()
+
+    assert len(payload["data"]) == 2
+    assert payload["next_cursor"] is None
+
+
+def test_invalid_cursor_returns_400(client):
+    response = client.get("/api/invoices?cursor=not-a-cursor")
+    payload = response.get_json()
+
+    assert response.status_code == 400
+    assert payload["data"] is None
+    assert payload["error"] == "Invalid cursor"
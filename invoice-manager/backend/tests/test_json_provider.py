@@ -0,0 +1,82 @@
+"""Tests for the fast JSON provider."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+import json_provider
+from extensions import db
+from models.database import Invoice
+from services.invoice_serialization import serialize_invoices
+
+
+@dataclass
+class _Totals:
+    currency: str
+    total: Decimal
+
+
+PAYLOAD = {
+    "amount": Decimal("10990.50"),
+    "due_date": date(2026, 3, 1),
+    "created_at": datetime(2026, 2, 15, 8, 30, 0, 123456),
+    "totals": _Totals("HUF", Decimal("1.25")),
+}
+EXPECTED = {
+    "amount": 10990.5,
+    "due_date": "2026-03-01",
+    "created_at": "2026-02-15T08:30:00.123456",
+    "totals": {"currency": "HUF", "total": 1.25},
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_provider_serializes_decimal_dates_and_dataclasses(app, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_provider, "orjson", None)
+    elif json_provider.orjson is None:
+        pytest.skip("orjson not installed")
+
+    assert json.loads(app.json.dumps(PAYLOAD)) == EXPECTED
+    with app.test_request_context():
+        response = app.json.response({"data": PAYLOAD, "error": None})
+    assert json.loads(response.get_data()) == {"data": EXPECTED, "error": None}
+
+
+def test_provider_serializes_sqlalchemy_rows(app):
+    with app.app_context():
+        db.session.add(Invoice(name="Row", amount=Decimal("12.30"), due_date=date(2026, 1, 2), is_recurring=False))
+        db.session.commit()
+        row = db.session.execute(select(Invoice.name, Invoice.amount, Invoice.due_date)).one()
+
+        assert json.loads(app.json.dumps(row)) == {"name": "Row", "amount": 12.3, "due_date": "2026-01-02"}
+
+
+def test_api_responses_keep_shape(client):
+    response = client.post("/api/invoices", json={"name": "Shape", "amount": 5, "due_date": "2026-03-01"})
+
+    assert response.mimetype == "application/json"
+    assert response.get_json()["data"]["due_date"] == "2026-03-01"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_raw_list_rows_encode_like_to_dict(app, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_provider, "orjson", None)
+    elif json_provider.orjson is None:
+        pytest.skip("orjson not installed")
+    with app.app_context():
+        db.session.add(Invoice(
+            name="Raw", amount=Decimal("1234.50"), due_date=date(2026, 1, 2),
+            paid=True, paid_date=datetime(2026, 1, 3, 9, 15, 0, 250000), is_recurring=False,
+        ))
+        db.session.commit()
+        invoice = Invoice.query.one()
+
+        assert json.loads(app.json.dumps(serialize_invoices([invoice]))) == [invoice.to_dict()]
@@ -0,0 +1,93 @@
+"""Tests for the payment QR cache and cached QR endpoint."""
+
+from __future__ import annotations
+
+import os
+from datetime import date
+
+from extensions import db
+from models.database import Invoice
+from services.qr_cache import QRCache, qr_cache_key
+
+
+def test_lru_evicts_oldest_entries_over_byte_budget():
+    cache = QRCache(max_bytes=10)
+    cache.get_or_render("a", lambda: b"aaaa")
+    cache.get_or_render("b", lambda: b"bbbb")
+    cache.get("a")
+    cache.get_or_render("c", lambda: b"cccc")
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.size_bytes == 8
+
+
+def test_disk_tier_serves_after_memory_is_cleared(tmp_path):
+    cache = QRCache(max_bytes=1024, disk_path=str(tmp_path / "qr"))
+    cache.get_or_render("key", lambda: b"png-bytes")
+    cache.clear_memory()
+
+    def fail_render():
+        raise AssertionError("should not re-render")
+
+    assert cache.get_or_render("key", fail_render) == b"png-bytes"
+
+
+def test_disk_tier_prunes_least_recently_used_files_over_budget(tmp_path):
+    disk_path = tmp_path / "qr"
+    disk_path.mkdir()
+    for age, key in enumerate(["old", "used", "new"]):
+        (disk_path / f"{key}.bin").write_bytes(b"1234")
+        os.utime(disk_path / f"{key}.bin", (1000 + age, 1000 + age))
+    cache = QRCache(max_bytes=1024, disk_path=str(disk_path), disk_max_bytes=10)
+    cache.get("used")  # a disk hit refreshes the file's mtime
+
+    cache.get_or_render("newest", lambda: b"1234")
+
+    assert sorted(path.stem for path in disk_path.iterdir()) == ["newest", "used"]
+    assert cache.disk_size_bytes == 8
+    assert QRCache(max_bytes=1024, disk_path=str(disk_path)).disk_size_bytes == 8
+
+
+def test_cache_key_changes_with_render_inputs():
+    base = qr_cache_key("HU42 1177", 100, "Gas")
+
+    assert base == qr_cache_key("HU421177", 100.0, "Gas")
+    assert base != qr_cache_key("HU421177", 100.01, "Gas")
+    assert base != qr_cache_key("HU421177", 100, "Gas", scale=8)
+
+
+def test_qr_endpoint_caches_and_supports_if_none_match(client, app, monkeypatch):
+    with app.app_context():
+        invoice = Invoice(
+            name="Electricity",
+            amount=10990,
+            due_date=date(2026, 3, 1),
+            iban="HU42117730161111101800000000",
+            is_recurring=False,
+        )
+        db.session.add(invoice)
+        db.session.commit()
+        invoice_id = invoice.id
+
+    renders = []
+
+    def fake_render(**kwargs):
+        renders.append(kwargs)
+        return b"\x89PNG-fake"
+
+    monkeypatch.setattr("api.invoices.generate_payment_qr", fake_render)
+
+    first = client.get(f"/api/invoices/{invoice_id}/qr")
+    second = client.get(f"/api/invoices/{invoice_id}/qr")
+    conditional = client.get(
+        f"/api/invoices/{invoice_id}/qr",
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert first.status_code == 200
+    assert second.data == first.data
+    assert len(renders) == 1
+    assert "max-age=86400" in first.headers["Cache-Control"]
+    assert conditional.status_code == 304
@@ -0,0 +1,91 @@
+"""Tests for compiled recurrence rules and non-monthly recurring templates."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from models.recurrence_rules import compile_rule
+from services.recurring_generator import generate_due_recurring_invoices
+
+START = date(2026, 1, 1)
+
+
+def test_weekly_quarterly_and_yearly_occurrences():
+    weekly = compile_rule("weekly", None, 4, None, "none", START)
+    quarterly = compile_rule("quarterly", 31, None, 2, "none", START)
+    yearly = compile_rule("yearly", 29, None, 2, "none", START)
+
+    assert weekly.occurrences_between(date(2026, 3, 1), date(2026, 3, 21)) == [
+        date(2026, 3, 6), date(2026, 3, 13), date(2026, 3, 20),
+    ]
+    assert quarterly.next_occurrences(START, 4) == [
+        date(2026, 2, 28), date(2026, 5, 31), date(2026, 8, 31), date(2026, 11, 30),
+    ]
+    assert yearly.next_occurrences(START, 3) == [date(2026, 2, 28), date(2027, 2, 28), date(2028, 2, 29)]
+
+
+def test_business_day_adjustment_keeps_periods_apart():
+    # 2026-01-31 and 2026-02-28 are Saturdays.
+    following = compile_rule("monthly", 31, None, None, "following", START)
+    preceding = compile_rule("monthly", 1, None, None, "preceding", START)
+
+    assert following.next_occurrences(START, 2) == [date(2026, 2, 2), date(2026, 3, 2)]
+    assert following.next_due_date(date(2026, 2, 2)) == date(2026, 3, 2)
+    # 2026-08-01 is a Saturday, so the August invoice is due on July 31.
+    assert preceding.occurrences_between(date(2026, 7, 1), date(2026, 9, 1)) == [
+        date(2026, 7, 1), date(2026, 7, 31),
+    ]
+    assert preceding.next_due_date(date(2026, 7, 31)) == date(2026, 9, 1)
+
+
+def test_rules_are_compiled_once_per_schedule():
+    first = compile_rule("weekly", None, 0, None, "none", START)
+
+    assert compile_rule("weekly", None, 0, None, "none", START) is first
+    assert compile_rule("weekly", 15, 0, 7, "none", START) == first
+
+
+def test_weekly_template_via_api_generates_each_week(client, app):
+    created = client.post(
+        "/api/recurring",
+        json={"name": "Cleaner", "amount": 8000, "frequency": "weekly", "day_of_week": 0},
+    )
+    template = created.get_json()["data"]
+
+    assert created.status_code == 201
+    assert template["frequency"] == "weekly"
+    assert template["day_of_month"] is None
+
+    with app.app_context():
+        first_due = date.fromisoformat(template["next_due_date"])
+        stats = generate_due_recurring_invoices(date.fromordinal(first_due.toordinal() + 14))
+
+    assert first_due.weekday() == 0
+    assert stats["generated"] == 3
+
+
+def test_schedule_validation(client):
+    missing_day = client.post("/api/recurring", json={"name": "Tax", "amount": 1, "frequency": "quarterly"})
+    bad_frequency = client.post(
+        "/api/recurring",
+        json={"name": "Tax", "amount": 1, "day_of_month": 1, "frequency": "daily"},
+    )
+
+    assert missing_day.get_json()["error"] == "Day of month is required"
+    assert bad_frequency.status_code == 400
+    assert bad_frequency.get_json()["error"] == "Frequency must be one of weekly, monthly, quarterly, yearly"
+
+
+def test_update_null_anchor_restores_default(client):
+    created = client.post(
+        "/api/recurring",
+        json={"name": "Insurance", "amount": 1, "day_of_month": 1, "frequency": "yearly", "month_of_year": 3},
+    ).get_json()["data"]
+
+    cleared = client.put(f"/api/recurring/{created['id']}", json={"month_of_year": None})
+    bad = client.put(f"/api/recurring/{created['id']}", json={"day_of_week": 9})
+
+    assert created["month_of_year"] == 3
+    assert cleared.status_code == 200
+    assert cleared.get_json()["data"]["month_of_year"] is None
+    assert bad.get_json()["error"] == "Day of week must be between 0 and 6"
@@ -0,0 +1,136 @@
+"""Tests for chunked, resumable recurring generation."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import func
+
+from extensions import db
+from models.database import Invoice, RecurringInvoice
+from models.scheduler_state import RecurringRunState
+from services import recurring_generator
+from services.recurring_generator import generate_due_recurring_invoices
+from services.recurring_scheduler import RECURRING_LEASE_NAME, run_recurring_generation_for_date
+from services.scheduler_lease import LeaseLostError, get_lease, try_acquire_lease
+
+RUN_DATE = date(2026, 12, 31)
+
+
+def _seed_templates(count: int) -> list[int]:
+    templates = [
+        RecurringInvoice(
+            name=f"Template {index}",
+            amount=1000 + index,
+            currency="HUF",
+            day_of_month=10,
+            created_at=datetime(2026, 1, 1),
+        )
+        for index in range(count)
+    ]
+    db.session.add_all(templates)
+    db.session.commit()
+    return [template.id for template in templates]
+
+
+def _generated_count() -> int:
+    return db.session.query(func.count(Invoice.id)).scalar()
+
+
+def test_backfill_is_committed_in_bounded_chunks(app, monkeypatch):
+    with app.app_context():
+        _seed_templates(5)
+        chunk_sizes = []
+        original_insert = recurring_generator._insert_recurring_rows
+
+        def counting_insert(rows):
+            chunk_sizes.append(len(rows))
+            return original_insert(rows)
+
+        monkeypatch.setattr(recurring_generator, "_insert_recurring_rows", counting_insert)
+        stats = generate_due_recurring_invoices(RUN_DATE, chunk_templates=2, chunk_periods=5)
+
+        assert stats["generated"] == 60
+        assert stats["processed_templates"] == 5
+        # Three passes (5 + 5 + 2 months) over three chunks of templates each.
+        assert stats["chunks"] == 9
+        assert max(chunk_sizes) == 2 * 5
+        assert _generated_count() == 60
+        assert db.session.get(RecurringRunState, 1).checkpoint_run_date is None
+
+
+def test_interrupted_backfill_resumes_after_checkpoint(app, monkeypatch):
+    with app.app_context():
+        ids = _seed_templates(4)
+        original_insert = recurring_generator._insert_recurring_rows
+        calls = []
+
+        def failing_insert(rows):
+            calls.append(rows)
+            if len(calls) == 2:
+                raise RuntimeError("disk full")
+            return original_insert(rows)
+
+        monkeypatch.setattr(recurring_generator, "_insert_recurring_rows", failing_insert)
+        with pytest.raises(RuntimeError):
+            generate_due_recurring_invoices(RUN_DATE, chunk_templates=2, chunk_periods=12)
+        db.session.rollback()
+
+        state = db.session.get(RecurringRunState, 1)
+        assert state.to_dict()["checkpoint"] == {"run_date": RUN_DATE.isoformat(), "template_id": ids[1]}
+        assert _generated_count() == 24
+
+        monkeypatch.setattr(recurring_generator, "_insert_recurring_rows", original_insert)
+        stats = generate_due_recurring_invoices(RUN_DATE, chunk_templates=2, chunk_periods=12)
+
+        assert stats["generated"] == 24
+        assert stats["skipped_existing"] == 0
+        assert stats["chunks"] == 1
+        assert _generated_count() == 48
+        assert db.session.get(RecurringRunState, 1).checkpoint_run_date is None
+
+
+def test_checkpoint_of_another_run_date_is_ignored(app):
+    with app.app_context():
+        _seed_templates(2)
+        db.session.add(RecurringRunState(
+            id=1,
+            total_runs=0,
+            checkpoint_run_date=date(2026, 6, 1),
+            checkpoint_template_id=999,
+        ))
+        db.session.commit()
+
+        stats = generate_due_recurring_invoices(RUN_DATE, chunk_templates=10, chunk_periods=12)
+
+        assert stats["generated"] == 24
+        assert stats["chunks"] == 1
+
+
+def test_backfill_stops_when_the_lease_is_taken_over(app, monkeypatch):
+    monkeypatch.setattr("services.recurring_scheduler.process_holder_id", lambda: "worker-a")
+    monkeypatch.setattr(recurring_generator, "chunk_limits", lambda: (2, 12))
+    with app.app_context():
+        ids = _seed_templates(4)
+        assert try_acquire_lease(RECURRING_LEASE_NAME, "worker-a", 60)
+        original_chunk = recurring_generator._generate_chunk
+        calls = []
+
+        def slow_chunk(*args):
+            calls.append(args)
+            if len(calls) == 2:
+                # worker-a outlived its TTL; worker-b took the expired lease over.
+                later = datetime.utcnow() + timedelta(seconds=120)
+                assert try_acquire_lease(RECURRING_LEASE_NAME, "worker-b", 60, now=later)
+            return original_chunk(*args)
+
+        monkeypatch.setattr(recurring_generator, "_generate_chunk", slow_chunk)
+        with pytest.raises(LeaseLostError):
+            run_recurring_generation_for_date(RUN_DATE, lease_ttl_seconds=60)
+
+        state = db.session.get(RecurringRunState, 1)
+        assert state.to_dict()["checkpoint"] == {"run_date": RUN_DATE.isoformat(), "template_id": ids[1]}
+        assert "another worker" in state.last_error
+        assert _generated_count() == 24
+        assert get_lease(RECURRING_LEASE_NAME).holder == "worker-b"
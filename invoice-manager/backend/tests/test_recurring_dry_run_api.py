@@ -0,0 +1,101 @@
+"""API tests for the recurring run-now dry-run preview."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import event
+
+from extensions import db
+from models.database import Invoice, RecurringInvoice
+
+
+def _seed(app) -> tuple[int, int]:
+    with app.app_context():
+        rent = RecurringInvoice(
+            name="Rent", amount=150000, currency="HUF", day_of_month=1, created_at=datetime(2026, 1, 1)
+        )
+        hosting = RecurringInvoice(
+            name="Hosting", amount=20, currency="EUR", day_of_month=15, created_at=datetime(2026, 1, 1)
+        )
+        paused = RecurringInvoice(
+            name="Gym", amount=9000, day_of_month=1, is_active=False, created_at=datetime(2026, 1, 1)
+        )
+        db.session.add_all([rent, hosting, paused])
+        db.session.commit()
+        db.session.add(Invoice(
+            name="Rent", amount=150000, due_date=date(2026, 2, 1), is_recurring=True, recurring_invoice_id=rent.id
+        ))
+        db.session.commit()
+        return rent.id, hosting.id
+
+
+def test_dry_run_reports_per_template_and_total(client, app):
+    rent_id, hosting_id = _seed(app)
+
+    response = client.post("/api/recurring/run-now", json={"run_date": "2026-03-20", "dry_run": True})
+    data = response.get_json()["data"]
+
+    assert response.status_code == 200
+    assert data["dry_run"] is True
+    assert data["result"]["templates"] == [
+        {
+            "recurring_id": rent_id, "name": "Rent", "amount": 150000.0, "currency": "HUF",
+            "count": 2, "total": 300000.0, "first_due_date": "2026-01-01", "last_due_date": "2026-03-01",
+        },
+        {
+            "recurring_id": hosting_id, "name": "Hosting", "amount": 20.0, "currency": "EUR",
+            "count": 3, "total": 60.0, "first_due_date": "2026-01-15", "last_due_date": "2026-03-15",
+        },
+    ]
+    assert data["result"]["total"] == {
+        "invoices": 5,
+        "templates": 2,
+        "skipped_existing": 1,
+        "by_currency": [
+            {"currency": "EUR", "count": 3, "total": 60.0},
+            {"currency": "HUF", "count": 2, "total": 300000.0},
+        ],
+    }
+
+
+def test_dry_run_does_not_write(client, app):
+    _seed(app)
+    statements = []
+
+    with app.app_context():
+        def capture(_conn, _cursor, statement, *_args):
+            statements.append(statement.split(None, 1)[0].upper())
+
+        event.listen(db.engine, "before_cursor_execute", capture)
+        try:
+            client.post("/api/recurring/run-now", json={"run_date": "2026-03-20", "dry_run": True})
+        finally:
+            event.remove(db.engine, "before_cursor_execute", capture)
+
+    status = client.get("/api/recurring/run-status").get_json()["data"]
+
+    assert set(statements) == {"SELECT"}
+    assert status["total_runs"] == 0
+    with app.app_context():
+        assert Invoice.query.count() == 1
+        assert RecurringInvoice.query.filter_by(name="Rent").one().last_generated is None
+
+
+def test_dry_run_matches_a_real_run(client, app):
+    _seed(app)
+
+    preview = client.post("/api/recurring/run-now", json={"run_date": "2026-06-30", "dry_run": True})
+    run = client.post("/api/recurring/run-now", json={"run_date": "2026-06-30"})
+    after = client.post("/api/recurring/run-now", json={"run_date": "2026-06-30", "dry_run": True})
+
+    assert preview.get_json()["data"]["result"]["total"]["invoices"] == 11
+    assert run.get_json()["data"]["result"]["generated"] == 11
+    assert after.get_json()["data"]["result"]["total"]["invoices"] == 0
+
+
+def test_dry_run_must_be_boolean(client):
+    response = client.post("/api/recurring/run-now", json={"dry_run": "yes"})
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "dry_run must be a boolean"
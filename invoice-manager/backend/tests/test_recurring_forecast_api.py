@@ -37,6 +37,40 @@ def test_forecast_returns_next_due_dates(client, app):
     ]
 
 
+def test_weekly_forecast_covers_the_whole_month_window(client, app):
+    with app.app_context():
+        recurring = RecurringInvoice(
+            name="Cleaner",
+            amount=8000,
+            frequency="weekly",
+            day_of_week=0,
+            is_active=True,
+            created_at=datetime(2026, 1, 1),
+        )
+        db.session.add(recurring)
+        db.session.commit()
+        recurring_id = recurring.id
+
+    response = client.get(f"/api/recurring/{recurring_id}/forecast?months=3&from_date=2026-03-01")
+    due_dates = [item["due_date"] for item in response.get_json()["data"]["forecast"]]
+
+    assert len(due_dates) == 13
+    assert (due_dates[0], due_dates[-1]) == ("2026-03-02", "2026-05-25")
+
+
+def test_yearly_forecast_stays_inside_the_month_window(client):
+    created = client.post(
+        "/api/recurring",
+        json={"name": "Insurance", "amount": 1, "frequency": "yearly", "day_of_month": 5, "month_of_year": 10},
+    ).get_json()["data"]
+
+    short = client.get(f"/api/recurring/{created['id']}/forecast?months=3&from_date=2027-01-01")
+    year = client.get(f"/api/recurring/{created['id']}/forecast?months=12&from_date=2027-01-01")
+
+    assert short.get_json()["data"]["forecast"] == []
+    assert [item["due_date"] for item in year.get_json()["data"]["forecast"]] == ["2027-10-05"]
+
+
 def test_forecast_marks_already_generated(client):
     run_date = datetime.now(timezone.utc).date()
     created = client.post(
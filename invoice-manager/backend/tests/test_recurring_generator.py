@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from datetime import date, datetime, timezone
 
+from sqlalchemy import event
+
 from extensions import db
 from models.database import Invoice, RecurringInvoice
 from services.recurring_generator import generate_due_recurring_invoices
@@ -63,7 +65,7 @@ def test_generation_is_idempotent(app):
 
         assert first["generated"] == 1
         assert second["generated"] == 0
-        assert second["skipped_not_due"] >= 1
+        assert second["processed_templates"] == 0  # idle run: nothing due, nothing counted
         assert count == 1
 
 
@@ -76,12 +78,13 @@ def test_paused_template_is_ignored(app):
             is_active=False,
             created_at=datetime(2026, 2, 1, tzinfo=timezone.utc),
         )
+        _create_template("Active", 1000, 1, datetime(2026, 2, 1, tzinfo=timezone.utc))
 
         stats = generate_due_recurring_invoices(date(2026, 2, 1))
         count = Invoice.query.filter_by(recurring_invoice_id=template.id).count()
 
-        assert stats["generated"] == 0
-        assert stats["skipped_paused"] >= 1
+        assert stats["generated"] == 1
+        assert stats["skipped_paused"] == 1
         assert count == 0
 
 
@@ -121,3 +124,106 @@ def test_catch_up_generates_missing_months(app):
 
         assert stats["generated"] == 2
         assert due_dates == [date(2026, 2, 15), date(2026, 3, 15)]
+
+
+def test_existing_invoice_is_skipped_without_duplicates(app):
+    with app.app_context():
+        template = _create_template(
+            name="Pre-existing",
+            amount=1000,
+            day_of_month=1,
+            created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+        db.session.add(Invoice(
+            name="Pre-existing",
+            amount=1000,
+            due_date=date(2026, 2, 1),
+            is_recurring=True,
+            recurring_invoice_id=template.id,
+        ))
+        db.session.commit()
+
+        stats = generate_due_recurring_invoices(date(2026, 3, 1))
+        count = Invoice.query.filter_by(recurring_invoice_id=template.id).count()
+
+        assert stats["generated"] == 2
+        assert stats["skipped_existing"] == 1
+        assert count == 3
+        assert template.last_generated == date(2026, 3, 1)
+
+
+def test_unique_index_absorbs_rows_missed_by_prefetch(app, monkeypatch):
+    with app.app_context():
+        template = _create_template(
+            name="Racing writer",
+            amount=1000,
+            day_of_month=1,
+            created_at=datetime(2026, 2, 1, tzinfo=timezone.utc),
+        )
+        db.session.add(Invoice(
+            name="Racing writer",
+            amount=1000,
+            due_date=date(2026, 2, 1),
+            is_recurring=True,
+            recurring_invoice_id=template.id,
+        ))
+        db.session.commit()
+        monkeypatch.setattr("services.recurring_generator.existing_recurring_pairs", lambda *_args: set())
+
+        stats = generate_due_recurring_invoices(date(2026, 2, 1))
+        count = Invoice.query.filter_by(recurring_invoice_id=template.id).count()
+
+        assert stats["generated"] == 0
+        assert stats["skipped_existing"] == 1
+        assert count == 1
+
+
+def test_next_due_date_tracks_generation_and_updates(app):
+    with app.app_context():
+        template = _create_template(
+            name="Next due",
+            amount=1000,
+            day_of_month=20,
+            created_at=datetime(2026, 1, 25, tzinfo=timezone.utc),
+        )
+        assert template.next_due_date == date(2026, 2, 20)
+
+        generate_due_recurring_invoices(date(2026, 3, 1))
+        assert template.next_due_date == date(2026, 3, 20)
+
+        template.day_of_month = 31
+        db.session.commit()
+        assert template.next_due_date == date(2026, 3, 31)
+
+
+def test_run_only_loads_due_active_templates(app):
+    with app.app_context():
+        due_id = _create_template("Due", 1000, 1, datetime(2026, 2, 1, tzinfo=timezone.utc)).id
+        _create_template("Later", 1000, 28, datetime(2026, 2, 1, tzinfo=timezone.utc))
+        _create_template("Paused", 1000, 1, datetime(2026, 2, 1, tzinfo=timezone.utc), is_active=False)
+        db.session.expunge_all()
+        loaded = []
+        record = lambda target, _context: loaded.append(target.name)  # noqa: E731
+        event.listen(RecurringInvoice, "load", record)
+        try:
+            stats = generate_due_recurring_invoices(date(2026, 2, 10))
+        finally:
+            event.remove(RecurringInvoice, "load", record)
+
+        assert loaded == ["Due"]
+        assert stats["generated"] == 1
+        assert Invoice.query.filter_by(recurring_invoice_id=due_id).count() == 1
+        assert (stats["skipped_paused"], stats["skipped_not_due"], stats["processed_templates"]) == (1, 1, 3)
+
+
+def test_idle_run_is_a_single_probe(app, count_queries):
+    with app.app_context():
+        _create_template("Later", 1000, 28, datetime(2026, 2, 1, tzinfo=timezone.utc))
+        _create_template("Paused", 1000, 1, datetime(2026, 2, 1, tzinfo=timezone.utc), is_active=False)
+
+        with count_queries() as counter:
+            stats = generate_due_recurring_invoices(date(2026, 2, 10))
+
+        assert counter["count"] == 1
+        assert (stats["generated"], stats["skipped_paused"], stats["skipped_not_due"]) == (0, 0, 0)
+        assert set(stats["timings_ms"]) == {"template_scan"}
@@ -0,0 +1,89 @@
+"""API tests for the portfolio-wide recurring forecast endpoint."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from extensions import db
+from models.database import Invoice, RecurringInvoice
+
+
+def _template(name: str, amount: float, day: int, currency: str = "HUF", is_active: bool = True) -> RecurringInvoice:
+    template = RecurringInvoice(
+        name=name,
+        amount=amount,
+        currency=currency,
+        day_of_month=day,
+        is_active=is_active,
+        created_at=datetime(2026, 1, 1),
+    )
+    db.session.add(template)
+    return template
+
+
+def _seed(app) -> dict[str, int]:
+    with app.app_context():
+        templates = {
+            "rent": _template("Rent", 150000, 1),
+            "phone": _template("Phone", 8500, 20),
+            "cloud": _template("Cloud", 9.99, 31, currency="EUR"),
+            "paused": _template("Paused", 1000, 5, is_active=False),
+        }
+        db.session.flush()
+        db.session.add(Invoice(
+            name="Rent",
+            amount=150000,
+            due_date=date(2026, 3, 1),
+            is_recurring=True,
+            recurring_invoice_id=templates["rent"].id,
+        ))
+        db.session.commit()
+        return {key: template.id for key, template in templates.items()}
+
+
+def test_forecast_covers_all_active_templates(client, app):
+    ids = _seed(app)
+
+    data = client.get("/api/recurring/forecast?months=3&from_date=2026-02-15").get_json()["data"]
+    templates = {item["recurring_id"]: item for item in data["templates"]}
+
+    assert data["until"] == "2026-05-15"
+    assert ids["paused"] not in templates
+    assert [f["due_date"] for f in templates[ids["rent"]]["forecast"]] == ["2026-03-01", "2026-04-01", "2026-05-01"]
+    assert templates[ids["rent"]]["forecast"][0]["already_generated"] is True
+    assert [f["due_date"] for f in templates[ids["phone"]]["forecast"]] == ["2026-02-20", "2026-03-20", "2026-04-20"]
+    assert [f["due_date"] for f in templates[ids["cloud"]]["forecast"]] == ["2026-02-28", "2026-03-31", "2026-04-30"]
+
+
+def test_forecast_totals_per_month_and_currency(client, app):
+    _seed(app)
+
+    data = client.get("/api/recurring/forecast?months=3&from_date=2026-02-15").get_json()["data"]
+    march_huf = next(row for row in data["by_month"] if (row["month"], row["currency"]) == ("2026-03", "HUF"))
+
+    assert march_huf == {"month": "2026-03", "currency": "HUF", "count": 2, "total": 158500.0, "already_generated": 1}
+    assert data["by_currency"] == [
+        {"currency": "EUR", "count": 3, "total": 29.97},
+        {"currency": "HUF", "count": 6, "total": 475500.0},
+    ]
+
+
+def test_forecast_query_count_is_constant(client, app, count_queries):
+    _seed(app)
+    with app.app_context():
+        for index in range(20):
+            _template(f"Extra {index}", 100, 1 + index)
+        db.session.commit()
+
+    with count_queries() as counter:
+        response = client.get("/api/recurring/forecast?months=12&from_date=2026-02-01")
+
+    assert response.status_code == 200
+    assert counter["count"] == 2
+
+
+def test_forecast_validates_months(client):
+    response = client.get("/api/recurring/forecast?months=25")
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "months must be between 1 and 24"
@@ -62,7 +62,7 @@ def test_run_status_returns_last_run_details(client):
 
 
 def test_run_now_returns_500_when_generation_fails(client, monkeypatch):
-    def fake_run(_run_date):
+    def fake_run(_run_date, **_kwargs):
         raise RuntimeError("forced-failure")
 
     monkeypatch.setattr("api.recurring.run_recurring_generation_for_date", fake_run)
@@ -0,0 +1,73 @@
+"""API tests for persistent recurring run history."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from extensions import db
+from models.scheduler_state import RecurringRun
+
+
+def _add_run(started_at: datetime, duration_ms: float, status: str = "success") -> None:
+    db.session.add(RecurringRun(
+        run_date=started_at.date(),
+        started_at=started_at,
+        finished_at=started_at + timedelta(milliseconds=duration_ms),
+        duration_ms=duration_ms,
+        status=status,
+        insert_ms=duration_ms / 2,
+    ))
+
+
+def test_run_now_records_history_with_phase_timings(client):
+    run_date = datetime.now(timezone.utc).date()
+    client.post("/api/recurring", json={"name": "Internet", "amount": 6990, "day_of_month": run_date.day})
+    client.post("/api/recurring/run-now", json={"run_date": run_date.isoformat()})
+
+    payload = client.get("/api/recurring/runs").get_json()["data"]
+    run = payload["runs"][0]
+
+    assert payload["summary"]["runs"] == 1
+    assert run["status"] == "success"
+    assert run["run_date"] == run_date.isoformat()
+    assert run["generated"] == 1
+    assert set(run["timings_ms"]) == {"template_scan", "existence_check", "insert", "commit"}
+    assert all(value is not None and value >= 0 for value in run["timings_ms"].values())
+
+
+def test_failed_run_is_recorded(client, monkeypatch):
+    def fail(_run_date, **_kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("services.recurring_scheduler.generate_due_recurring_invoices", fail)
+    client.post("/api/recurring/run-now", json={"run_date": "2026-02-05"})
+
+    payload = client.get("/api/recurring/runs").get_json()["data"]
+
+    assert payload["summary"]["errors"] == 1
+    assert payload["runs"][0]["error"] == "boom"
+    assert payload["runs"][0]["timings_ms"]["insert"] is None
+
+
+def test_summary_percentiles_cover_only_the_window(client, app):
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    with app.app_context():
+        for index, duration in enumerate([10, 20, 30, 40, 1000]):
+            _add_run(now - timedelta(hours=index + 1), duration)
+        _add_run(now - timedelta(days=30), 99999, status="error")
+        db.session.commit()
+
+    payload = client.get("/api/recurring/runs?days=7&limit=2").get_json()["data"]
+
+    assert payload["summary"]["runs"] == 5
+    assert payload["summary"]["errors"] == 0
+    assert payload["summary"]["duration_ms"] == {"p50": 30, "p95": 1000, "max": 1000}
+    assert payload["summary"]["phases_ms"]["insert"]["p50"] == 15
+    assert [run["duration_ms"] for run in payload["runs"]] == [10, 20]
+
+
+def test_runs_validates_window(client):
+    response = client.get("/api/recurring/runs?days=0")
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "days must be between 1 and 365"
@@ -0,0 +1,74 @@
+"""Tests for the DB-backed recurring scheduler lease and shared run state."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from extensions import db
+from models.scheduler_state import RecurringRunState
+from services.recurring_scheduler import RECURRING_LEASE_NAME, RecurringScheduler
+from services.scheduler_lease import release_lease, try_acquire_lease
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def test_lease_is_exclusive_until_it_expires(app):
+    with app.app_context():
+        assert try_acquire_lease("job", "worker-a", 60, now=NOW) is True
+        assert try_acquire_lease("job", "worker-b", 60, now=NOW + timedelta(seconds=30)) is False
+        assert try_acquire_lease("job", "worker-a", 60, now=NOW + timedelta(seconds=50)) is True
+        assert try_acquire_lease("job", "worker-b", 60, now=NOW + timedelta(seconds=100)) is False
+        assert try_acquire_lease("job", "worker-b", 60, now=NOW + timedelta(seconds=111)) is True
+
+
+def test_release_allows_immediate_failover(app):
+    with app.app_context():
+        assert try_acquire_lease("job", "worker-a", 600) is True
+        release_lease("job", "worker-b")
+        assert try_acquire_lease("job", "worker-b", 600) is False
+
+        release_lease("job", "worker-a")
+        assert try_acquire_lease("job", "worker-b", 600) is True
+
+
+def test_only_lease_holder_generates_on_tick(app, monkeypatch):
+    holder = {"id": "worker-a"}
+    monkeypatch.setattr("services.recurring_scheduler.process_holder_id", lambda: holder["id"])
+    scheduler = RecurringScheduler(app, interval_seconds=300)
+
+    with app.app_context():
+        scheduler._tick()
+        holder["id"] = "worker-b"
+        scheduler._tick()
+        state = db.session.get(RecurringRunState, 1)
+
+        assert state.total_runs == 1
+        assert state.last_holder == "worker-a"
+
+
+def test_run_now_conflicts_with_other_leader_and_status_is_shared(client, app):
+    with app.app_context():
+        try_acquire_lease(RECURRING_LEASE_NAME, "other-worker", 600)
+
+    blocked = client.post("/api/recurring/run-now", json={"run_date": "2026-02-05"})
+    status = client.get("/api/recurring/run-status").get_json()["data"]
+
+    assert blocked.status_code == 409
+    assert blocked.get_json()["error"] == "Recurring generation is running in another worker"
+    assert status["lease_holder"] == "other-worker"
+    assert status["lease_held_by_this_worker"] is False
+    assert status["total_runs"] == 0
+
+
+def test_run_now_renews_the_lease_on_every_commit(client, app, monkeypatch):
+    renewals = []
+
+    def generate(_run_date, renew_lease=None, **_kwargs):
+        renewals.append(renew_lease())
+        return {}
+
+    monkeypatch.setattr("services.recurring_scheduler.generate_due_recurring_invoices", generate)
+    response = client.post("/api/recurring/run-now", json={"run_date": "2026-02-05"})
+
+    assert response.status_code == 200
+    assert renewals == [True]
@@ -0,0 +1,39 @@
+"""Tests for SQLite connection tuning profile."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from sqlite_profile import apply_sqlite_profile, build_sqlite_pragmas
+
+
+def _pragma(engine, name: str):
+    with engine.connect() as connection:
+        return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_profile_is_applied_to_every_connection(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tuned.db'}")
+    installed = apply_sqlite_profile(engine, {"SQLITE_BUSY_TIMEOUT_MS": 7000, "SQLITE_CACHE_SIZE": -2000})
+
+    assert installed is True
+    assert _pragma(engine, "journal_mode") == "wal"
+    assert _pragma(engine, "synchronous") == 1  # NORMAL
+    assert _pragma(engine, "busy_timeout") == 7000
+    assert _pragma(engine, "cache_size") == -2000
+    assert _pragma(engine, "temp_store") == 2  # MEMORY
+    engine.dispose()
+
+
+def test_profile_can_be_disabled(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'plain.db'}")
+
+    assert apply_sqlite_profile(engine, {"SQLITE_TUNING_ENABLED": False}) is False
+    assert _pragma(engine, "journal_mode") == "delete"
+    engine.dispose()
+
+
+def test_invalid_pragma_values_are_rejected():
+    with pytest.raises(ValueError, match="SQLITE_JOURNAL_MODE"):
+        build_sqlite_pragmas({"SQLITE_JOURNAL_MODE": "wal; DROP TABLE invoices"})
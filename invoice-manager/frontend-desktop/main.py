@@ -23,6 +23,7 @@ from services.api import (
     update_account_filters,
     update_recurring,
 )
+from ui.gmail_toolbar import build_gmail_toolbar
 from ui.gmail_view import build_gmail_account_card
 from ui.invoice_dialogs import open_add_invoice_dialog, show_invoice_delete_dialog
 from ui.invoice_view import build_invoice_card
@@ -440,15 +441,8 @@ def main(page: ft.Page):
         ref=recurring_toolbar_ref,
         visible=False,
     )
-    gmail_toolbar = ft.Row(
-        [
-            ft.ElevatedButton("+ Uj Gmail fiok", on_click=open_add_gmail_dialog),
-            ft.Text("Csak szamlas/fizetesi linkes levelek szurese", size=12, color=ft.colors.GREY_700),
-        ],
-        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-        wrap=True,
-        ref=gmail_toolbar_ref,
-        visible=False,
+    gmail_toolbar = build_gmail_toolbar(
+        open_add_gmail_dialog, gmail_sync_summaries, load_gmail, show_error, gmail_toolbar_ref
     )
 
     page.add(
@@ -5,6 +5,9 @@ import requests
 
 API_BASE = "http://localhost:5000/api"
 
+# url -> (etag, data) for list endpoints supporting If-None-Match.
+_etag_cache: dict[str, tuple[str, object]] = {}
+
 
 def _handle_response(response: requests.Response):
     """Handle API response, raise on error."""
@@ -16,6 +19,22 @@ def _handle_response(response: requests.Response):
     return response
 
 
+def _get_cached(url: str, params: dict | None = None, timeout: int = 5):
+    """GET a list endpoint, reusing the cached payload on 304 Not Modified."""
+    cache_key = requests.Request("GET", url, params=params).prepare().url
+    cached = _etag_cache.get(cache_key)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+    response = requests.get(url, params=params, headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached:
+        return cached[1]
+    response.raise_for_status()
+    data = _handle_response(response)
+    etag = response.headers.get("ETag")
+    if etag:
+        _etag_cache[cache_key] = (etag, data)
+    return data
+
+
 def get_health():
     """Check backend health."""
     response = requests.get("http://localhost:5000/health", timeout=2)
@@ -24,9 +43,7 @@ def get_health():
 
 def get_invoices(status="all"):
     """Fetch invoices with status filter (unpaid, paid, all)."""
-    response = requests.get(f"{API_BASE}/invoices", params={"status": status}, timeout=5)
-    response.raise_for_status()
-    return _handle_response(response)
+    return _get_cached(f"{API_BASE}/invoices", params={"status": status})
 
 
 def create_invoice(data: dict):
@@ -62,9 +79,7 @@ def get_qr_url(invoice_id: int) -> str:
 
 def get_recurring():
     """Fetch all recurring invoice templates."""
-    response = requests.get(f"{API_BASE}/recurring", timeout=5)
-    response.raise_for_status()
-    return _handle_response(response)
+    return _get_cached(f"{API_BASE}/recurring")
 
 
 def create_recurring(data: dict):
@@ -107,9 +122,7 @@ def pause_recurring(recurring_id: int):
 
 def get_accounts():
     """Fetch Gmail account settings."""
-    response = requests.get(f"{API_BASE}/accounts", timeout=10)
-    response.raise_for_status()
-    return _handle_response(response)
+    return _get_cached(f"{API_BASE}/accounts", timeout=10)
 
 
 def get_account_defaults():
@@ -167,3 +180,15 @@ def sync_account(account_id: int, max_results: int = 50, import_invoices: bool =
     )
     response.raise_for_status()
     return _handle_response(response)
+
+
+def sync_all_accounts(max_results: int = 50):
+    """Run Gmail sync for every active account in parallel on the backend."""
+    response = requests.post(
+        f"{API_BASE}/accounts/sync-all",
+        json={"max_results": max_results},
+        headers={"Content-Type": "application/json"},
+        timeout=180,
+    )
+    response.raise_for_status()
+    return _handle_response(response)
@@ -0,0 +1,41 @@
+"""Toolbar of the Gmail accounts view."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import flet as ft
+
+from services.api import sync_all_accounts
+
+
+def build_gmail_toolbar(
+    on_add_account: Callable,
+    sync_summaries: dict[int, dict],
+    on_synced: Callable[[], None],
+    show_error: Callable[[str], None],
+    ref: ft.Ref,
+) -> ft.Row:
+    """Build the add-account / sync-all toolbar (hidden until the view is shown)."""
+
+    def sync_all(_e):
+        try:
+            report = sync_all_accounts(max_results=50)
+            for item in report.get("results", []):
+                if item.get("result"):
+                    sync_summaries[item["account_id"]] = item["result"]
+            on_synced()
+        except Exception as exc:
+            show_error(str(exc))
+
+    return ft.Row(
+        [
+            ft.ElevatedButton("+ Uj Gmail fiok", on_click=on_add_account),
+            ft.OutlinedButton("Osszes szinkronizalasa", on_click=sync_all),
+            ft.Text("Csak szamlas/fizetesi linkes levelek szurese", size=12, color=ft.colors.GREY_700),
+        ],
+        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+        wrap=True,
+        ref=ref,
+        visible=False,
+    )